@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
 from .models import Usuario, Papel
+from .cache_permissoes import invalidar_permissoes_papeis, invalidar_permissoes_usuario
 
 # ============ Usuario ============ #
 
@@ -65,6 +66,10 @@ class UsuarioAdmin(BaseUserAdmin):
         }),
     )
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        invalidar_permissoes_usuario(form.instance)
+
 
 # ============ Papel ============ #
 
@@ -92,6 +97,10 @@ class PapelAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        invalidar_permissoes_papeis()
+
     def get_permissoes_count(self, obj):
         return obj.permissoes.count()
     get_permissoes_count.short_description = 'Qtd. Permissões'
\ No newline at end of file
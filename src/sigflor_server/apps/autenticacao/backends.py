@@ -1,10 +1,16 @@
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth.models import Permission
 
+from .cache_permissoes import obter_permissoes
+
 class RbacBackend(ModelBackend):
     """
     Backend de autenticação customizado que ensina o Django a olhar
     as permissões dentro da entidade 'Papel' customizada.
+
+    O conjunto final de permissões é guardado no cache versionado
+    (ver `cache_permissoes`), então requisições em regime estável não
+    consultam o banco para resolver permissões.
     """
 
     def _get_group_permissions(self, user_obj):
@@ -28,9 +34,12 @@ class RbacBackend(ModelBackend):
             return set()
             
         if not hasattr(user_obj, '_all_permissions_cache'):
-            user_obj._all_permissions_cache = {
-                *self.get_user_permissions(user_obj),
-                *self._get_group_permissions(user_obj),
-            }
+            user_obj._all_permissions_cache = obter_permissoes(
+                user_obj,
+                lambda: {
+                    *self.get_user_permissions(user_obj),
+                    *self._get_group_permissions(user_obj),
+                }
+            )
         
         return user_obj._all_permissions_cache
\ No newline at end of file
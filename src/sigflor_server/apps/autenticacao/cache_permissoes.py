@@ -0,0 +1,77 @@
+"""
+Cache versionado das permissões resolvidas por usuário (RBAC).
+
+O conjunto de permissões de cada usuário fica no cache configurado em
+`RBAC_PERMISSOES_CACHE` (padrão: 'default'), sob uma chave que inclui duas
+versões:
+  - a versão global, incrementada quando papéis ou suas permissões mudam;
+  - a versão do usuário, incrementada quando seus papéis, permissões diretas
+    ou flags de acesso mudam.
+
+Incrementar uma versão torna as chaves antigas inalcançáveis, então um
+conjunto desatualizado nunca é servido. Os incrementos acontecem apenas após
+o commit da transação, para que nenhuma requisição concorrente carregue os
+dados antigos sob a versão nova.
+
+Em produção com vários processos, o alias deve apontar para um cache
+compartilhado (Redis, Memcached ou DatabaseCache); com o LocMemCache padrão
+o cache vale apenas para o processo atual.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+CHAVE_VERSAO_GLOBAL = 'rbac:permissoes:versao'
+CHAVE_VERSAO_USUARIO = 'rbac:permissoes:versao:{usuario_id}'
+CHAVE_PERMISSOES = 'rbac:permissoes:{usuario_id}:{versao_global}:{versao_usuario}'
+
+# Chaves de versões antigas expiram sozinhas depois deste período.
+PERMISSOES_TIMEOUT = 60 * 60 * 24
+
+
+def _cache():
+    return caches[getattr(settings, 'RBAC_PERMISSOES_CACHE', 'default')]
+
+
+def _incrementar(chave: str) -> None:
+    cache = _cache()
+    cache.add(chave, 0, timeout=None)
+    try:
+        cache.incr(chave)
+    except ValueError:
+        # A chave foi removida entre o add e o incr (ex: eviction do LRU)
+        cache.set(chave, 1, timeout=None)
+
+
+def obter_permissoes(usuario, carregar) -> set:
+    """
+    Retorna o conjunto de permissões do usuário a partir do cache,
+    chamando `carregar()` apenas quando a versão atual ainda não foi resolvida.
+    """
+    cache = _cache()
+    chave_usuario = CHAVE_VERSAO_USUARIO.format(usuario_id=usuario.pk)
+    versoes = cache.get_many([CHAVE_VERSAO_GLOBAL, chave_usuario])
+
+    chave = CHAVE_PERMISSOES.format(
+        usuario_id=usuario.pk,
+        versao_global=versoes.get(CHAVE_VERSAO_GLOBAL, 0),
+        versao_usuario=versoes.get(chave_usuario, 0),
+    )
+
+    permissoes = cache.get(chave)
+    if permissoes is None:
+        permissoes = set(carregar())
+        cache.set(chave, permissoes, timeout=PERMISSOES_TIMEOUT)
+    return permissoes
+
+
+def invalidar_permissoes_papeis() -> None:
+    """Invalida o cache de todos os usuários (mudança em papéis/permissões de papel)."""
+    transaction.on_commit(lambda: _incrementar(CHAVE_VERSAO_GLOBAL))
+
+
+def invalidar_permissoes_usuario(usuario) -> None:
+    """Invalida o cache de um único usuário."""
+    chave = CHAVE_VERSAO_USUARIO.format(usuario_id=usuario.pk)
+    transaction.on_commit(lambda: _incrementar(chave))
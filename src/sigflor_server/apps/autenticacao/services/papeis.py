@@ -2,6 +2,7 @@ from typing import Optional
 from django.db import transaction
 
 from ..models import Papel, Usuario
+from ..cache_permissoes import invalidar_permissoes_papeis
 
 class PapelService:
 
@@ -20,6 +21,7 @@ class PapelService:
         papel.save()
         if permissoes:
             papel.permissoes.set(permissoes)
+            invalidar_permissoes_papeis()
         return papel
 
     @staticmethod
@@ -41,6 +43,7 @@ class PapelService:
     @transaction.atomic
     def delete(user: Usuario , papel: Papel) -> None:
         papel.delete(user=user)
+        invalidar_permissoes_papeis()
 
     @staticmethod
     @transaction.atomic
@@ -48,10 +51,12 @@ class PapelService:
         papel.permissoes.add(*permissoes)
         papel.updated_by = user
         papel.save()
+        invalidar_permissoes_papeis()
 
     @staticmethod
     @transaction.atomic
     def remover_permissoes(*, user: Usuario, papel: Papel, permissoes: list) -> None:
         papel.permissoes.remove(*permissoes)
         papel.updated_by = user
-        papel.save()
\ No newline at end of file
+        papel.save()
+        invalidar_permissoes_papeis()
\ No newline at end of file
@@ -1,5 +1,6 @@
 from django.db import transaction
 from apps.autenticacao.models import Usuario
+from ..cache_permissoes import invalidar_permissoes_usuario
 
 class UsuarioService:
 
@@ -59,6 +60,9 @@ class UsuarioService:
         if lista_permissoes is not None:
             usuario_para_editar.user_permissions.set(lista_permissoes)
 
+        # Papéis, permissões diretas ou flags (is_superuser/is_active) podem ter mudado
+        invalidar_permissoes_usuario(usuario_para_editar)
+
         return usuario_para_editar
 
     @staticmethod
@@ -4,3 +4,15 @@ from django.apps import AppConfig
 class ComumConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.comum'
+
+    def ready(self):
+        from django.conf import settings
+
+        from .registro_enums import carregar_registro
+
+        # Todos os models (e seus enums) já foram importados neste ponto
+        carregar_registro()
+
+        if getattr(settings, 'METRICAS_HABILITADAS', True):
+            from . import metricas
+            metricas.instalar()
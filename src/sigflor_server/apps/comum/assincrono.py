@@ -0,0 +1,44 @@
+"""
+Execução concorrente das consultas independentes dos painéis.
+
+O ORM assíncrono do Django encaminha todas as consultas de uma requisição
+para a mesma thread (`thread_sensitive=True`), e um `asyncio.gather` sobre
+elas continua rodando uma consulta por vez. `em_paralelo` roda cada consulta
+numa thread do executor padrão (`thread_sensitive=False`), cada uma com a
+sua própria conexão, fechada ao fim da consulta: o painel leva o tempo da
+consulta mais lenta, e não a soma delas.
+
+Os selectors de painel descrevem as consultas como um dict
+`{nome: callable}` e usam `em_sequencia` (versão síncrona) ou `em_paralelo`
+(versão `_async`) para executá-las. Como cada consulta usa outra conexão,
+ela não enxerga dados ainda não commitados pela requisição; use apenas para
+leituras.
+"""
+
+import asyncio
+from typing import Callable
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+
+
+def em_sequencia(consultas: dict[str, Callable]) -> dict:
+    return {nome: consulta() for nome, consulta in consultas.items()}
+
+
+async def em_paralelo(consultas: dict[str, Callable]) -> dict:
+    resultados = await asyncio.gather(*(
+        sync_to_async(_em_conexao_propria(consulta), thread_sensitive=False)()
+        for consulta in consultas.values()
+    ))
+    return dict(zip(consultas, resultados))
+
+
+def _em_conexao_propria(consulta: Callable) -> Callable:
+    def executar():
+        try:
+            return consulta()
+        finally:
+            # As threads do executor são reaproveitadas; a conexão não deve sobreviver a elas
+            connections.close_all()
+    return executar
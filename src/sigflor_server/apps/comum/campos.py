@@ -0,0 +1,106 @@
+"""
+Sparse fieldsets: `?fields=id,nome,matricula` nas listagens.
+
+Os campos pedidos são validados contra os campos do serializer da listagem e
+viram duas reduções:
+
+1. Serializer: uma subclasse com `Meta.fields` reduzido (os campos declarados
+   que ficaram de fora são removidos com `None`). As subclasses ficam em cache
+   por (serializer, campos).
+2. Queryset: `.only()` com as colunas necessárias e `select_related` apenas
+   das relações que elas atravessam.
+
+Campos que não são colunas do model (propriedades, `source=` de métodos)
+declaram as colunas de que dependem em `Meta.campos_orm`:
+
+    class Meta:
+        campos_orm = {
+            'nome': ['pessoa_fisica__nome_completo'],
+            'status_display': ['status'],
+        }
+
+Se algum campo pedido não puder ser traduzido em colunas, o queryset segue
+inteiro (apenas o serializer é reduzido): a resposta continua correta.
+"""
+
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+
+CAMPOS_QUERY_PARAM = 'fields'
+
+
+def campos_solicitados(request, serializer_class) -> tuple | None:
+    """Lê e valida `?fields=`. Retorna None quando o parâmetro não foi enviado."""
+    valor = request.query_params.get(CAMPOS_QUERY_PARAM)
+    if not valor:
+        return None
+
+    disponiveis = list(serializer_class.Meta.fields)
+    campos = []
+    for campo in (c.strip() for c in valor.split(',')):
+        if campo and campo not in campos:
+            campos.append(campo)
+
+    invalidos = [c for c in campos if c not in disponiveis]
+    if invalidos:
+        raise ValidationError({
+            CAMPOS_QUERY_PARAM: [
+                f"Campos inválidos: {', '.join(invalidos)}. "
+                f"Disponíveis: {', '.join(disponiveis)}."
+            ]
+        })
+
+    if 'id' in disponiveis and 'id' not in campos:
+        campos.insert(0, 'id')
+    return tuple(campos)
+
+
+@lru_cache(maxsize=256)
+def serializer_esparso(serializer_class, campos: tuple):
+    """Subclasse de `serializer_class` que renderiza apenas `campos`."""
+    removidos = {
+        nome: None
+        for nome in serializer_class._declared_fields
+        if nome not in campos
+    }
+    meta = type('Meta', (serializer_class.Meta,), {'fields': list(campos)})
+    return type(f'{serializer_class.__name__}Esparso', (serializer_class,), {'Meta': meta, **removidos})
+
+
+def projetar_queryset(queryset: QuerySet, serializer_class, campos: tuple) -> QuerySet:
+    """Aplica `.only()` e reduz o `select_related` às relações usadas pelos campos."""
+    caminhos = _caminhos_orm(queryset.model, serializer_class, campos)
+    if caminhos is None:
+        return queryset
+
+    relacoes = set()
+    for caminho in caminhos:
+        partes = caminho.split('__')
+        for i in range(1, len(partes)):
+            relacoes.add('__'.join(partes[:i]))
+
+    # As próprias FKs atravessadas entram no only() para que o select_related seja permitido
+    queryset = queryset.select_related(None).only(*caminhos, *relacoes)
+    if relacoes:
+        queryset = queryset.select_related(*sorted(relacoes))
+    return queryset
+
+
+def _caminhos_orm(model, serializer_class, campos) -> list | None:
+    mapa = getattr(serializer_class.Meta, 'campos_orm', {})
+    caminhos = []
+    for campo in campos:
+        if campo in mapa:
+            caminhos.extend(mapa[campo])
+            continue
+        try:
+            field = model._meta.get_field(campo)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        caminhos.append(campo)
+    return caminhos
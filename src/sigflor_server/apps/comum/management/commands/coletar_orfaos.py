@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.comum.services.armazenamento import ArmazenamentoService
+from apps.comum.services.orfaos import (
+    CARENCIA_PADRAO, TAMANHO_LOTE_PADRAO, ColetorOrfaosService
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Exclui (logicamente) endereços, contatos e documentos sem vínculo ativo '
+        'e remove do storage os arquivos que nenhum documento ou anexo referencia. '
+        'Deve ser agendado periodicamente (ex: de hora em hora).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--carencia-minutos',
+            type=int,
+            default=int(CARENCIA_PADRAO.total_seconds() // 60),
+            help='Ignora registros alterados há menos deste tempo.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=TAMANHO_LOTE_PADRAO,
+            help='Quantidade de registros excluídos por transação.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas informa quantos órfãos seriam coletados.'
+        )
+
+    def handle(self, *args, **options):
+        if options['carencia_minutos'] < 0:
+            raise CommandError('A carência não pode ser negativa.')
+
+        carencia = timedelta(minutes=options['carencia_minutos'])
+        relatorio = ColetorOrfaosService.coletar(
+            carencia=carencia,
+            tamanho_lote=options['chunk_size'],
+            simular=options['dry_run'],
+        )
+
+        for tabela, dados in relatorio.items():
+            if options['dry_run']:
+                self.stdout.write(f"{tabela}: {dados['orfaos']} órfão(s).")
+            elif dados['coletados']:
+                self.stdout.write(f"{tabela}: {dados['coletados']} coletado(s) (lote {dados['lote_exclusao']}).")
+            else:
+                self.stdout.write(f'{tabela}: nenhum órfão.')
+
+        if not options['dry_run']:
+            total = sum(dados['coletados'] for dados in relatorio.values())
+            self.stdout.write(self.style.SUCCESS(f'{total} registro(s) órfão(s) coletado(s).'))
+
+        conteudos = ArmazenamentoService.descartar_sem_referencia(
+            carencia=carencia,
+            simular=options['dry_run'],
+        )
+        if options['dry_run']:
+            self.stdout.write(f'{conteudos} arquivo(s) sem referência.')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{conteudos} arquivo(s) sem referência removido(s).'))
@@ -0,0 +1,118 @@
+import os
+import socket
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
+
+from apps.comum import tarefas
+from apps.comum.models import StatusTarefa
+
+
+class Command(BaseCommand):
+    help = (
+        'Worker da fila de tarefas em segundo plano. Roda continuamente '
+        '(ou até esvaziar a fila, com --uma-vez).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concorrencia',
+            type=int,
+            default=getattr(settings, 'TAREFAS_CONCORRENCIA', 2),
+            help='Quantidade de threads executando tarefas ao mesmo tempo.'
+        )
+        parser.add_argument(
+            '--intervalo',
+            type=float,
+            default=2.0,
+            help='Segundos de espera quando a fila está vazia.'
+        )
+        parser.add_argument(
+            '--uma-vez',
+            action='store_true',
+            help='Processa as tarefas disponíveis e encerra.'
+        )
+        parser.add_argument(
+            '--metricas',
+            action='store_true',
+            help='Apenas mostra as métricas por função e encerra.'
+        )
+
+    def handle(self, *args, **options):
+        if options['metricas']:
+            self._mostrar_metricas()
+            return
+        if options['concorrencia'] < 1:
+            raise CommandError('A concorrência deve ser de pelo menos 1.')
+
+        recuperadas = tarefas.recuperar_travadas()
+        if recuperadas:
+            self.stdout.write(f'{recuperadas} tarefa(s) travada(s) devolvida(s) à fila.')
+
+        self._parar = threading.Event()
+        self._lock = threading.Lock()
+        self._contagem = {StatusTarefa.CONCLUIDA: 0, StatusTarefa.PENDENTE: 0, StatusTarefa.FALHOU: 0}
+        prefixo = f'{socket.gethostname()}:{os.getpid()}'
+
+        threads = [
+            threading.Thread(
+                target=self._trabalhar,
+                args=(f'{prefixo}:{i}', options['intervalo'], options['uma_vez']),
+                daemon=True,
+            )
+            for i in range(options['concorrencia'])
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            self.stdout.write('Encerrando após as tarefas em execução...')
+            self._parar.set()
+            for thread in threads:
+                thread.join()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{self._contagem[StatusTarefa.CONCLUIDA]} concluída(s), "
+            f"{self._contagem[StatusTarefa.PENDENTE]} reagendada(s), "
+            f"{self._contagem[StatusTarefa.FALHOU]} com falha."
+        ))
+
+    def _trabalhar(self, trabalhador, intervalo, uma_vez):
+        try:
+            while not self._parar.is_set():
+                close_old_connections()
+                tarefa = tarefas.reivindicar(trabalhador)
+                if tarefa is None:
+                    if uma_vez:
+                        return
+                    self._parar.wait(intervalo)
+                    continue
+
+                tarefa = tarefas.executar(tarefa)
+                with self._lock:
+                    self._contagem[tarefa.status] += 1
+                self.stdout.write(
+                    f'[{trabalhador}] {tarefa.funcao}: {tarefa.get_status_display()} '
+                    f'em {tarefa.duracao_ms} ms (fila: {tarefa.espera_ms} ms, '
+                    f'tentativa {tarefa.tentativas}/{tarefa.max_tentativas})'
+                )
+        finally:
+            connection.close()
+
+    def _mostrar_metricas(self):
+        linhas = tarefas.metricas()
+        if not linhas:
+            self.stdout.write('Nenhuma tarefa registrada.')
+            return
+        for linha in linhas:
+            self.stdout.write(
+                f"{linha['funcao']} [{linha['status']}]: {linha['total']} tarefa(s), "
+                f"duração média {linha['duracao_media_ms'] or 0:.0f} ms "
+                f"(máx. {linha['duracao_max_ms'] or 0} ms), "
+                f"fila média {linha['espera_media_ms'] or 0:.0f} ms"
+            )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.comum.services.vencimentos import VencimentoDocumentoService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula o resumo de vencimento de documentos (execução noturna) e deixa-o em cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--data-referencia',
+            help='Data base no formato AAAA-MM-DD (padrão: hoje).'
+        )
+
+    def handle(self, *args, **options):
+        data_referencia = None
+        if options['data_referencia']:
+            data_referencia = parse_date(options['data_referencia'])
+            if data_referencia is None:
+                raise CommandError('Data de referência inválida. Use o formato AAAA-MM-DD.')
+
+        resumo = VencimentoDocumentoService.recalcular(data_referencia=data_referencia)
+
+        for faixa, total in resumo['totais'].items():
+            self.stdout.write(f'{faixa}: {total}')
+        self.stdout.write(self.style.SUCCESS(
+            f"Resumo de {resumo['data_referencia']:%d/%m/%Y} recalculado "
+            f"({len(resumo['grupos'])} grupo(s))."
+        ))
@@ -1,3 +1,3 @@
-from .softdelete import SoftDeleteQuerySet
+from .softdelete import SoftDeleteManager, SoftDeleteQuerySet
 
-__all__ = ['SoftDeleteQuerySet']
+__all__ = ['SoftDeleteManager', 'SoftDeleteQuerySet']
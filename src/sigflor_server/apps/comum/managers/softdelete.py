@@ -1,9 +1,18 @@
+import uuid
+
 from django.db import models
 from django.utils import timezone
 
 class SoftDeleteQuerySet(models.QuerySet):
-    def delete(self, user=None):
-        return super().update(deleted_at=timezone.now(), deleted_by=user)
+    def delete(self, user=None, lote=None):
+        agora = timezone.now()
+        return super().update(
+            deleted_at=agora,
+            deleted_by=user,
+            updated_at=agora,
+            updated_by=user,
+            lote_exclusao=lote or uuid.uuid4()
+        )
 
     def hard_delete(self):
         return super().delete()
@@ -12,4 +21,29 @@ class SoftDeleteQuerySet(models.QuerySet):
         return self.filter(deleted_at__isnull=True)
 
     def dead(self) -> models.QuerySet:
-        return self.filter(deleted_at__isnull=False)
\ No newline at end of file
+        return self.filter(deleted_at__isnull=False)
+
+    def restaurar_lote(self, lote, user=None) -> int:
+        """
+        Restaura, num único UPDATE, as linhas excluídas no lote informado.
+        Deve ser chamado a partir de `all_objects`. Não passa por `save()`.
+        """
+        if not lote:
+            return 0
+        return self.filter(lote_exclusao=lote).restaurar(user)
+
+    def restaurar(self, user=None) -> int:
+        return self.update(
+            deleted_at=None,
+            deleted_by=None,
+            lote_exclusao=None,
+            updated_by=user,
+            updated_at=timezone.now()
+        )
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Manager restrito aos registros não excluídos (`deleted_at IS NULL`)."""
+
+    def get_queryset(self) -> models.QuerySet:
+        return super().get_queryset().filter(deleted_at__isnull=True)
@@ -0,0 +1,233 @@
+"""
+Métricas por endpoint (view + action) mantidas em memória no processo.
+
+Para cada requisição o MetricasRequisicaoMiddleware registra a duração, o
+número de consultas, o tempo gasto no banco, o tempo de serialização e o
+tamanho da resposta. Os valores vão para histogramas rotulados pelo
+endpoint (ex: `FuncionarioViewSet.retrieve`) e são expostos em formato
+texto do Prometheus por MetricasView. Cada processo tem os seus próprios
+histogramas: com vários workers, o Prometheus soma as séries de cada um.
+
+Coleta:
+- Consultas: um `execute_wrapper` é instalado em toda conexão criada
+  (`connection_created`) e soma no coletor da requisição corrente, achado
+  por ContextVar. Assim entram também as consultas das threads de
+  `em_paralelo` (o asgiref propaga o contexto).
+- Serialização: `BaseSerializer.data` é envolvido para medir o tempo do
+  serializer mais externo (`instalar`, chamado no ready do app).
+
+Testes: `orcamento_consultas({'FuncionarioViewSet.retrieve': 8})` envolve
+chamadas do test client e falha se algum endpoint passar do orçamento.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.backends.signals import connection_created
+
+BUCKETS_SEGUNDOS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BUCKETS_CONSULTAS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+BUCKETS_BYTES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+PREFIXO = 'sigflor'
+
+# (nome, ajuda, buckets, chave do registro)
+HISTOGRAMAS = (
+    ('requisicao_duracao_segundos', 'Duração total da requisição.', BUCKETS_SEGUNDOS, 'duracao'),
+    ('requisicao_consultas', 'Consultas SQL por requisição.', BUCKETS_CONSULTAS, 'consultas'),
+    ('requisicao_banco_segundos', 'Tempo gasto em consultas SQL por requisição.', BUCKETS_SEGUNDOS, 'tempo_banco'),
+    ('requisicao_serializacao_segundos', 'Tempo gasto em serializers por requisição.', BUCKETS_SEGUNDOS, 'tempo_serializacao'),
+    ('resposta_tamanho_bytes', 'Tamanho do corpo da resposta.', BUCKETS_BYTES, 'tamanho'),
+)
+
+_coletor_atual: ContextVar = ContextVar('metricas_coletor', default=None)
+
+
+class Coletor:
+    """Acumula as medições de uma requisição (pode receber de várias threads)."""
+
+    def __init__(self):
+        self.consultas = 0
+        self.tempo_banco = 0.0
+        self.tempo_serializacao = 0.0
+        self.profundidade_serializacao = 0
+        self._lock = threading.Lock()
+
+    def registrar_consulta(self, duracao: float) -> None:
+        with self._lock:
+            self.consultas += 1
+            self.tempo_banco += duracao
+
+
+class _Histograma:
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.contagens = [0] * (len(buckets) + 1)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, valor) -> None:
+        self.contagens[bisect_left(self.buckets, valor)] += 1
+        self.soma += valor
+        self.total += 1
+
+
+class Registro:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+        self._requisicoes = {}
+        self._ouvintes = []
+
+    def registrar(self, *, endpoint: str, metodo: str, status: int, medicoes: dict) -> None:
+        with self._lock:
+            series = self._series.get(endpoint)
+            if series is None:
+                series = self._series[endpoint] = {
+                    chave: _Histograma(buckets) for _, _, buckets, chave in HISTOGRAMAS
+                }
+            for chave, valor in medicoes.items():
+                if valor is not None:
+                    series[chave].observar(valor)
+
+            rotulos = (endpoint, metodo, f'{status // 100}xx')
+            self._requisicoes[rotulos] = self._requisicoes.get(rotulos, 0) + 1
+            ouvintes = list(self._ouvintes)
+
+        for ouvinte in ouvintes:
+            ouvinte({'endpoint': endpoint, 'metodo': metodo, 'status': status, **medicoes})
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._requisicoes.clear()
+
+    def exportar(self) -> str:
+        """Texto no formato de exposição do Prometheus (0.0.4)."""
+        with self._lock:
+            linhas = [
+                f'# HELP {PREFIXO}_requisicoes_total Requisições atendidas.',
+                f'# TYPE {PREFIXO}_requisicoes_total counter',
+            ]
+            for (endpoint, metodo, classe), total in sorted(self._requisicoes.items()):
+                rotulos = _rotulos(endpoint=endpoint, metodo=metodo, status=classe)
+                linhas.append(f'{PREFIXO}_requisicoes_total{{{rotulos}}} {total}')
+
+            for nome, ajuda, buckets, chave in HISTOGRAMAS:
+                nome = f'{PREFIXO}_{nome}'
+                linhas.append(f'# HELP {nome} {ajuda}')
+                linhas.append(f'# TYPE {nome} histogram')
+                for endpoint, series in sorted(self._series.items()):
+                    histograma = series[chave]
+                    acumulado = 0
+                    for limite, contagem in zip((*buckets, '+Inf'), histograma.contagens):
+                        acumulado += contagem
+                        rotulos = _rotulos(endpoint=endpoint, le=limite)
+                        linhas.append(f'{nome}_bucket{{{rotulos}}} {acumulado}')
+                    rotulos = _rotulos(endpoint=endpoint)
+                    linhas.append(f'{nome}_sum{{{rotulos}}} {histograma.soma}')
+                    linhas.append(f'{nome}_count{{{rotulos}}} {histograma.total}')
+        return '\n'.join(linhas) + '\n'
+
+
+registro = Registro()
+
+
+def _rotulos(**valores) -> str:
+    partes = []
+    for chave, valor in valores.items():
+        texto = str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        partes.append(f'{chave}="{texto}"')
+    return ','.join(partes)
+
+
+@contextmanager
+def coletar():
+    coletor = Coletor()
+    token = _coletor_atual.set(coletor)
+    try:
+        yield coletor
+    finally:
+        _coletor_atual.reset(token)
+
+
+def _medir_consulta(execute, sql, params, many, context):
+    coletor = _coletor_atual.get()
+    if coletor is None:
+        return execute(sql, params, many, context)
+    inicio = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        coletor.registrar_consulta(time.perf_counter() - inicio)
+
+
+def instrumentar_conexao(connection, **kwargs) -> None:
+    if _medir_consulta not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_medir_consulta)
+
+
+def instalar() -> None:
+    """Liga a coleta de consultas e de serialização. Idempotente."""
+    from rest_framework.serializers import BaseSerializer
+
+    connection_created.connect(instrumentar_conexao, dispatch_uid='metricas_instrumentar_conexao')
+
+    propriedade = BaseSerializer.data
+    if getattr(propriedade.fget, '_metricas', False):
+        return
+
+    def data(self):
+        coletor = _coletor_atual.get()
+        if coletor is None:
+            return propriedade.fget(self)
+        # Apenas o serializer mais externo conta: os aninhados já estão dentro do tempo dele
+        coletor.profundidade_serializacao += 1
+        inicio = time.perf_counter()
+        try:
+            return propriedade.fget(self)
+        finally:
+            coletor.profundidade_serializacao -= 1
+            if not coletor.profundidade_serializacao:
+                coletor.tempo_serializacao += time.perf_counter() - inicio
+
+    data._metricas = True
+    BaseSerializer.data = property(data)
+
+
+@contextmanager
+def orcamento_consultas(orcamentos: dict[str, int]):
+    """
+    Helper de teste: falha se algum endpoint de `orcamentos` fizer mais
+    consultas que o previsto ou não for chamado dentro do bloco.
+
+        with orcamento_consultas({'FuncionarioViewSet.list': 4}):
+            self.client.get('/api/rh/funcionarios/')
+
+    Requer o MetricasRequisicaoMiddleware ativo.
+    """
+    registros = []
+    with registro._lock:
+        registro._ouvintes.append(registros.append)
+    try:
+        yield registros
+    finally:
+        with registro._lock:
+            registro._ouvintes.remove(registros.append)
+
+    chamados = {r['endpoint'] for r in registros}
+    falhas = [
+        f"{endpoint}: não foi chamado"
+        for endpoint in orcamentos if endpoint not in chamados
+    ]
+    for r in registros:
+        maximo = orcamentos.get(r['endpoint'])
+        if maximo is not None and r['consultas'] > maximo:
+            falhas.append(f"{r['endpoint']}: {r['consultas']} consultas (orçamento: {maximo})")
+    if falhas:
+        raise AssertionError('Orçamento de consultas excedido:\n' + '\n'.join(falhas))
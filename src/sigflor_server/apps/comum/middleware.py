@@ -0,0 +1,80 @@
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from . import metricas
+
+
+class MetricasRequisicaoMiddleware:
+    """
+    Registra as métricas de cada requisição em `metricas.registro`, rotuladas
+    pelo endpoint resolvido (`Classe.action`, ex: `FuncionarioViewSet.retrieve`).
+    Deve ser o primeiro middleware, para que a duração inclua todos os demais.
+    Atende views síncronas e assíncronas.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICAS_HABILITADAS', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.assincrono = iscoroutinefunction(get_response)
+        if self.assincrono:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.assincrono:
+            return self._chamar_async(request)
+
+        with metricas.coletar() as coletor:
+            inicio = time.perf_counter()
+            self._instrumentar_conexoes()
+            response = self.get_response(request)
+            self._registrar(request, response, coletor, inicio)
+        return response
+
+    async def _chamar_async(self, request):
+        with metricas.coletar() as coletor:
+            inicio = time.perf_counter()
+            response = await self.get_response(request)
+            self._registrar(request, response, coletor, inicio)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._metricas_endpoint = _nome_endpoint(request, view_func)
+
+    @staticmethod
+    def _instrumentar_conexoes():
+        # Conexões persistentes (CONN_MAX_AGE) podem ser anteriores ao connection_created
+        for conexao in connections.all(initialized_only=True):
+            metricas.instrumentar_conexao(conexao)
+
+    @staticmethod
+    def _registrar(request, response, coletor, inicio):
+        metricas.registro.registrar(
+            endpoint=getattr(request, '_metricas_endpoint', 'nao_resolvido'),
+            metodo=request.method,
+            status=response.status_code,
+            medicoes={
+                'duracao': time.perf_counter() - inicio,
+                'consultas': coletor.consultas,
+                'tempo_banco': coletor.tempo_banco,
+                'tempo_serializacao': coletor.tempo_serializacao,
+                'tamanho': None if response.streaming else len(response.content),
+            },
+        )
+
+
+def _nome_endpoint(request, view_func) -> str:
+    classe = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    if classe is None:
+        return f'{view_func.__module__}.{view_func.__name__}'
+
+    metodo = request.method.lower()
+    # ViewSets do DRF: `actions` mapeia o método HTTP para a action da rota
+    acao = (getattr(view_func, 'actions', None) or {}).get(metodo, metodo)
+    return f'{classe.__name__}.{acao}'
@@ -11,8 +11,12 @@ from .enderecos import (
 from .contatos import Contato, PessoaFisicaContato, PessoaJuridicaContato, FilialContato
 from .documentos import Documento, PessoaFisicaDocumento, PessoaJuridicaDocumento
 from .anexos import Anexo
+from .arquivos import ConteudoArquivo
 from .deficiencias import Deficiencia, PessoaFisicaDeficiencia
 from .projeto import Projeto, StatusProjeto
+from .sequencias import Sequencia
+from .tarefas import Tarefa
+from .enums import StatusTarefa
 
 __all__ = [
     # Base
@@ -43,6 +47,11 @@ __all__ = [
     'PessoaFisicaDocumento',
     'PessoaJuridicaDocumento',
     'Anexo',
+    'ConteudoArquivo',
     'Deficiencia',
     'PessoaFisicaDeficiencia',
+    # Infraestrutura
+    'Sequencia',
+    'Tarefa',
+    'StatusTarefa',
 ]
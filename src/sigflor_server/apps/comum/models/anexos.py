@@ -15,6 +15,15 @@ class Anexo(SoftDeleteModel):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     nome_original = models.CharField(max_length=255, help_text="Nome original do arquivo enviado")
     arquivo = models.FileField(upload_to=anexo_upload_path)
+    conteudo = models.ForeignKey(
+        'comum.ConteudoArquivo',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='anexos',
+        help_text='Conteúdo deduplicado; `arquivo` aponta para o mesmo caminho'
+    )
     descricao = models.TextField(blank=True, default='')
 
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
@@ -0,0 +1,34 @@
+import os
+
+from django.db import models
+
+
+def conteudo_upload_path(instance, filename):
+    # Dois níveis de diretório pelo prefixo do hash evitam pastas com milhões de arquivos
+    extensao = os.path.splitext(filename)[1].lower()
+    return f'conteudos/{instance.sha256[:2]}/{instance.sha256[2:4]}/{instance.sha256}{extensao}'
+
+
+class ConteudoArquivo(models.Model):
+    """
+    Conteúdo físico de um arquivo enviado, endereçado pelo SHA-256.
+
+    Documentos e anexos com o mesmo conteúdo apontam para a mesma linha (e
+    para o mesmo arquivo no storage). A contagem de referências é a
+    quantidade de documentos e anexos ligados, inclusive os excluídos
+    logicamente, que ainda podem ser restaurados. Manipulado apenas por
+    ArmazenamentoService.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    arquivo = models.FileField(upload_to=conteudo_upload_path, max_length=255)
+    tamanho = models.BigIntegerField(help_text='Tamanho do arquivo em bytes')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'conteudos_arquivo'
+        verbose_name = 'Conteúdo de Arquivo'
+        verbose_name_plural = 'Conteúdos de Arquivo'
+
+    def __str__(self):
+        return self.sha256
@@ -1,8 +1,13 @@
+import uuid
+
 from django.conf import settings
 from django.db import models
+from django.db.models import Q
+from django.db.models.signals import class_prepared
 from django.utils import timezone
 
 from ..managers.softdelete import (
+    SoftDeleteManager,
     SoftDeleteQuerySet
 )
 
@@ -29,14 +34,32 @@ class AuditModel(TimeStampedModel):
         abstract = True
 
 class SoftDeleteModel(AuditModel):
+    """
+    `objects` enxerga apenas registros não excluídos; `all_objects` enxerga
+    todos (restauração, numeração sequencial, buscas `_irrestrito`).
+
+    `all_objects` é declarado primeiro e por isso é o `_default_manager`:
+    validação de unicidade, admin, managers reversos e os querysets padrão do
+    DRF continuam vendo também as linhas excluídas, como antes.
+
+    Os índices de `Meta.indexes` das subclasses viram índices parciais
+    (`WHERE deleted_at IS NULL`), ver `_indices_parciais_soft_delete`.
+    Índices declarados com `condition` própria são mantidos como estão.
+
+    Toda exclusão carimba `lote_exclusao`. Uma exclusão em cascata passa o
+    mesmo lote para os filhos, e a restauração devolve o lote inteiro com um
+    UPDATE por tabela (`all_objects.restaurar_lote(lote, user)`).
+    """
     deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    lote_exclusao = models.UUIDField(null=True, blank=True, editable=False, db_index=True)
 
-    objects = SoftDeleteQuerySet.as_manager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+    objects = SoftDeleteManager()
 
     class Meta:
         abstract = True
 
-    def delete(self, user=None):
+    def delete(self, user=None, lote=None):
         self.deleted_at = timezone.now()
         self.updated_at = timezone.now()
 
@@ -45,7 +68,8 @@ class SoftDeleteModel(AuditModel):
 
         self.deleted_by = user
         self.updated_by = user
-        self.save(update_fields=['deleted_at', 'updated_by', 'deleted_by', 'updated_at'])
+        self.lote_exclusao = lote or uuid.uuid4()
+        self.save(update_fields=['deleted_at', 'updated_by', 'deleted_by', 'updated_at', 'lote_exclusao'])
 
     def hard_delete(self,):
         return super(models.Model, self).delete()
@@ -53,5 +77,28 @@ class SoftDeleteModel(AuditModel):
     def restore(self, user=None):
         self.deleted_at = None
         self.deleted_by = None
+        self.lote_exclusao = None
         self.updated_by = user
-        self.save(update_fields=['deleted_by','deleted_at', 'updated_by', 'updated_at'])
\ No newline at end of file
+        self.save(update_fields=['deleted_by','deleted_at', 'updated_by', 'updated_at', 'lote_exclusao'])
+
+
+def _indices_parciais_soft_delete(sender, **kwargs):
+    """
+    Restringe os índices dos models com exclusão lógica às linhas vivas, para
+    que as buscas do dia a dia não cresçam com o histórico de excluídos.
+    Roda em `class_prepared`, quando os índices já receberam nome.
+    """
+    if not issubclass(sender, SoftDeleteModel):
+        return
+
+    indices = []
+    for indice in sender._meta.indexes:
+        if indice.condition is None:
+            _, args, kwargs = indice.deconstruct()
+            kwargs['condition'] = Q(deleted_at__isnull=True)
+            indice = indice.__class__(*args, **kwargs)
+        indices.append(indice)
+    sender._meta.indexes = indices
+
+
+class_prepared.connect(_indices_parciais_soft_delete)
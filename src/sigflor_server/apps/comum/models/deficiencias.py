@@ -135,8 +135,8 @@ class PessoaFisicaDeficiencia(SoftDeleteModel):
         self._atualizar_possui_deficiencia()
         return result
 
-    def delete(self, user=None):
-        result = super().delete(user=user)
+    def delete(self, user=None, lote=None):
+        result = super().delete(user=user, lote=lote)
         self._atualizar_possui_deficiencia()
         return result
 
@@ -154,6 +154,6 @@ class PessoaFisicaDeficiencia(SoftDeleteModel):
             deleted_at__isnull=True
         ).exists()
         
-        PessoaFisica.objects.filter(pk=self.pessoa_fisica_id).update(
+        PessoaFisica.all_objects.filter(pk=self.pessoa_fisica_id).update(
             possui_deficiencia=tem_deficiencia
         )
\ No newline at end of file
@@ -18,6 +18,15 @@ class Documento(SoftDeleteModel):
     tipo = models.CharField(max_length=50, choices=TipoDocumento.choices)
     descricao = models.TextField(blank=True, default='')
     arquivo = models.FileField(upload_to=documento_upload_path)
+    conteudo = models.ForeignKey(
+        'comum.ConteudoArquivo',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='documentos',
+        help_text='Conteúdo deduplicado; `arquivo` aponta para o mesmo caminho'
+    )
 
     nome_original = models.CharField(
         max_length=255,
@@ -40,7 +49,12 @@ class Documento(SoftDeleteModel):
         verbose_name_plural = 'Documentos'
         indexes = [
             models.Index(fields=['tipo']),
-            models.Index(fields=['data_validade']),
+            # Painel de vencimentos: apenas documentos vivos
+            models.Index(
+                fields=['data_validade'],
+                condition=Q(deleted_at__isnull=True),
+                name='documentos_validade_vivos_idx'
+            ),
             models.Index(fields=['tipo', 'data_emissao']),
         ]
 
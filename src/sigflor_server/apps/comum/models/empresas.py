@@ -39,6 +39,10 @@ class Empresa(SoftDeleteModel):
     def razao_social(self):
         return self.pessoa_juridica.razao_social
 
+    @property
+    def nome_fantasia(self):
+        return self.pessoa_juridica.nome_fantasia
+
     @property
     def cnpj(self):
         return self.pessoa_juridica.cnpj
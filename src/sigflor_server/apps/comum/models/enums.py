@@ -116,3 +116,9 @@ class StatusProjeto(models.TextChoices):
     EM_EXECUCAO = 'EM_EXECUCAO', 'Em Execução'
     CONCLUIDO = 'CONCLUIDO', 'Concluído'
     CANCELADO = 'CANCELADO', 'Cancelado'
+
+class StatusTarefa(models.TextChoices):
+    PENDENTE = 'PENDENTE', 'Pendente'
+    EXECUTANDO = 'EXECUTANDO', 'Executando'
+    CONCLUIDA = 'CONCLUIDA', 'Concluída'
+    FALHOU = 'FALHOU', 'Falhou'
@@ -105,26 +105,34 @@ class Projeto(SoftDeleteModel):
 
     def _generate_numero(self) -> str:
         """
-        Gera um número único para o projeto.
+        Gera um número único para o projeto a partir da sequência mensal.
         Formato: PRJ-YYYYMM-NNNN (ex: PRJ-202511-0001)
         """
+        from ..sequencias import proximo
+
         now = timezone.now()
         prefix = f"PRJ-{now.year}{now.month:02d}-"
 
-        last_projeto = Projeto.objects.filter(
+        new_num = proximo(
+            f'projeto.numero.{now.year}{now.month:02d}',
+            inicial=lambda: self._ultimo_numero(prefix)
+        )
+
+        return f"{prefix}{new_num:04d}"
+
+    @staticmethod
+    def _ultimo_numero(prefix: str) -> int:
+        """Maior sequencial já gravado com o prefixo (inicializa o contador uma única vez)."""
+        last_projeto = Projeto.all_objects.filter(
             numero__startswith=prefix
         ).order_by('-numero').first()
 
         if last_projeto:
             try:
-                last_num = int(last_projeto.numero.split('-')[-1])
-                new_num = last_num + 1
+                return int(last_projeto.numero.split('-')[-1])
             except (ValueError, IndexError):
-                new_num = 1
-        else:
-            new_num = 1
-
-        return f"{prefix}{new_num:04d}"
+                return 0
+        return 0
 
     def __str__(self):
         return f"{self.numero} - {self.descricao[:50]}"
@@ -0,0 +1,21 @@
+from django.db import models
+
+
+class Sequencia(models.Model):
+    """
+    Contador persistente de uma sequência numérica (ex: matrícula por ano,
+    número de projeto por mês). `valor` é o último número já reservado.
+    Manipulado apenas por apps.comum.sequencias, sob bloqueio de linha.
+    """
+
+    chave = models.CharField(max_length=100, unique=True)
+    valor = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'sequencias'
+        verbose_name = 'Sequência'
+        verbose_name_plural = 'Sequências'
+
+    def __str__(self):
+        return f'{self.chave}: {self.valor}'
@@ -0,0 +1,56 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+from .enums import StatusTarefa
+
+
+class Tarefa(models.Model):
+    """
+    Trabalho em segundo plano gravado no próprio banco (ver apps.comum.tarefas).
+
+    `funcao` é o caminho `modulo:Qualificado.nome` da função executada com
+    `parametros` como argumentos nomeados. Os tempos de cada execução ficam
+    na linha (`iniciada_em`, `duracao_ms`) e alimentam as métricas por função.
+    """
+
+    funcao = models.CharField(max_length=255)
+    parametros = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=StatusTarefa.choices,
+        default=StatusTarefa.PENDENTE
+    )
+
+    tentativas = models.PositiveIntegerField(default=0)
+    max_tentativas = models.PositiveIntegerField(default=5)
+    executar_apos = models.DateTimeField(default=timezone.now)
+
+    iniciada_em = models.DateTimeField(null=True, blank=True)
+    concluida_em = models.DateTimeField(null=True, blank=True)
+    duracao_ms = models.PositiveIntegerField(null=True, blank=True)
+    espera_ms = models.PositiveIntegerField(
+        null=True, blank=True,
+        help_text='Tempo entre a criação e o início da última execução'
+    )
+    trabalhador = models.CharField(max_length=100, blank=True, default='')
+    ultimo_erro = models.TextField(blank=True, default='')
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'tarefas'
+        verbose_name = 'Tarefa'
+        verbose_name_plural = 'Tarefas'
+        indexes = [
+            # Fila: apenas as pendentes, na ordem em que ficam disponíveis
+            models.Index(
+                fields=['executar_apos'],
+                condition=Q(status=StatusTarefa.PENDENTE),
+                name='tarefas_pendentes_idx'
+            ),
+            models.Index(fields=['funcao', 'status']),
+        ]
+
+    def __str__(self):
+        return f'{self.funcao} ({self.get_status_display()})'
@@ -0,0 +1,192 @@
+import base64
+import datetime
+import json
+from functools import reduce
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class _CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder que preserva os microssegundos dos datetimes.
+
+    O encoder do Django corta em milissegundos, e um cursor em `-created_at`
+    pularia os registros criados no mesmo milissegundo. O datetime vai marcado
+    como `{"dt": ...}` para o `decode_cursor` reconstruí-lo.
+    """
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return {'dt': o.isoformat()}
+        return super().default(o)
+
+
+def _cursor_object_hook(obj):
+    if obj.keys() == {'dt'}:
+        return datetime.datetime.fromisoformat(obj['dt'])
+    return obj
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação por cursor (keyset) baseada na ordenação do selector.
+
+    A ordenação é lida do queryset retornado pelo selector (ex:
+    `order_by('pessoa_fisica__nome_completo')`) e recebe o `id` como desempate,
+    formando a chave `(pessoa_fisica__nome_completo, id)`. O cursor guarda os
+    valores dessa chave para o último (ou primeiro) registro da página, e a
+    próxima página é obtida com `WHERE chave > cursor`, sem OFFSET: páginas
+    profundas custam o mesmo que a primeira.
+
+    Uso no ViewSet:
+        pagination_class = KeysetPagination
+        keyset_ordering = ('pessoa_fisica__nome_completo', 'id')  # opcional
+
+    Os campos da chave não podem ser nulos.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 50
+    max_page_size = 200
+
+    invalid_cursor_message = 'Cursor inválido.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset, view)
+
+        valores, reverso = self.decode_cursor(request)
+
+        ordering = self._inverter(self.ordering) if reverso else self.ordering
+        aliases = {f'_keyset_{i}': F(campo.lstrip('-')) for i, campo in enumerate(ordering)}
+
+        qs = queryset.annotate(**aliases).order_by(*ordering)
+        if valores is not None:
+            qs = qs.filter(self._filtro_apos(ordering, valores))
+
+        resultados = list(qs[:self.page_size + 1])
+        tem_mais = len(resultados) > self.page_size
+        resultados = resultados[:self.page_size]
+
+        if reverso:
+            resultados.reverse()
+            self.has_next = True
+            self.has_previous = tem_mais
+        else:
+            self.has_next = tem_mais
+            self.has_previous = valores is not None
+
+        self.page = resultados
+        return resultados
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        valor = request.query_params.get(self.page_size_query_param)
+        if valor is None:
+            return self.page_size
+        try:
+            tamanho = int(valor)
+        except (TypeError, ValueError):
+            return self.page_size
+        if tamanho <= 0:
+            return self.page_size
+        return min(tamanho, self.max_page_size)
+
+    def get_ordering(self, queryset, view):
+        """
+        Usa `keyset_ordering` da view se definido; caso contrário, a ordenação
+        do selector (ou do Meta do model). Garante o `id` como desempate.
+        """
+        ordering = getattr(view, 'keyset_ordering', None)
+        if ordering is None:
+            ordering = queryset.query.order_by or queryset.model._meta.ordering
+
+        if not ordering or not all(isinstance(campo, str) for campo in ordering):
+            raise ImproperlyConfigured(
+                f'{self.__class__.__name__} exige uma ordenação por nomes de campo '
+                f'no queryset de {queryset.model.__name__}.'
+            )
+
+        ordering = list(ordering)
+        if not any(campo.lstrip('-') in ('id', 'pk') for campo in ordering):
+            ordering.append('id')
+        return tuple(ordering)
+
+    def decode_cursor(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None, False
+        try:
+            payload = json.loads(
+                base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'),
+                object_hook=_cursor_object_hook,
+            )
+            valores = payload['v']
+            reverso = bool(payload.get('r', False))
+        except (TypeError, ValueError, KeyError, AttributeError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(valores, list) or len(valores) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return valores, reverso
+
+    def encode_cursor(self, instancia, reverso):
+        valores = [getattr(instancia, f'_keyset_{i}') for i in range(len(self.ordering))]
+        payload = json.dumps({'v': valores, 'r': int(reverso)}, cls=_CursorJSONEncoder)
+        cursor = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverso=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverso=True)
+
+    @staticmethod
+    def _inverter(ordering):
+        return tuple(campo[1:] if campo.startswith('-') else f'-{campo}' for campo in ordering)
+
+    @staticmethod
+    def _filtro_apos(ordering, valores):
+        """
+        Monta a comparação lexicográfica da chave:
+        (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z) ...
+        """
+        condicoes = []
+        for i, campo in enumerate(ordering):
+            nome = campo.lstrip('-')
+            operador = 'lt' if campo.startswith('-') else 'gt'
+            iguais = {ordering[j].lstrip('-'): valores[j] for j in range(i)}
+            condicoes.append(Q(**iguais, **{f'{nome}__{operador}': valores[i]}))
+        return reduce(lambda a, b: a | b, condicoes)
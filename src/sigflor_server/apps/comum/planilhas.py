@@ -0,0 +1,297 @@
+"""
+Leitura e escrita de planilhas de importação/exportação (CSV ou XLSX).
+
+`iterar_planilha` entrega as linhas uma a uma, sem carregar o arquivo inteiro
+em memória: o CSV é decodificado em fluxo sobre o arquivo enviado e o XLSX é
+aberto em modo somente leitura. Cada linha vira um dict indexado pelo
+cabeçalho normalizado (minúsculo, sem acentos, '_' no lugar de espaços), com
+a chave 'linha' guardando o número da linha na planilha.
+
+As funções de conversão de célula aceitam tanto texto (CSV) quanto os tipos
+nativos que o openpyxl devolve (números, datas).
+
+`csv_em_fluxo` e `xlsx_em_fluxo` fazem o caminho inverso para exportações:
+consomem um iterável de linhas e devolvem um gerador de blocos de bytes, para
+uso com StreamingHttpResponse. A memória fica constante no tamanho de um bloco
+e o primeiro byte sai antes de a consulta terminar. O XLSX é montado
+diretamente como ZIP em fluxo (strings inline, sem estilos), sem depender do
+openpyxl.
+"""
+
+import codecs
+import csv
+import io
+import re
+import unicodedata
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable, Iterator
+from xml.sax.saxutils import escape
+
+from django.core.exceptions import ValidationError
+from django.utils.dateparse import parse_date
+
+_AMOSTRA_BYTES = 4096
+_PONTUACAO = re.compile(r'[.\-/]')
+
+# Tamanho aproximado de cada bloco entregue pelos geradores de exportação
+TAMANHO_BLOCO_EXPORTACAO = 64 * 1024
+
+# Caracteres de controle não aceitos em XML 1.0
+_CONTROLE_XML = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def iterar_planilha(arquivo) -> Iterator[dict]:
+    nome = (getattr(arquivo, 'name', '') or '').lower()
+    if nome.endswith('.xlsx'):
+        linhas = _ler_xlsx(arquivo)
+    elif nome.endswith('.csv'):
+        linhas = _ler_csv(arquivo)
+    else:
+        raise ValidationError('Formato de arquivo não suportado. Envie um arquivo CSV ou XLSX.')
+
+    cabecalho = next(linhas, None)
+    if not cabecalho:
+        raise ValidationError('A planilha está vazia.')
+    colunas = [normalizar_cabecalho(c) for c in cabecalho]
+
+    for numero, valores in enumerate(linhas, start=2):
+        if not any(texto(v) for v in valores):
+            continue
+        dados = dict(zip(colunas, valores))
+        dados['linha'] = numero
+        yield dados
+
+
+def _ler_csv(arquivo):
+    bruto = getattr(arquivo, 'file', arquivo)
+    if hasattr(bruto, 'seek'):
+        bruto.seek(0)
+    amostra = bruto.read(_AMOSTRA_BYTES)
+
+    if isinstance(amostra, bytes):
+        try:
+            # final=False tolera um caractere multibyte cortado no fim da amostra
+            codecs.getincrementaldecoder('utf-8-sig')().decode(amostra, final=False)
+            codificacao = 'utf-8-sig'
+        except UnicodeDecodeError:
+            codificacao = 'latin-1'
+        amostra = amostra.decode(codificacao, errors='ignore')
+        bruto.seek(0)
+        fluxo = io.TextIOWrapper(bruto, encoding=codificacao, newline='')
+    else:
+        bruto.seek(0)
+        fluxo = bruto
+
+    try:
+        dialeto = csv.Sniffer().sniff(amostra, delimiters=';,')
+    except csv.Error:
+        dialeto = csv.excel
+    return iter(csv.reader(fluxo, dialeto))
+
+
+def _ler_xlsx(arquivo):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError(
+            'Importação de XLSX indisponível: instale o pacote openpyxl ou envie a planilha em CSV.'
+        )
+    planilha = load_workbook(arquivo, read_only=True, data_only=True).active
+    return planilha.iter_rows(values_only=True)
+
+
+def normalizar_cabecalho(nome) -> str:
+    nome = unicodedata.normalize('NFKD', texto(nome))
+    nome = ''.join(c for c in nome if not unicodedata.combining(c))
+    return '_'.join(_PONTUACAO.sub('', nome.lower()).split())
+
+
+def normalizar_nome(nome) -> str:
+    """Chave de comparação para nomes (exame, cargo): minúsculo, sem acentos e espaços repetidos."""
+    nome = unicodedata.normalize('NFKD', texto(nome))
+    nome = ''.join(c for c in nome if not unicodedata.combining(c))
+    return ' '.join(nome.lower().split())
+
+
+def texto(valor) -> str:
+    if valor is None:
+        return ''
+    return str(valor).strip()
+
+
+def digitos(valor) -> str:
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)
+    return ''.join(filter(str.isdigit, str(valor or '')))
+
+
+def cpf(valor) -> str:
+    numero = digitos(valor)
+    # Células numéricas do XLSX perdem os zeros à esquerda
+    if isinstance(valor, (int, float)):
+        numero = numero.zfill(11)
+    return numero
+
+
+def data(valor):
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    valor_texto = texto(valor)
+    if not valor_texto:
+        return None
+    if '/' in valor_texto:
+        try:
+            return datetime.strptime(valor_texto, '%d/%m/%Y').date()
+        except ValueError:
+            raise ValidationError(f"Data inválida: '{valor_texto}'. Use DD/MM/AAAA.")
+    resultado = parse_date(valor_texto)
+    if resultado is None:
+        raise ValidationError(f"Data inválida: '{valor_texto}'. Use DD/MM/AAAA.")
+    return resultado
+
+
+def erros(exc: ValidationError) -> dict:
+    if hasattr(exc, 'error_dict'):
+        mensagens = dict(exc.message_dict)
+        if '__all__' in mensagens:
+            mensagens['non_field_errors'] = mensagens.pop('__all__')
+        return mensagens
+    return {'non_field_errors': exc.messages}
+
+
+def celula(valor) -> str:
+    """Representação textual de um valor exportado (datas em DD/MM/AAAA)."""
+    if valor is None:
+        return ''
+    if isinstance(valor, datetime):
+        return valor.strftime('%d/%m/%Y %H:%M')
+    if isinstance(valor, date):
+        return valor.strftime('%d/%m/%Y')
+    if isinstance(valor, bool):
+        return 'Sim' if valor else 'Não'
+    if isinstance(valor, Decimal):
+        return format(valor, 'f').replace('.', ',')
+    return str(valor)
+
+
+class _Eco:
+    """Pseudo-arquivo do csv.writer: devolve a linha formatada em vez de gravá-la."""
+
+    def write(self, valor):
+        return valor
+
+
+def csv_em_fluxo(cabecalho: list, linhas: Iterable) -> Iterator[bytes]:
+    """CSV com ';' e BOM UTF-8 (abre direto no Excel em pt-BR)."""
+    escritor = csv.writer(_Eco(), delimiter=';')
+    bloco = [codecs.BOM_UTF8.decode('utf-8'), escritor.writerow(cabecalho)]
+    tamanho = 0
+    for linha in linhas:
+        texto_linha = escritor.writerow([celula(v) for v in linha])
+        bloco.append(texto_linha)
+        tamanho += len(texto_linha)
+        if tamanho >= TAMANHO_BLOCO_EXPORTACAO:
+            yield ''.join(bloco).encode('utf-8')
+            bloco, tamanho = [], 0
+    yield ''.join(bloco).encode('utf-8')
+
+
+class _BufferFluxo:
+    """
+    Destino não posicionável do ZipFile: o zipfile passa a gravar os
+    tamanhos em data descriptors e os bytes podem ser drenados a cada bloco.
+    """
+
+    def __init__(self):
+        self._partes = []
+        self.tamanho = 0
+
+    def write(self, dados):
+        self._partes.append(bytes(dados))
+        self.tamanho += len(dados)
+        return len(dados)
+
+    def flush(self):
+        pass
+
+    def esvaziar(self) -> bytes:
+        dados = b''.join(self._partes)
+        self._partes, self.tamanho = [], 0
+        return dados
+
+
+_XLSX_ESTATICOS = (
+    ('[Content_Types].xml',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+     '<Default Extension="xml" ContentType="application/xml"/>'
+     '<Override PartName="/xl/workbook.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+     '<Override PartName="/xl/worksheets/sheet1.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+     '</Types>'),
+    ('_rels/.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" '
+     'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+     'Target="xl/workbook.xml"/>'
+     '</Relationships>'),
+    ('xl/_rels/workbook.xml.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" '
+     'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+     'Target="worksheets/sheet1.xml"/>'
+     '</Relationships>'),
+)
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{nome}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+
+def _linha_xlsx(valores) -> str:
+    celulas = []
+    for valor in valores:
+        if isinstance(valor, (int, float, Decimal)) and not isinstance(valor, bool):
+            celulas.append(f'<c t="n"><v>{valor}</v></c>')
+        else:
+            conteudo = escape(_CONTROLE_XML.sub('', celula(valor)))
+            celulas.append(f'<c t="inlineStr"><is><t xml:space="preserve">{conteudo}</t></is></c>')
+    return f'<row>{"".join(celulas)}</row>'
+
+
+def xlsx_em_fluxo(cabecalho: list, linhas: Iterable, nome_planilha: str = 'Planilha') -> Iterator[bytes]:
+    buffer = _BufferFluxo()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as arquivo_zip:
+        for nome, conteudo in _XLSX_ESTATICOS:
+            arquivo_zip.writestr(nome, conteudo)
+        arquivo_zip.writestr(
+            'xl/workbook.xml',
+            _XLSX_WORKBOOK.format(nome=escape(nome_planilha[:31], {'"': '&quot;'}))
+        )
+        yield buffer.esvaziar()
+
+        with arquivo_zip.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as folha:
+            folha.write(
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                '<sheetData>'.encode('utf-8')
+            )
+            folha.write(_linha_xlsx(cabecalho).encode('utf-8'))
+            for linha in linhas:
+                folha.write(_linha_xlsx(linha).encode('utf-8'))
+                if buffer.tamanho >= TAMANHO_BLOCO_EXPORTACAO:
+                    yield buffer.esvaziar()
+            folha.write(b'</sheetData></worksheet>')
+    yield buffer.esvaziar()
@@ -1,6 +1,30 @@
+import hashlib
 import inspect
+import json
+import threading
+
 from django.db import models
 
+_registro = None
+_lock = threading.Lock()
+
+
+class RegistroEnums:
+    """
+    Enums de todos os apps já serializados para o EnumsView.
+
+    `conteudo` é o JSON pronto (bytes) e `etag` um ETag forte derivado do
+    hash do conteúdo: muda apenas quando algum enum muda.
+    """
+
+    def __init__(self, enums: dict):
+        self.enums = enums
+        self.conteudo = json.dumps(
+            enums, ensure_ascii=False, sort_keys=True, separators=(',', ':')
+        ).encode('utf-8')
+        self.etag = f'"{hashlib.sha256(self.conteudo).hexdigest()[:32]}"'
+
+
 def buscar_todos_enums():
     """
     Procura automaticamente todas as subclasses de TextChoices
@@ -23,4 +47,20 @@ def buscar_todos_enums():
                     for choice in obj.choices
                 ]
 
-    return enums
\ No newline at end of file
+    return enums
+
+
+def carregar_registro() -> RegistroEnums:
+    """Monta (ou remonta) o registro. Chamado em ComumConfig.ready."""
+    global _registro
+    with _lock:
+        _registro = RegistroEnums(buscar_todos_enums())
+    return _registro
+
+
+def obter_registro() -> RegistroEnums:
+    """Registro pré-computado; monta-o na primeira chamada se o ready não rodou."""
+    registro = _registro
+    if registro is None:
+        registro = carregar_registro()
+    return registro
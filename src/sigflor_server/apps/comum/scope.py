@@ -0,0 +1,62 @@
+from django.db.models import Q, QuerySet
+
+
+class FilialScope:
+    """
+    Escopo regional (RBAC por Filial) de um usuário.
+
+    Carrega os IDs de `allowed_filiais` uma única vez por requisição (o cache
+    fica no próprio objeto do usuário, que vive apenas durante o request) e os
+    aplica como uma lista `IN` literal sobre a FK da filial. Como o filtro
+    percorre apenas FKs diretas, não há multiplicação de linhas e o `DISTINCT`
+    deixa de ser necessário.
+
+    Uso:
+        qs = FilialScope.for_user(user).apply(qs, path='projeto__filial')
+        qs = FilialScope.for_user(user).apply(qs, path='projeto__filial', allow_null=True)
+    """
+
+    def __init__(self, *, irrestrito: bool, filial_ids: frozenset = frozenset()):
+        self.irrestrito = irrestrito
+        self.filial_ids = filial_ids
+
+    @classmethod
+    def for_user(cls, user) -> 'FilialScope':
+        if user.is_superuser:
+            return cls(irrestrito=True)
+
+        if not hasattr(user, '_filial_scope_cache'):
+            if user.is_authenticated:
+                ids = frozenset(user.allowed_filiais.values_list('id', flat=True))
+            else:
+                ids = frozenset()
+            user._filial_scope_cache = cls(irrestrito=False, filial_ids=ids)
+
+        return user._filial_scope_cache
+
+    def apply(self, qs: QuerySet, *, path: str, allow_null: bool = False) -> QuerySet:
+        """
+        Restringe `qs` às filiais permitidas.
+
+        Args:
+            path: Caminho até a FK de Filial (ex: 'projeto__filial', 'id' para a própria Filial).
+            allow_null: Também inclui registros sem vínculo (ex: funcionário sem projeto),
+                testando `isnull` no segmento anterior do caminho (ou na própria FK,
+                quando o caminho é direto, ex: 'filial').
+        """
+        if self.irrestrito:
+            return qs
+
+        condicao = Q(**{f'{path}__in': sorted(self.filial_ids)})
+
+        if allow_null:
+            vinculo = path.rsplit('__', 1)[0]
+            condicao |= Q(**{f'{vinculo}__isnull': True})
+
+        return qs.filter(condicao)
+
+    def permite(self, filial_id) -> bool:
+        """Verifica o acesso a uma filial sem consultar o banco."""
+        if self.irrestrito:
+            return True
+        return filial_id in self.filial_ids
@@ -32,7 +32,7 @@ def cliente_list(
     return qs.order_by('pessoa_juridica__razao_social')
 
 def cliente_get_by_id_irrestrito(*, user: Usuario, pk: str) -> Optional[Cliente]:
-    return Cliente.objects.filter(pk=pk).select_related('pessoa_juridica').first()
+    return Cliente.all_objects.filter(pk=pk).select_related('pessoa_juridica').first()
 
 def cliente_detail(*, user: Usuario, pk) -> Cliente:
     return Cliente.objects.select_related(
@@ -30,7 +30,7 @@ def deficiencia_detail(*, pk) -> Deficiencia:
 
 
 def deficiencia_get_by_id_irrestrito(*, pk: str) -> Optional[Deficiencia]:
-    return Deficiencia.objects.filter(pk=pk).first()
+    return Deficiencia.all_objects.filter(pk=pk).first()
 
 
 def deficiencias_por_pessoa(*, pessoa_fisica_id: str) -> QuerySet[PessoaFisicaDeficiencia]:
@@ -1,7 +1,11 @@
-from django.db.models import QuerySet, Q
+from datetime import timedelta
+
+from django.db.models import QuerySet, Q, Case, CharField, OuterRef, Subquery, UUIDField, Value, When
+from django.db.models.functions import Coalesce
 from django.contrib.contenttypes.models import ContentType
 from django.utils import timezone
-from ..models import Documento
+from ..models import Documento, PessoaFisicaDocumento, PessoaJuridicaDocumento
+from ..scope import FilialScope
 
 def documento_list_por_entidade(*, entidade, tipo: str = None, vencidos: bool = None) -> QuerySet:
     """Lista documentos de uma entidade. (FIXME: Lógica de GFK pode precisar de revisão)"""
@@ -24,3 +28,108 @@ def documento_list_por_entidade(*, entidade, tipo: str = None, vencidos: bool =
         )
 
     return qs.order_by('tipo', '-principal', '-created_at')
+
+
+TITULAR_FUNCIONARIO = 'FUNCIONARIO'
+TITULAR_EMPRESA = 'EMPRESA'
+
+FAIXA_VENCIDO = 'VENCIDO'
+FAIXA_7_DIAS = 'ATE_7_DIAS'
+FAIXA_30_DIAS = 'ATE_30_DIAS'
+FAIXA_90_DIAS = 'ATE_90_DIAS'
+FAIXAS_VENCIMENTO = (
+    (FAIXA_7_DIAS, 7),
+    (FAIXA_30_DIAS, 30),
+    (FAIXA_90_DIAS, 90),
+)
+
+
+def documento_vencimento_queryset(*, data_referencia=None) -> QuerySet:
+    """
+    Documentos vivos vencidos ou a vencer em até 90 dias, com titular, filial
+    e faixa de vencimento resolvidos no próprio SQL.
+
+    O filtro por `data_validade` é atendido pelo índice parcial sobre as
+    linhas não excluídas. O titular é o funcionário (via PessoaFisicaDocumento)
+    ou a empresa (via PessoaJuridicaDocumento); a filial do funcionário é a do
+    projeto da sua alocação ativa mais recente em equipe. Documentos de empresa
+    não pertencem a uma filial (`filial_ref` nulo).
+
+    Anotações: titular, titular_id, titular_nome, filial_ref, filial_nome, faixa.
+    """
+    from apps.rh.models import EquipeFuncionario
+
+    hoje = data_referencia or timezone.localdate()
+
+    vinculo_funcionario = PessoaFisicaDocumento.objects.filter(
+        documento=OuterRef('pk'),
+        deleted_at__isnull=True,
+        pessoa_fisica__funcionario__deleted_at__isnull=True
+    )
+    vinculo_empresa = PessoaJuridicaDocumento.objects.filter(
+        documento=OuterRef('pk'),
+        deleted_at__isnull=True,
+        pessoa_juridica__empresa__deleted_at__isnull=True
+    )
+    alocacao_atual = EquipeFuncionario.objects.filter(
+        funcionario_id=OuterRef('funcionario_ref'),
+        data_saida__isnull=True,
+        deleted_at__isnull=True
+    ).order_by('-data_entrada')
+
+    faixas = [When(data_validade__lt=hoje, then=Value(FAIXA_VENCIDO))] + [
+        When(data_validade__lte=hoje + timedelta(days=dias), then=Value(faixa))
+        for faixa, dias in FAIXAS_VENCIMENTO
+    ]
+
+    return Documento.objects.filter(
+        deleted_at__isnull=True,
+        data_validade__lte=hoje + timedelta(days=FAIXAS_VENCIMENTO[-1][1])
+    ).annotate(
+        funcionario_ref=Subquery(
+            vinculo_funcionario.values('pessoa_fisica__funcionario__id')[:1], output_field=UUIDField()
+        ),
+        empresa_ref=Subquery(
+            vinculo_empresa.values('pessoa_juridica__empresa__id')[:1], output_field=UUIDField()
+        ),
+    ).filter(
+        Q(funcionario_ref__isnull=False) | Q(empresa_ref__isnull=False)
+    ).annotate(
+        titular=Case(
+            When(funcionario_ref__isnull=False, then=Value(TITULAR_FUNCIONARIO)),
+            default=Value(TITULAR_EMPRESA),
+            output_field=CharField()
+        ),
+        titular_id=Coalesce('funcionario_ref', 'empresa_ref'),
+        titular_nome=Coalesce(
+            Subquery(vinculo_funcionario.values('pessoa_fisica__nome_completo')[:1]),
+            Subquery(vinculo_empresa.values('pessoa_juridica__razao_social')[:1]),
+        ),
+        filial_ref=Subquery(
+            alocacao_atual.values('equipe__projeto__filial_id')[:1], output_field=UUIDField()
+        ),
+        filial_nome=Subquery(alocacao_atual.values('equipe__projeto__filial__nome')[:1]),
+        faixa=Case(*faixas, output_field=CharField()),
+    )
+
+
+def documento_vencimento_list(
+    *,
+    user,
+    data_referencia=None,
+    filial_id=None,
+    titular: str = None,
+    faixa: str = None
+) -> QuerySet:
+    """Itens do painel de vencimentos no escopo de filiais do usuário, do mais urgente ao menos."""
+    qs = documento_vencimento_queryset(data_referencia=data_referencia)
+    qs = FilialScope.for_user(user).apply(qs, path='filial_ref', allow_null=True)
+
+    if filial_id:
+        qs = qs.filter(filial_ref=filial_id)
+    if titular:
+        qs = qs.filter(titular=titular)
+    if faixa:
+        qs = qs.filter(faixa=faixa)
+
+    return qs.order_by('data_validade')
@@ -34,7 +34,7 @@ def empresa_get_by_id_irrestrito(*, user: Usuario, pk: str) -> Optional[Empresa]
     Retorna None se não encontrar.
     Usado principalmente para operações de restore ou admin.
     """
-    return Empresa.objects.filter(pk=pk).select_related('pessoa_juridica').first()
+    return Empresa.all_objects.filter(pk=pk).select_related('pessoa_juridica').first()
 
 def empresa_detail(*, user: Usuario, pk) -> Empresa:
     return Empresa.objects.select_related(
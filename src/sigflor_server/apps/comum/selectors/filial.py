@@ -1,9 +1,13 @@
 from typing import Optional
+
+from asgiref.sync import sync_to_async
 from django.db.models import QuerySet, Q, Count
 from rest_framework.exceptions import PermissionDenied
 
 from apps.autenticacao.models.usuarios import Usuario
 from ..models import Filial
+from ..assincrono import em_paralelo, em_sequencia
+from ..scope import FilialScope
 
 def filial_list(
     *,
@@ -15,8 +19,7 @@ def filial_list(
 ) -> QuerySet:
     qs = Filial.objects.filter(deleted_at__isnull=True)
 
-    # if not user.is_superuser:
-    #     qs = qs.filter(id__in=user.allowed_filiais.all()) # Filtra por filiais permitidas ao usuario
+    # qs = FilialScope.for_user(user).apply(qs, path='id') # Filtra por filiais permitidas ao usuario
 
     qs = qs.select_related('empresa')
 
@@ -46,35 +49,39 @@ def filial_detail(*, user: Usuario, pk) -> Filial:
         'contatos_vinculados__contato'
     ).get(pk=pk, deleted_at__isnull=True)
 
-    # if not user.is_superuser:
-    #     if not user.allowed_filiais.filter(id=filial.id).exists():
-    #         raise PermissionDenied(f"Usuário não tem acesso à filial {filial.nome}.")
+    # if not FilialScope.for_user(user).permite(filial.id):
+    #     raise PermissionDenied(f"Usuário não tem acesso à filial {filial.nome}.")
     
     return filial
 
 
 def filial_get_by_id_irrestrito(*, pk: str) -> Optional[Filial]:
-    return Filial.objects.filter(pk=pk).first()
+    return Filial.all_objects.filter(pk=pk).first()
 
 
-def estatisticas_filiais(*, user: Usuario) -> dict:
+def _consultas_estatisticas_filiais(user: Usuario) -> dict:
     qs = Filial.objects.filter(deleted_at__isnull=True)
 
-    # if not user.is_superuser:
-    #     qs = qs.filter(id__in=user.allowed_filiais.all())
-
-    total = qs.count()
-
-    por_status = qs.values('status').annotate(
-        total=Count('id')
-    ).order_by('-total')
+    # qs = FilialScope.for_user(user).apply(qs, path='id')
 
     return {
-        'total': total,
-        'por_status': list(por_status),
+        'total': qs.count,
+        'por_status': lambda: list(
+            qs.values('status').annotate(total=Count('id')).order_by('-total')
+        ),
     }
 
 
+def estatisticas_filiais(*, user: Usuario) -> dict:
+    return em_sequencia(_consultas_estatisticas_filiais(user))
+
+
+async def estatisticas_filiais_async(*, user: Usuario) -> dict:
+    """Mesmo resultado de `estatisticas_filiais`, com as consultas em paralelo."""
+    consultas = await sync_to_async(_consultas_estatisticas_filiais)(user)
+    return await em_paralelo(consultas)
+
+
 def filial_list_selection(*, user, ativa: bool = True) -> QuerySet:
     qs = Filial.objects.filter(
         deleted_at__isnull=True,
@@ -83,7 +90,6 @@ def filial_list_selection(*, user, ativa: bool = True) -> QuerySet:
     if ativa:
         qs = qs.filter(status=Filial.Status.ATIVA)
 
-    if not user.is_superuser:
-        qs = qs.filter(id__in=user.allowed_filiais.all())
+    qs = FilialScope.for_user(user).apply(qs, path='id')
 
     return qs.only('id', 'nome', 'codigo_interno').order_by('nome')
\ No newline at end of file
@@ -5,6 +5,7 @@ from uuid import UUID
 
 from apps.autenticacao.models.usuarios import Usuario
 from ..models import Projeto, StatusProjeto
+from ..scope import FilialScope
 
 def projeto_list(
     *,
@@ -46,8 +47,7 @@ def projeto_list(
         )
 
     # Permissão Regional (Opcional, descomentar se necessário)
-    # if not user.is_superuser:
-    #     qs = qs.filter(filial__in=user.allowed_filiais.all())
+    # qs = FilialScope.for_user(user).apply(qs, path='filial')
 
     return qs.order_by('-created_at')
 
@@ -57,9 +57,8 @@ def projeto_detail(*, user: Usuario, pk) -> Projeto:
         'cliente__pessoa_juridica', 'empresa__pessoa_juridica'
     ).get(pk=pk, deleted_at__isnull=True)
 
-    # if not user.is_superuser:
-    #     if not user.allowed_filiais.filter(id=projeto.filial.id).exists():
-    #         raise PermissionDenied(f"Usuário não tem acesso a este projeto.")
+    # if not FilialScope.for_user(user).permite(projeto.filial_id):
+    #     raise PermissionDenied(f"Usuário não tem acesso a este projeto.")
 
     return projeto
 
@@ -69,10 +68,9 @@ def projeto_list_selection(*, user, ativo: bool = True) -> QuerySet:
     if ativo:
         qs = qs.filter(status=StatusProjeto.EM_EXECUCAO)
         
-    if not user.is_superuser:
-        qs = qs.filter(filial__in=user.allowed_filiais.all())
+    qs = FilialScope.for_user(user).apply(qs, path='filial')
 
     return qs.only('id', 'numero', 'descricao').order_by('descricao')
 
 def projeto_get_by_id_irrestrito(*, pk: str) -> Optional[Projeto]:
-    return Projeto.objects.filter(pk=pk).first()
\ No newline at end of file
+    return Projeto.all_objects.filter(pk=pk).first()
\ No newline at end of file
@@ -0,0 +1,90 @@
+"""
+Alocação de números sequenciais (matrícula, número de projeto) sem varrer a
+tabela de destino a cada inserção.
+
+Cada sequência é uma linha de `Sequencia`, incrementada sob `SELECT ... FOR
+UPDATE`: inserções paralelas esperam apenas o incremento do contador, nunca
+disputam o mesmo número e não precisam de retentativas por violação de
+unicidade.
+
+Para reduzir o acesso ao contador, cada processo reserva um bloco de números
+(`SEQUENCIAS_TAMANHO_BLOCO`) e os entrega a partir da memória. O bloco só
+entra no cache depois do commit da transação que o reservou: se ela for
+desfeita, o contador volta junto e nenhum número é reaproveitado em
+duplicidade. Números reservados e não usados (processo reiniciado, transação
+desfeita) viram lacunas na numeração.
+
+Na primeira reserva de uma chave, o contador é inicializado pela função
+`inicial`, que normalmente lê o maior número já gravado (dados anteriores ao
+contador).
+"""
+
+import threading
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+_blocos = {}
+_lock = threading.Lock()
+
+
+def _tamanho_bloco() -> int:
+    return max(1, int(getattr(settings, 'SEQUENCIAS_TAMANHO_BLOCO', 1)))
+
+
+def reservar(chave: str, quantidade: int = 1, *, inicial: Optional[Callable[[], int]] = None) -> int:
+    """
+    Reserva `quantidade` números consecutivos diretamente no contador e
+    retorna o primeiro. Participa da transação corrente.
+    """
+    from .models import Sequencia
+
+    with transaction.atomic():
+        sequencia = Sequencia.objects.select_for_update().filter(chave=chave).first()
+        if sequencia is None:
+            try:
+                with transaction.atomic():
+                    sequencia = Sequencia.objects.create(
+                        chave=chave,
+                        valor=inicial() if inicial else 0
+                    )
+            except IntegrityError:
+                # Outra transação criou o contador entre o SELECT e o INSERT
+                sequencia = Sequencia.objects.select_for_update().get(chave=chave)
+
+        primeiro = sequencia.valor + 1
+        sequencia.valor += quantidade
+        sequencia.save(update_fields=['valor', 'updated_at'])
+
+    return primeiro
+
+
+def proximo(chave: str, *, inicial: Optional[Callable[[], int]] = None) -> int:
+    """Retorna o próximo número da sequência, usando o bloco em cache do processo."""
+    with _lock:
+        bloco = _blocos.get(chave)
+        if bloco and bloco[0] <= bloco[1]:
+            numero = bloco[0]
+            bloco[0] += 1
+            return numero
+
+    tamanho = _tamanho_bloco()
+    primeiro = reservar(chave, tamanho, inicial=inicial)
+
+    if tamanho > 1:
+        def guardar():
+            with _lock:
+                _blocos[chave] = [primeiro + 1, primeiro + tamanho - 1]
+        transaction.on_commit(guardar)
+
+    return primeiro
+
+
+def limpar_cache(chave: Optional[str] = None) -> None:
+    """Descarta os blocos em memória (todos ou de uma chave)."""
+    with _lock:
+        if chave is None:
+            _blocos.clear()
+        else:
+            _blocos.pop(chave, None)
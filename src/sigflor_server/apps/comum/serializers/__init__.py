@@ -21,7 +21,7 @@ from .clientes import (
 ) 
 from .enderecos import EnderecoSerializer
 from .contatos import ContatoSerializer
-from .documentos import DocumentoSerializer
+from .documentos import DocumentoSerializer, DocumentoVencimentoSerializer
 from .anexos import AnexoSerializer
 from .deficiencias import (
     DeficienciaSerializer,
@@ -62,6 +62,7 @@ __all__ = [
     'EnderecoSerializer',
     'ContatoSerializer',
     'DocumentoSerializer',
+    'DocumentoVencimentoSerializer',
     'AnexoSerializer',
     'DeficienciaSerializer',
     'DeficienciaSelecaoSerializer',
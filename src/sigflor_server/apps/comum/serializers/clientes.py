@@ -21,6 +21,10 @@ class ClienteListSerializer(serializers.ModelSerializer):
             'cnpj',
             'ativo',
         ]
+        campos_orm = {
+            'razao_social': ['pessoa_juridica__razao_social'],
+            'cnpj': ['pessoa_juridica__cnpj'],
+        }
 
 class ClienteSerializer(serializers.ModelSerializer):
 
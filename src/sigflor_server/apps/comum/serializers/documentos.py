@@ -140,4 +140,34 @@ class PessoaJuridicaDocumentoNestedSerializer(PessoaJuridicaDocumentoSerializer)
 
     class Meta(PessoaJuridicaDocumentoSerializer.Meta):
         fields = PessoaJuridicaDocumentoSerializer.Meta.fields + ['tipo', 'descricao']
-        read_only_fields = ['created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['created_at', 'updated_at']
+
+
+class DocumentoVencimentoSerializer(serializers.ModelSerializer):
+    """Item do painel de vencimentos (anotações de selectors.documento_vencimento_queryset)."""
+
+    tipo_display = serializers.CharField(source='get_tipo_display', read_only=True)
+    faixa = serializers.CharField(read_only=True)
+    titular = serializers.CharField(read_only=True)
+    titular_id = serializers.UUIDField(read_only=True)
+    titular_nome = serializers.CharField(read_only=True)
+    filial_id = serializers.UUIDField(source='filial_ref', read_only=True, allow_null=True)
+    filial_nome = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = Documento
+        fields = [
+            'id',
+            'tipo',
+            'tipo_display',
+            'descricao',
+            'nome_original',
+            'data_validade',
+            'faixa',
+            'titular',
+            'titular_id',
+            'titular_nome',
+            'filial_id',
+            'filial_nome',
+        ]
+        read_only_fields = fields
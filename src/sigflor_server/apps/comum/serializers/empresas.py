@@ -22,6 +22,10 @@ class EmpresaListSerializer(serializers.ModelSerializer):
             'descricao',
             'ativa',
         ]
+        campos_orm = {
+            'razao_social': ['pessoa_juridica__razao_social'],
+            'cnpj': ['pessoa_juridica__cnpj'],
+        }
 
 class EmpresaSerializer(serializers.ModelSerializer):
     pessoa_juridica = PessoaJuridicaSerializer(read_only=True)
@@ -19,6 +19,9 @@ class FilialListSerializer(serializers.ModelSerializer):
             'status',
             'empresa_nome',
         ]
+        campos_orm = {
+            'empresa_nome': ['empresa__pessoa_juridica__razao_social'],
+        }
 
 class FilialSerializer(serializers.ModelSerializer):
     is_ativa = serializers.ReadOnlyField()
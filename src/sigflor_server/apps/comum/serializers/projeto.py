@@ -26,6 +26,12 @@ class ProjetoListSerializer(serializers.ModelSerializer):
             'data_inicio',
             'data_fim',
         ]
+        campos_orm = {
+            'cliente_nome': ['cliente__pessoa_juridica__nome_fantasia', 'cliente__pessoa_juridica__razao_social'],
+            'empresa_nome': ['empresa__pessoa_juridica__nome_fantasia', 'empresa__pessoa_juridica__razao_social'],
+            'filial_nome': ['filial__nome'],
+            'status_display': ['status'],
+        }
 
 class ProjetoSerializer(serializers.ModelSerializer):
     cliente_nome = serializers.ReadOnlyField()
@@ -5,7 +5,10 @@ from .clientes import ClienteService
 from .enderecos import EnderecoService
 from .contatos import ContatoService
 from .documentos import DocumentoService
+from .vencimentos import VencimentoDocumentoService
+from .orfaos import ColetorOrfaosService
 from .anexos import AnexoService
+from .armazenamento import ArmazenamentoService
 from .deficiencias import DeficienciaService
 from .filiais import FilialService
 from .projeto import ProjetoService
@@ -19,7 +22,10 @@ __all__ = [
     'EnderecoService',
     'ContatoService',
     'DocumentoService',
+    'VencimentoDocumentoService',
+    'ColetorOrfaosService',
     'AnexoService',
+    'ArmazenamentoService',
     'DeficienciaService',
     'FilialService',
     'ProjetoService',
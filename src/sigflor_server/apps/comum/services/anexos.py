@@ -1,9 +1,9 @@
 from typing import Optional
 from django.db import transaction
 from django.contrib.contenttypes.models import ContentType
-from datetime import timedelta
 
 from ..models import Anexo
+from .armazenamento import ArmazenamentoService
 
 
 class AnexoService:
@@ -28,10 +28,13 @@ class AnexoService:
         if not mimetype and hasattr(arquivo, 'content_type'):
             mimetype = arquivo.content_type
 
+        conteudo = ArmazenamentoService.armazenar(arquivo)
+
         anexo = Anexo(
             content_type=content_type,
             object_id=str(entidade.pk),
-            arquivo=arquivo,
+            arquivo=conteudo.arquivo.name,
+            conteudo=conteudo,
             nome_original=nome_original,
             descricao=descricao,
             tamanho=tamanho,
@@ -80,23 +83,15 @@ class AnexoService:
         ))
 
     @staticmethod
-    def restaurar_anexos_entidade(entidade, data_delecao_pai, user):
+    def restaurar_anexos_entidade(entidade, lote_exclusao, user):
         """
         Restaura anexos vinculados a qualquer entidade via GFK.
         """
-        if not data_delecao_pai: return
-        
-        margem = timedelta(seconds=5)
-        inicio = data_delecao_pai - margem
-        fim = data_delecao_pai + margem
+        if not lote_exclusao: return
 
         content_type = ContentType.objects.get_for_model(entidade)
-        
-        anexos = Anexo.objects.filter(
+
+        Anexo.all_objects.filter(
             content_type=content_type,
-            object_id=str(entidade.pk),
-            deleted_at__range=(inicio, fim)
-        )
-        
-        for anexo in anexos:
-            anexo.restore(user=user)
\ No newline at end of file
+            object_id=str(entidade.pk)
+        ).restaurar_lote(lote_exclusao, user)
\ No newline at end of file
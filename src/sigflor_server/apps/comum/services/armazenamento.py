@@ -0,0 +1,98 @@
+import hashlib
+from datetime import timedelta
+from functools import partial
+
+from django.core.files.uploadedfile import UploadedFile
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
+
+from ..models import Anexo, ConteudoArquivo, Documento
+
+# Bloco de leitura do hash: o arquivo nunca é carregado inteiro em memória
+TAMANHO_BLOCO_HASH = 1024 * 1024
+
+CARENCIA_DESCARTE_PADRAO = timedelta(hours=1)
+
+
+class ArmazenamentoService:
+    """
+    Armazenamento endereçado por conteúdo dos arquivos de Documento e Anexo.
+
+    O upload é lido em blocos para calcular o SHA-256. Se o conteúdo já
+    existe, nada é gravado: o novo registro apenas aponta para o mesmo
+    caminho. A linha do conteúdo fica bloqueada até o fim da transação de
+    quem armazenou, o que impede o descarte de um conteúdo que acabou de
+    ganhar uma referência.
+
+    Conteúdos sem nenhuma referência (nem de registros excluídos
+    logicamente) são removidos por `descartar_sem_referencia`, chamado pelo
+    comando `coletar_orfaos`.
+    """
+
+    @staticmethod
+    def calcular_hash(arquivo: UploadedFile) -> str:
+        sha256 = hashlib.sha256()
+        for bloco in arquivo.chunks(chunk_size=TAMANHO_BLOCO_HASH):
+            sha256.update(bloco)
+        arquivo.seek(0)
+        return sha256.hexdigest()
+
+    @staticmethod
+    @transaction.atomic
+    def armazenar(arquivo: UploadedFile) -> ConteudoArquivo:
+        sha256 = ArmazenamentoService.calcular_hash(arquivo)
+        conteudo, _ = ConteudoArquivo.objects.select_for_update().get_or_create(
+            sha256=sha256,
+            defaults={'tamanho': arquivo.size},
+        )
+
+        storage = conteudo.arquivo.storage
+        if conteudo.arquivo.name and storage.exists(conteudo.arquivo.name):
+            return conteudo
+
+        nome = conteudo.arquivo.field.generate_filename(conteudo, arquivo.name)
+        if not storage.exists(nome):
+            nome = storage.save(nome, arquivo)
+        conteudo.arquivo.name = nome
+        conteudo.save(update_fields=['arquivo'])
+        return conteudo
+
+    @staticmethod
+    def sem_referencia(*, limite=None) -> QuerySet:
+        qs = ConteudoArquivo.objects.exclude(
+            Exists(Documento.all_objects.filter(conteudo=OuterRef('pk')))
+        ).exclude(
+            Exists(Anexo.all_objects.filter(conteudo=OuterRef('pk')))
+        )
+        if limite is not None:
+            qs = qs.filter(created_at__lt=limite)
+        return qs
+
+    @staticmethod
+    def descartar_sem_referencia(
+        *,
+        carencia: timedelta = CARENCIA_DESCARTE_PADRAO,
+        simular: bool = False
+    ) -> int:
+        limite = timezone.now() - carencia
+        if simular:
+            return ArmazenamentoService.sem_referencia(limite=limite).count()
+
+        with transaction.atomic():
+            # skip_locked: conteúdos bloqueados estão recebendo uma referência agora
+            conteudos = list(
+                ArmazenamentoService.sem_referencia(limite=limite)
+                .select_for_update(skip_locked=True)
+            )
+            nomes = [c.arquivo.name for c in conteudos if c.arquivo.name]
+            ConteudoArquivo.objects.filter(pk__in=[c.pk for c in conteudos]).delete()
+
+            storage = ConteudoArquivo._meta.get_field('arquivo').storage
+            transaction.on_commit(partial(ArmazenamentoService._remover_arquivos, storage, nomes))
+        return len(conteudos)
+
+    @staticmethod
+    def _remover_arquivos(storage, nomes: list) -> None:
+        for nome in nomes:
+            storage.delete(nome)
@@ -68,7 +68,7 @@ class ClienteService:
         pessoa_juridica = cliente.pessoa_juridica
         cliente.delete(user=user)
         if pessoa_juridica:
-            PessoaJuridicaService.delete(pessoa_juridica, user=user)
+            PessoaJuridicaService.delete(pessoa_juridica, user=user, lote=cliente.lote_exclusao)
 
     @staticmethod
     @transaction.atomic
@@ -1,7 +1,8 @@
+import uuid
 from typing import Optional, Any, Callable
-from datetime import timedelta
 from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, Q, QuerySet
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
 from ..models import (
@@ -10,6 +11,12 @@ from ..models import (
     PessoaFisicaContato, PessoaJuridicaContato, FilialContato
 )
 
+CAMPOS_CONTATO = ['tipo', 'valor', 'tem_whatsapp']
+CAMPOS_VINCULO_CONTATO = ['principal', 'contato_emergencia']
+
+# FKs de auditoria não são revalidadas no full_clean das operações em lote
+_CAMPOS_AUDITORIA = ['created_by', 'updated_by', 'deleted_by']
+
 class ContatoService:
 
     @classmethod
@@ -20,9 +27,17 @@ class ContatoService:
         lista_contatos: list, 
         user: Any,
         getter_func: Callable, 
-        remover_func: Callable, 
-        criador_func: Callable
+        model_vinculo,
+        campo_pai: str
     ):
+        """
+        Sincroniza os contatos de uma entidade com o payload recebido.
+
+        O diff é calculado em memória e aplicado em lote: um UPDATE para os
+        vínculos removidos, uma varredura de contatos órfãos, uma consulta de
+        unicidade (tipo, valor), bulk_update dos alterados e bulk_create dos
+        novos.
+        """
         if lista_contatos is None:
             return
 
@@ -39,10 +54,9 @@ class ContatoService:
 
         cls._validar_regras_negocio(existentes_map, lista_contatos)
 
-        for vinculo_id, vinculo in existentes_map.items():
-            if vinculo_id not in ids_recebidos_set:
-                remover_func(vinculo, user=user)
-
+        campos_vinculo = [c for c in CAMPOS_VINCULO_CONTATO if hasattr(model_vinculo, c)]
+        novos_contatos, novos_vinculos = [], []
+        vinculos_alterados, contatos_alterados = [], []
         for item in lista_contatos:
             item_id = str(item.get('id')) if item.get('id') else None
 
@@ -52,12 +66,54 @@ class ContatoService:
                 })
 
             if not item_id:
-                dados_create = {k:v for k,v in item.items() if k != 'id'}
-                criador_func(entidade_pai, user, **dados_create)
+                contato = Contato(
+                    created_by=user,
+                    **{k: v for k, v in item.items() if k in CAMPOS_CONTATO}
+                )
+                contato.full_clean(exclude=_CAMPOS_AUDITORIA, validate_unique=False, validate_constraints=False)
+                novos_contatos.append(contato)
+                novos_vinculos.append(model_vinculo(
+                    contato=contato,
+                    created_by=user,
+                    **{campo_pai: entidade_pai},
+                    **{k: v for k, v in item.items() if k in campos_vinculo}
+                ))
                 continue
 
             vinculo = existentes_map[item_id]
-            cls._atualizar_vinculo_existente(vinculo, item, user)
+            if cls._aplicar_campos(vinculo, item, campos_vinculo):
+                vinculos_alterados.append(vinculo)
+            if cls._aplicar_campos(vinculo.contato, item, CAMPOS_CONTATO):
+                vinculo.contato.full_clean(exclude=_CAMPOS_AUDITORIA, validate_unique=False, validate_constraints=False)
+                contatos_alterados.append(vinculo.contato)
+
+        agora = timezone.now()
+
+        removidos = [v for v_id, v in existentes_map.items() if v_id not in ids_recebidos_set]
+        if removidos:
+            lote = uuid.uuid4()
+            model_vinculo.objects.filter(pk__in=[v.pk for v in removidos]).delete(user=user, lote=lote)
+            cls._apagar_orfaos({v.contato_id for v in removidos}, user, lote)
+
+        cls._validar_unicidade(novos_contatos + contatos_alterados)
+
+        if vinculos_alterados:
+            # Desmarca primeiro quem deixa de ser principal (índice único parcial)
+            model_vinculo.objects.filter(
+                pk__in=[v.pk for v in vinculos_alterados if not v.principal]
+            ).update(principal=False)
+            for vinculo in vinculos_alterados:
+                vinculo.updated_by, vinculo.updated_at = user, agora
+            model_vinculo.objects.bulk_update(vinculos_alterados, campos_vinculo + ['updated_by', 'updated_at'])
+
+        if contatos_alterados:
+            for contato in contatos_alterados:
+                contato.updated_by, contato.updated_at = user, agora
+            Contato.objects.bulk_update(contatos_alterados, CAMPOS_CONTATO + ['updated_by', 'updated_at'])
+
+        if novos_contatos:
+            Contato.objects.bulk_create(novos_contatos)
+            model_vinculo.objects.bulk_create(novos_vinculos)
 
     @classmethod
     def _restaurar_vinculos_generico(
@@ -65,24 +121,15 @@ class ContatoService:
         model_vinculo, 
         campo_filho, 
         filtro_pai, 
-        data_delecao_pai, 
+        lote_exclusao, 
         user
     ):
-        if not data_delecao_pai: return
-        
-        margem = timedelta(seconds=5)
-        inicio, fim = data_delecao_pai - margem, data_delecao_pai + margem
-
-        vinculos = model_vinculo.objects.filter(
-            **filtro_pai,
-            deleted_at__range=(inicio, fim)
-        )
+        if not lote_exclusao: return
 
-        for vinculo in vinculos:
-            vinculo.restore(user=user)
-            contato = getattr(vinculo, campo_filho)
-            if contato.deleted_at and inicio <= contato.deleted_at <= fim:
-                contato.restore(user=user)
+        # Vínculos e contatos órfãos excluídos junto com o pai carregam o mesmo lote
+        model_vinculo.all_objects.filter(**filtro_pai).restaurar_lote(lote_exclusao, user)
+        modelo_filho = model_vinculo._meta.get_field(campo_filho).related_model
+        modelo_filho.all_objects.restaurar_lote(lote_exclusao, user)
 
     @classmethod
     def _validar_regras_negocio(cls, existentes_map, lista_contatos):
@@ -139,34 +186,31 @@ class ContatoService:
         if total_principais == 0 and len(lista_contatos) > 0:
             raise ValidationError({"contatos": ["É obrigatório ter pelo menos um contato marcado como principal."]})
 
-    @classmethod
-    def _atualizar_vinculo_existente(cls, vinculo, item_dict, user):
-        vinculo_mudou = False
-        
-        campos_vinculo = ['principal', 'contato_emergencia']
-        
-        for campo in campos_vinculo:
-            if campo in item_dict and hasattr(vinculo, campo):
-                valor_novo = item_dict[campo]
-                if getattr(vinculo, campo) != valor_novo:
-                    setattr(vinculo, campo, valor_novo)
-                    vinculo_mudou = True
-            
-        if vinculo_mudou:
-            vinculo.updated_by = user
-            vinculo.save()
+    @staticmethod
+    def _aplicar_campos(objeto, item_dict, campos) -> bool:
+        """Copia para `objeto` os `campos` presentes no payload. Retorna se algo mudou."""
+        mudou = False
+        for campo in campos:
+            if campo in item_dict and getattr(objeto, campo) != item_dict[campo]:
+                setattr(objeto, campo, item_dict[campo])
+                mudou = True
+        return mudou
 
-        contato_mudou = False
-        campos_contato = ['tipo', 'valor', 'tem_whatsapp']
-        
-        for key in campos_contato:
-            if key in item_dict and hasattr(vinculo.contato, key):
-                if getattr(vinculo.contato, key) != item_dict[key]:
-                    setattr(vinculo.contato, key, item_dict[key])
-                    contato_mudou = True
-        
-        if contato_mudou:
-            cls.update(vinculo.contato, updated_by=user, **item_dict)
+    @staticmethod
+    def _validar_unicidade(contatos: list) -> None:
+        """Verifica numa única consulta a unicidade de (tipo, valor) entre os contatos ativos."""
+        if not contatos:
+            return
+        filtro = Q()
+        for contato in contatos:
+            filtro |= Q(tipo=contato.tipo, valor=contato.valor)
+        em_uso = Contato.objects.filter(filtro).exclude(
+            pk__in=[c.pk for c in contatos]
+        ).values_list('valor', flat=True)
+        if em_uso:
+            raise ValidationError({
+                "contatos": [f"O contato '{valor}' já está cadastrado em outro registro." for valor in em_uso]
+            })
 
     @staticmethod
     def _get_assinatura_contato(dados_dict: Optional[dict] = None, obj_model: Optional[Contato] = None) -> tuple:
@@ -211,11 +255,24 @@ class ContatoService:
         return contato
 
     @staticmethod
-    def _verificar_e_apagar_orfao(contato: Contato, user) -> None:
-        if PessoaFisicaContato.objects.filter(contato=contato, deleted_at__isnull=True).exists(): return
-        if PessoaJuridicaContato.objects.filter(contato=contato, deleted_at__isnull=True).exists(): return
-        if FilialContato.objects.filter(contato=contato, deleted_at__isnull=True).exists(): return
-        contato.delete(user=user)
+    def _verificar_e_apagar_orfao(contato: Contato, user, lote=None) -> None:
+        ContatoService._apagar_orfaos([contato.pk], user, lote)
+
+    @staticmethod
+    def _apagar_orfaos(contato_ids, user, lote=None) -> int:
+        """
+        Exclui, num único UPDATE, os contatos sem nenhum vínculo ativo.
+
+        Ao contrário dos endereços, fica no caminho da requisição: o contato
+        órfão ainda ocupa (tipo, valor) na restrição única até ser excluído.
+        """
+        return Contato.objects.filter(pk__in=contato_ids).exclude(
+            Exists(PessoaFisicaContato.objects.filter(contato=OuterRef('pk')))
+        ).exclude(
+            Exists(PessoaJuridicaContato.objects.filter(contato=OuterRef('pk')))
+        ).exclude(
+            Exists(FilialContato.objects.filter(contato=OuterRef('pk')))
+        ).delete(user=user, lote=lote)
 
     # =========================================================================
     # 1. PESSOA FÍSICA (Gestão de Vínculos)
@@ -262,15 +319,15 @@ class ContatoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_pessoa_fisica(vinculo: PessoaFisicaContato, user=None) -> None:
+    def remove_vinculo_pessoa_fisica(vinculo: PessoaFisicaContato, user=None, lote=None) -> None:
         contato = vinculo.contato
-        vinculo.delete(user=user)
-        ContatoService._verificar_e_apagar_orfao(contato, user)
+        vinculo.delete(user=user, lote=lote)
+        ContatoService._verificar_e_apagar_orfao(contato, user, lote=vinculo.lote_exclusao)
 
     @classmethod
-    def restaurar_contatos_pessoa_fisica(cls, pessoa, data_delecao_pai, user):
+    def restaurar_contatos_pessoa_fisica(cls, pessoa, lote_exclusao, user):
         cls._restaurar_vinculos_generico(
-            PessoaFisicaContato, 'contato', {'pessoa_fisica': pessoa}, data_delecao_pai, user
+            PessoaFisicaContato, 'contato', {'pessoa_fisica': pessoa}, lote_exclusao, user
         )
 
     @classmethod
@@ -280,10 +337,8 @@ class ContatoService:
             lista_contatos=lista_contatos,
             user=user,
             getter_func=cls.get_contatos_pessoa_fisica,
-            remover_func=cls.remove_vinculo_pessoa_fisica,
-            criador_func=lambda ent, usr, **kw: cls.vincular_contato_pessoa_fisica(
-                pessoa_fisica=ent, created_by=usr, **kw
-            )
+            model_vinculo=PessoaFisicaContato,
+            campo_pai='pessoa_fisica'
         )
 
     # =========================================================================
@@ -329,15 +384,15 @@ class ContatoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_pessoa_juridica(vinculo: PessoaJuridicaContato, user=None) -> None:
+    def remove_vinculo_pessoa_juridica(vinculo: PessoaJuridicaContato, user=None, lote=None) -> None:
         contato = vinculo.contato
-        vinculo.delete(user=user)
-        ContatoService._verificar_e_apagar_orfao(contato, user)
+        vinculo.delete(user=user, lote=lote)
+        ContatoService._verificar_e_apagar_orfao(contato, user, lote=vinculo.lote_exclusao)
 
     @classmethod
-    def restaurar_contatos_pessoa_juridica(cls, pessoa, data_delecao_pai, user):
+    def restaurar_contatos_pessoa_juridica(cls, pessoa, lote_exclusao, user):
         cls._restaurar_vinculos_generico(
-            PessoaJuridicaContato, 'contato', {'pessoa_juridica': pessoa}, data_delecao_pai, user
+            PessoaJuridicaContato, 'contato', {'pessoa_juridica': pessoa}, lote_exclusao, user
         )
 
     @classmethod
@@ -347,10 +402,8 @@ class ContatoService:
             lista_contatos=lista_contatos,
             user=user,
             getter_func=cls.get_contatos_pessoa_juridica,
-            remover_func=cls.remove_vinculo_pessoa_juridica,
-            criador_func=lambda ent, usr, **kw: cls.vincular_contato_pessoa_juridica(
-                pessoa_juridica=ent, created_by=usr, **kw
-            )
+            model_vinculo=PessoaJuridicaContato,
+            campo_pai='pessoa_juridica'
         )
 
     # =========================================================================
@@ -396,15 +449,15 @@ class ContatoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_filial(vinculo: FilialContato, user=None) -> None:
+    def remove_vinculo_filial(vinculo: FilialContato, user=None, lote=None) -> None:
         contato = vinculo.contato
-        vinculo.delete(user=user)
-        ContatoService._verificar_e_apagar_orfao(contato, user)
+        vinculo.delete(user=user, lote=lote)
+        ContatoService._verificar_e_apagar_orfao(contato, user, lote=vinculo.lote_exclusao)
 
     @classmethod
-    def restaurar_contatos_filial(cls, filial, data_delecao_pai, user):
+    def restaurar_contatos_filial(cls, filial, lote_exclusao, user):
         cls._restaurar_vinculos_generico(
-            FilialContato, 'contato', {'filial': filial}, data_delecao_pai, user
+            FilialContato, 'contato', {'filial': filial}, lote_exclusao, user
         )
 
     @classmethod
@@ -414,8 +467,6 @@ class ContatoService:
             lista_contatos=lista_contatos,
             user=user,
             getter_func=cls.get_contatos_filial,
-            remover_func=cls.remove_vinculo_filial,
-            criador_func=lambda ent, usr, **kw: cls.vincular_contato_filial(
-                filial=ent, created_by=usr, **kw
-            )
+            model_vinculo=FilialContato,
+            campo_pai='filial'
         )
\ No newline at end of file
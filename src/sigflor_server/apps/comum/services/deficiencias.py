@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 from typing import List, Dict, Any
 from django.db import transaction
-from datetime import timedelta
 from django.db.models import QuerySet
 from rest_framework.exceptions import ValidationError
 
@@ -129,24 +128,20 @@ class PessoaFisicaDeficienciaService:
     def restaurar_deficiencias_pessoa_fisica(
         cls, 
         pessoa_fisica: PessoaFisica, 
-        data_delecao_pai: Any, 
+        lote_exclusao: Any, 
         user: Usuario
     ) -> None:
         
-        if not data_delecao_pai:
+        if not lote_exclusao:
             return
 
-        margem = timedelta(seconds=5)
-        inicio = data_delecao_pai - margem
-        fim = data_delecao_pai + margem
+        restaurados = PessoaFisicaDeficiencia.all_objects.filter(
+            pessoa_fisica=pessoa_fisica
+        ).restaurar_lote(lote_exclusao, user)
 
-        vinculos = PessoaFisicaDeficiencia.objects.filter(
-            pessoa_fisica=pessoa_fisica,
-            deleted_at__range=(inicio, fim)
-        )
-
-        for vinculo in vinculos:
-            vinculo.restore(user=user)
+        # O UPDATE em lote não passa pelo save(): recalcula a flag uma vez
+        if restaurados:
+            PessoaFisica.all_objects.filter(pk=pessoa_fisica.pk).update(possui_deficiencia=True)
 
     @classmethod
     @transaction.atomic
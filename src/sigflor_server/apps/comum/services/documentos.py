@@ -2,7 +2,7 @@ from typing import Optional
 from datetime import timedelta
 import puremagic
 from django.db import transaction
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, QuerySet
 from django.core.files.uploadedfile import UploadedFile
 from django.utils import timezone
 from datetime import timedelta
@@ -12,6 +12,8 @@ from ..models import (
     PessoaFisica, PessoaJuridica
 )
 from ..validators.documentos import validar_tipo_arquivo
+from .armazenamento import ArmazenamentoService
+from .vencimentos import VencimentoDocumentoService
 
 
 class DocumentoService:
@@ -56,10 +58,12 @@ class DocumentoService:
         
         metadados = DocumentoService._extrair_metadados_arquivo(arquivo)
         validar_tipo_arquivo(metadados['mimetype'])
+        conteudo = ArmazenamentoService.armazenar(arquivo)
 
         documento = Documento(
             tipo=tipo,
-            arquivo=arquivo,
+            arquivo=conteudo.arquivo.name,
+            conteudo=conteudo,
             descricao=descricao,
             data_emissao=data_emissao,
             data_validade=data_validade,
@@ -67,6 +71,7 @@ class DocumentoService:
             **metadados
         )
         documento.save()
+        VencimentoDocumentoService.invalidar()
         return documento
 
     @staticmethod
@@ -78,18 +83,17 @@ class DocumentoService:
                 setattr(documento, attr, value)
         documento.updated_by = updated_by
         documento.save()
+        VencimentoDocumentoService.invalidar()
         return documento
 
     @staticmethod
-    def _verificar_e_apagar_orfao(documento: Documento, user) -> None:
-
-        if PessoaFisicaDocumento.objects.filter(documento=documento, deleted_at__isnull=True).exists():
-            return
-        
-        if PessoaJuridicaDocumento.objects.filter(documento=documento, deleted_at__isnull=True).exists():
-            return
-
-        documento.delete(user=user)
+    def _verificar_e_apagar_orfao(documento: Documento, user, lote=None) -> None:
+        # Um único UPDATE com anti-join: o documento órfão sai das listagens de vencimento na hora
+        Documento.objects.filter(pk=documento.pk).exclude(
+            Exists(PessoaFisicaDocumento.objects.filter(documento=OuterRef('pk')))
+        ).exclude(
+            Exists(PessoaJuridicaDocumento.objects.filter(documento=OuterRef('pk')))
+        ).delete(user=user, lote=lote)
 
     # =========================================================================
     # 1. PESSOA FÍSICA (Gestão de Vínculos)
@@ -136,25 +140,18 @@ class DocumentoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_pessoa_fisica(vinculo: PessoaFisicaDocumento, user=None) -> None:
+    def remove_vinculo_pessoa_fisica(vinculo: PessoaFisicaDocumento, user=None, lote=None) -> None:
         documento = vinculo.documento
-        vinculo.delete(user=user)
-        DocumentoService._verificar_e_apagar_orfao(documento, user)
+        vinculo.delete(user=user, lote=lote)
+        DocumentoService._verificar_e_apagar_orfao(documento, user, lote=vinculo.lote_exclusao)
+        VencimentoDocumentoService.invalidar()
 
     @classmethod
-    def restaurar_documentos_pessoa_fisica(cls, pessoa, data_delecao_pai, user):
-        if not data_delecao_pai: return
-        margem = timedelta(seconds=5)
-        inicio, fim = data_delecao_pai - margem, data_delecao_pai + margem
-
-        vinculos = PessoaFisicaDocumento.objects.filter(
-            pessoa_fisica=pessoa,
-            deleted_at__range=(inicio, fim)
-        )
-        for vinculo in vinculos:
-            vinculo.restore(user=user)
-            if vinculo.documento.deleted_at and inicio <= vinculo.documento.deleted_at <= fim:
-                vinculo.documento.restore(user=user)
+    def restaurar_documentos_pessoa_fisica(cls, pessoa, lote_exclusao, user):
+        if not lote_exclusao: return
+        PessoaFisicaDocumento.all_objects.filter(pessoa_fisica=pessoa).restaurar_lote(lote_exclusao, user)
+        Documento.all_objects.restaurar_lote(lote_exclusao, user)
+        VencimentoDocumentoService.invalidar()
 
     # =========================================================================
     # 2. PESSOA JURÍDICA (Gestão de Vínculos)
@@ -201,25 +198,18 @@ class DocumentoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_pessoa_juridica(vinculo: PessoaJuridicaDocumento, user=None) -> None:
+    def remove_vinculo_pessoa_juridica(vinculo: PessoaJuridicaDocumento, user=None, lote=None) -> None:
         documento = vinculo.documento
-        vinculo.delete(user=user)
-        DocumentoService._verificar_e_apagar_orfao(documento, user)
+        vinculo.delete(user=user, lote=lote)
+        DocumentoService._verificar_e_apagar_orfao(documento, user, lote=vinculo.lote_exclusao)
+        VencimentoDocumentoService.invalidar()
 
     @classmethod
-    def restaurar_documentos_pessoa_juridica(cls, pessoa, data_delecao_pai, user):
-        if not data_delecao_pai: return
-        margem = timedelta(seconds=5)
-        inicio, fim = data_delecao_pai - margem, data_delecao_pai + margem
-
-        vinculos = PessoaJuridicaDocumento.objects.filter(
-            pessoa_juridica=pessoa,
-            deleted_at__range=(inicio, fim)
-        )
-        for vinculo in vinculos:
-            vinculo.restore(user=user)
-            if vinculo.documento.deleted_at and inicio <= vinculo.documento.deleted_at <= fim:
-                vinculo.documento.restore(user=user)
+    def restaurar_documentos_pessoa_juridica(cls, pessoa, lote_exclusao, user):
+        if not lote_exclusao: return
+        PessoaJuridicaDocumento.all_objects.filter(pessoa_juridica=pessoa).restaurar_lote(lote_exclusao, user)
+        Documento.all_objects.restaurar_lote(lote_exclusao, user)
+        VencimentoDocumentoService.invalidar()
 
     # =========================================================================
     # 3. QUERIES DE NEGÓCIO (Alertas e Validade)
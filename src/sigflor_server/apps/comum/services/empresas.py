@@ -64,7 +64,7 @@ class EmpresaService:
         pessoa_juridica = empresa.pessoa_juridica
         empresa.delete(user=user)
         if pessoa_juridica:
-            PessoaJuridicaService.delete(pessoa_juridica, user=user)
+            PessoaJuridicaService.delete(pessoa_juridica, user=user, lote=empresa.lote_exclusao)
 
     @staticmethod
     @transaction.atomic
@@ -1,7 +1,7 @@
 from typing import Optional, Any, Callable
-from datetime import timedelta
 from django.db import transaction
 from django.db.models import QuerySet
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
 from ..models import (
@@ -10,6 +10,15 @@ from ..models import (
     PessoaFisica, PessoaJuridica, Filial
 )
 
+CAMPOS_ENDERECO = [
+    'logradouro', 'numero', 'complemento', 'bairro',
+    'cidade', 'estado', 'cep', 'pais'
+]
+CAMPOS_VINCULO_ENDERECO = ['tipo', 'principal']
+
+# FKs de auditoria não são revalidadas no full_clean das operações em lote
+_CAMPOS_AUDITORIA = ['created_by', 'updated_by', 'deleted_by']
+
 class EnderecoService:
 
     @staticmethod
@@ -45,32 +54,14 @@ class EnderecoService:
     @transaction.atomic
     def update(endereco: Endereco, updated_by=None, **kwargs) -> Endereco:
 
-        campos_permitidos = [
-            'logradouro', 'numero', 'complemento', 'bairro',
-            'cidade', 'estado', 'cep', 'pais'
-        ]
         for attr, value in kwargs.items():
-            if attr in campos_permitidos and hasattr(endereco, attr):
+            if attr in CAMPOS_ENDERECO and hasattr(endereco, attr):
                 setattr(endereco, attr, value)
         
         endereco.updated_by = updated_by
         endereco.save()
         return endereco
 
-    @staticmethod
-    def _verificar_e_apagar_orfao(endereco: Endereco, user) -> None:
-
-        if PessoaFisicaEndereco.objects.filter(endereco=endereco, deleted_at__isnull=True).exists():
-            return
-        
-        if PessoaJuridicaEndereco.objects.filter(endereco=endereco, deleted_at__isnull=True).exists():
-            return
-
-        if FilialEndereco.objects.filter(endereco=endereco, deleted_at__isnull=True).exists():
-            return
-
-        endereco.delete(user=user)
-
     @classmethod
     @transaction.atomic
     def _sincronizar_vinculos_generico(
@@ -79,13 +70,18 @@ class EnderecoService:
         lista_enderecos: list, 
         user: Any,
         getter_func: Callable, 
-        remover_func: Callable, 
-        criador_func: Callable
+        model_vinculo,
+        campo_pai: str
     ):
         """
         Algoritmo genérico de sincronização de endereços.
         Funciona para qualquer entidade que tenha relacionamento N:N com Endereço
         e use tabelas intermediárias com campos 'tipo' e 'principal'.
+
+        O diff entre o payload e os vínculos atuais é calculado em memória e
+        aplicado em lote: um UPDATE para os vínculos removidos, bulk_update
+        dos vínculos e endereços alterados e bulk_create dos novos. Endereços
+        que ficam órfãos são excluídos depois pelo ColetorOrfaosService.
         """
         if lista_enderecos is None:
             return
@@ -102,10 +98,7 @@ class EnderecoService:
 
         cls._validar_regras_negocio(existentes_map, lista_enderecos)
 
-        for vinculo_id, vinculo in existentes_map.items():
-            if vinculo_id not in ids_recebidos_set:
-                remover_func(vinculo, user=user)
-
+        novos, vinculos_alterados, enderecos_alterados = [], [], []
         for item in lista_enderecos:
             item_id = str(item.get('id')) if item.get('id') else None
 
@@ -115,12 +108,55 @@ class EnderecoService:
                 })
 
             if not item_id:
-                dados_create = {k:v for k,v in item.items() if k != 'id'}
-                criador_func(entidade_pai, user, **dados_create)
+                novos.append(item)
                 continue
 
             vinculo = existentes_map[item_id]
-            cls._atualizar_vinculo_existente(vinculo, item, user)
+            if cls._aplicar_campos(vinculo, item, CAMPOS_VINCULO_ENDERECO):
+                vinculos_alterados.append(vinculo)
+            if cls._aplicar_campos(vinculo.endereco, item, CAMPOS_ENDERECO):
+                enderecos_alterados.append(vinculo.endereco)
+
+        agora = timezone.now()
+
+        removidos = [v for v_id, v in existentes_map.items() if v_id not in ids_recebidos_set]
+        if removidos:
+            model_vinculo.objects.filter(pk__in=[v.pk for v in removidos]).delete(user=user)
+
+        if vinculos_alterados:
+            # Desmarca primeiro quem deixa de ser principal (índice único parcial)
+            model_vinculo.objects.filter(
+                pk__in=[v.pk for v in vinculos_alterados if not v.principal]
+            ).update(principal=False)
+            for vinculo in vinculos_alterados:
+                vinculo.updated_by, vinculo.updated_at = user, agora
+            model_vinculo.objects.bulk_update(
+                vinculos_alterados, CAMPOS_VINCULO_ENDERECO + ['updated_by', 'updated_at']
+            )
+
+        if enderecos_alterados:
+            for endereco in enderecos_alterados:
+                endereco.updated_by, endereco.updated_at = user, agora
+                endereco.full_clean(exclude=_CAMPOS_AUDITORIA, validate_unique=False, validate_constraints=False)
+            Endereco.objects.bulk_update(enderecos_alterados, CAMPOS_ENDERECO + ['updated_by', 'updated_at'])
+
+        if novos:
+            enderecos, vinculos = [], []
+            for item in novos:
+                endereco = Endereco(
+                    created_by=user,
+                    **{k: v for k, v in item.items() if k in CAMPOS_ENDERECO}
+                )
+                endereco.full_clean(exclude=_CAMPOS_AUDITORIA, validate_unique=False, validate_constraints=False)
+                enderecos.append(endereco)
+                vinculos.append(model_vinculo(
+                    endereco=endereco,
+                    created_by=user,
+                    **{campo_pai: entidade_pai},
+                    **{k: v for k, v in item.items() if k in CAMPOS_VINCULO_ENDERECO}
+                ))
+            Endereco.objects.bulk_create(enderecos)
+            model_vinculo.objects.bulk_create(vinculos)
 
     @classmethod
     def _restaurar_vinculos_generico(
@@ -128,26 +164,19 @@ class EnderecoService:
         model_vinculo, 
         campo_filho, 
         filtro_pai, 
-        data_delecao_pai, 
+        lote_exclusao, 
         user
     ):
-        if not data_delecao_pai:
+        if not lote_exclusao:
             return
 
-        margem = timedelta(seconds=5)
-        inicio = data_delecao_pai - margem
-        fim = data_delecao_pai + margem
-
-        vinculos = model_vinculo.objects.filter(
-            **filtro_pai,
-            deleted_at__range=(inicio, fim)
-        )
+        vinculos = model_vinculo.all_objects.filter(**filtro_pai, lote_exclusao=lote_exclusao)
+        enderecos_ids = list(vinculos.values_list(campo_filho, flat=True))
+        vinculos.restaurar_lote(lote_exclusao, user)
 
-        for vinculo in vinculos:
-            vinculo.restore(user=user)
-            endereco = getattr(vinculo, campo_filho)
-            if endereco.deleted_at and inicio <= endereco.deleted_at <= fim:
-                endereco.restore(user=user)
+        # O endereço órfão é excluído pelo coletor em outro lote
+        modelo_filho = model_vinculo._meta.get_field(campo_filho).related_model
+        modelo_filho.all_objects.dead().filter(pk__in=enderecos_ids).restaurar(user)
 
     @classmethod
     def _validar_regras_negocio(cls, existentes_map, lista_enderecos):
@@ -209,34 +238,15 @@ class EnderecoService:
                 "enderecos": ["É obrigatório ter pelo menos um endereço marcado como principal."]
             })
 
-    @classmethod
-    def _atualizar_vinculo_existente(cls, vinculo, item_dict, user):
-
-        vinculo_mudou = False
-        
-        if 'tipo' in item_dict and vinculo.tipo != item_dict['tipo']:
-            vinculo.tipo = item_dict['tipo']
-            vinculo_mudou = True
-        
-        if 'principal' in item_dict and vinculo.principal != item_dict['principal']:
-            vinculo.principal = item_dict['principal']
-            vinculo_mudou = True
-            
-        if vinculo_mudou:
-            vinculo.updated_by = user
-            vinculo.save()
-
-        endereco_mudou = False
-        ignorar = ['id', 'tipo', 'principal']
-        
-        for key, value in item_dict.items():
-            if key not in ignorar and hasattr(vinculo.endereco, key):
-                if getattr(vinculo.endereco, key) != value:
-                    endereco_mudou = True
-                    break
-        
-        if endereco_mudou:
-            cls.update(vinculo.endereco, updated_by=user, **item_dict)
+    @staticmethod
+    def _aplicar_campos(objeto, item_dict, campos) -> bool:
+        """Copia para `objeto` os `campos` presentes no payload. Retorna se algo mudou."""
+        mudou = False
+        for campo in campos:
+            if campo in item_dict and getattr(objeto, campo) != item_dict[campo]:
+                setattr(objeto, campo, item_dict[campo])
+                mudou = True
+        return mudou
 
     @staticmethod
     def _get_assinatura_enderecos(dados_dict: Optional[dict] = None, obj_model: Optional[Endereco] = None) -> tuple:
@@ -318,18 +328,16 @@ class EnderecoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_pessoa_fisica(vinculo: PessoaFisicaEndereco, user=None) -> None:
-        endereco = vinculo.endereco
-        vinculo.delete(user=user)
-        EnderecoService._verificar_e_apagar_orfao(endereco, user)
+    def remove_vinculo_pessoa_fisica(vinculo: PessoaFisicaEndereco, user=None, lote=None) -> None:
+        vinculo.delete(user=user, lote=lote)
 
     @classmethod
-    def restaurar_enderecos_pessoa_fisica(cls, pessoa, data_delecao_pai, user):
+    def restaurar_enderecos_pessoa_fisica(cls, pessoa, lote_exclusao, user):
         cls._restaurar_vinculos_generico(
             model_vinculo=PessoaFisicaEndereco,
             campo_filho='endereco',
             filtro_pai={'pessoa_fisica': pessoa},
-            data_delecao_pai=data_delecao_pai,
+            lote_exclusao=lote_exclusao,
             user=user
         )
 
@@ -340,10 +348,8 @@ class EnderecoService:
             lista_enderecos=lista_enderecos,
             user=user,
             getter_func=cls.get_enderecos_pessoa_fisica,
-            remover_func=cls.remove_vinculo_pessoa_fisica,
-            criador_func=lambda ent, usr, **kw: cls.vincular_endereco_pessoa_fisica(
-                pessoa_fisica=ent, created_by=usr, **kw
-            )
+            model_vinculo=PessoaFisicaEndereco,
+            campo_pai='pessoa_fisica'
         )
 
     # =========================================================================
@@ -401,18 +407,16 @@ class EnderecoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_pessoa_juridica(vinculo: PessoaJuridicaEndereco, user=None) -> None:
-        endereco = vinculo.endereco
-        vinculo.delete(user=user)
-        EnderecoService._verificar_e_apagar_orfao(endereco, user)
+    def remove_vinculo_pessoa_juridica(vinculo: PessoaJuridicaEndereco, user=None, lote=None) -> None:
+        vinculo.delete(user=user, lote=lote)
 
     @classmethod
-    def restaurar_enderecos_pessoa_juridica(cls, pessoa, data_delecao_pai, user):
+    def restaurar_enderecos_pessoa_juridica(cls, pessoa, lote_exclusao, user):
         cls._restaurar_vinculos_generico(
             model_vinculo=PessoaJuridicaEndereco,
             campo_filho='endereco',
             filtro_pai={'pessoa_juridica': pessoa},
-            data_delecao_pai=data_delecao_pai,
+            lote_exclusao=lote_exclusao,
             user=user
         )   
 
@@ -423,10 +427,8 @@ class EnderecoService:
             lista_enderecos=lista_enderecos,
             user=user,
             getter_func=cls.get_enderecos_pessoa_juridica,
-            remover_func=cls.remove_vinculo_pessoa_juridica,
-            criador_func=lambda ent, usr, **kw: cls.vincular_endereco_pessoa_juridica(
-                pessoa_juridica=ent, created_by=usr, **kw
-            )
+            model_vinculo=PessoaJuridicaEndereco,
+            campo_pai='pessoa_juridica'
         )
 
     # =========================================================================
@@ -484,18 +486,16 @@ class EnderecoService:
 
     @staticmethod
     @transaction.atomic
-    def remove_vinculo_filial(vinculo: FilialEndereco, user=None) -> None:
-        endereco = vinculo.endereco
-        vinculo.delete(user=user)
-        EnderecoService._verificar_e_apagar_orfao(endereco, user)
+    def remove_vinculo_filial(vinculo: FilialEndereco, user=None, lote=None) -> None:
+        vinculo.delete(user=user, lote=lote)
 
     @classmethod
-    def restaurar_enderecos_filial(cls, filial, data_delecao_pai, user):
+    def restaurar_enderecos_filial(cls, filial, lote_exclusao, user):
         cls._restaurar_vinculos_generico(
             model_vinculo=FilialEndereco,
             campo_filho='endereco',
             filtro_pai={'filial': filial},
-            data_delecao_pai=data_delecao_pai,
+            lote_exclusao=lote_exclusao,
             user=user
         )
 
@@ -506,8 +506,6 @@ class EnderecoService:
             lista_enderecos=lista_enderecos,
             user=user,
             getter_func=cls.get_enderecos_filial,
-            remover_func=cls.remove_vinculo_filial,
-            criador_func=lambda ent, usr, **kw: cls.vincular_endereco_filial(
-                filial=ent, created_by=usr, **kw
-            )
+            model_vinculo=FilialEndereco,
+            campo_pai='filial'
         )
\ No newline at end of file
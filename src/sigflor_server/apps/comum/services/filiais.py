@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import transaction
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.exceptions import ValidationError
@@ -101,14 +103,16 @@ class FilialService:
                 "detail": "Não é possível excluir esta filial pois ela possui Projetos vinculados (ativos ou encerrados). Desative a filial se ela não for mais usada."
             })
 
+        lote = uuid.uuid4()
+
         for vinculo in filial.enderecos_vinculados.filter(deleted_at__isnull=True):
-            EnderecoService.remove_vinculo_filial(vinculo, user=user)
+            EnderecoService.remove_vinculo_filial(vinculo, user=user, lote=lote)
 
         for vinculo in filial.contatos_vinculados.filter(deleted_at__isnull=True):
-            ContatoService.remove_vinculo_filial(vinculo, user=user)
+            ContatoService.remove_vinculo_filial(vinculo, user=user, lote=lote)
             
         filial.usuarios_com_acesso.clear()
-        filial.delete(user=user)
+        filial.delete(user=user, lote=lote)
 
     @staticmethod
     @transaction.atomic
@@ -116,13 +120,13 @@ class FilialService:
 
         FilialService._verificar_acesso_filial(user, filial)
 
-        data_delecao = filial.deleted_at
+        lote = filial.lote_exclusao
         
         filial.restore(user=user)
 
-        if data_delecao:
-            EnderecoService.restaurar_enderecos_filial(filial, data_delecao, user)
-            ContatoService.restaurar_contatos_filial(filial, data_delecao, user)
+        if lote:
+            EnderecoService.restaurar_enderecos_filial(filial, lote, user)
+            ContatoService.restaurar_contatos_filial(filial, lote, user)
 
         return filial
 
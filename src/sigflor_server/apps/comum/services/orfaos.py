@@ -0,0 +1,89 @@
+import uuid
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils import timezone
+
+from ..models import Contato, Documento, Endereco
+from .vencimentos import VencimentoDocumentoService
+
+MODELOS_COLETADOS = (Endereco, Contato, Documento)
+
+CARENCIA_PADRAO = timedelta(hours=1)
+TAMANHO_LOTE_PADRAO = 1000
+
+
+class ColetorOrfaosService:
+    """
+    Coleta de endereços, contatos e documentos sem nenhum vínculo ativo.
+
+    As tabelas de vínculo são descobertas pelas FKs reversas de cada model
+    (PF, PJ e Filial hoje), e o órfão é encontrado com um anti-join
+    (`NOT EXISTS` por tabela). A exclusão é lógica, em lotes de
+    `tamanho_lote` linhas, e todas as linhas de um model recebem o mesmo
+    `lote_exclusao` (devolvido no relatório para eventual restauração).
+
+    A carência protege registros recém-criados que ainda vão ser
+    vinculados. Roda periodicamente pelo comando `coletar_orfaos`, o que
+    permite às desvinculações de endereço não verificarem órfãos na
+    requisição.
+    """
+
+    @staticmethod
+    def orfaos(modelo, *, limite=None) -> QuerySet:
+        qs = modelo.objects.all()
+        if limite is not None:
+            qs = qs.filter(updated_at__lt=limite)
+        for relacao in modelo._meta.related_objects:
+            if not relacao.one_to_many:
+                continue
+            vinculos = relacao.related_model.objects.filter(**{relacao.field.name: OuterRef('pk')})
+            qs = qs.exclude(Exists(vinculos))
+        return qs
+
+    @staticmethod
+    def coletar(
+        *,
+        carencia: timedelta = CARENCIA_PADRAO,
+        tamanho_lote: int = TAMANHO_LOTE_PADRAO,
+        simular: bool = False
+    ) -> dict:
+        """
+        Returns:
+            {'enderecos': {'coletados', 'lote_exclusao'}, 'contatos': {...},
+             'documentos': {...}}. Em simulação, apenas {'orfaos'} por model.
+        """
+        limite = timezone.now() - carencia
+        tamanho_lote = max(1, int(tamanho_lote))
+
+        relatorio = {}
+        for modelo in MODELOS_COLETADOS:
+            chave = modelo._meta.db_table
+            if simular:
+                relatorio[chave] = {'orfaos': ColetorOrfaosService.orfaos(modelo, limite=limite).count()}
+                continue
+
+            lote = uuid.uuid4()
+            coletados = 0
+            while True:
+                with transaction.atomic():
+                    ids = list(
+                        ColetorOrfaosService.orfaos(modelo, limite=limite)
+                        .values_list('pk', flat=True)[:tamanho_lote]
+                    )
+                    if not ids:
+                        break
+                    # O anti-join é refeito no UPDATE: um vínculo criado entre as duas consultas preserva a linha
+                    coletados += ColetorOrfaosService.orfaos(modelo, limite=limite).filter(
+                        pk__in=ids
+                    ).delete(lote=lote)
+
+            relatorio[chave] = {
+                'coletados': coletados,
+                'lote_exclusao': str(lote) if coletados else None,
+            }
+
+        if relatorio.get(Documento._meta.db_table, {}).get('coletados'):
+            VencimentoDocumentoService.invalidar()
+        return relatorio
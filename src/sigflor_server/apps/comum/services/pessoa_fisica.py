@@ -1,3 +1,4 @@
+import uuid
 from typing import Optional, List
 from django.db import transaction
 from django.core.exceptions import ValidationError
@@ -103,6 +104,12 @@ class PessoaFisicaService:
         pessoa.updated_by = updated_by
         pessoa.save()
 
+        if 'nome_completo' in kwargs or 'cpf' in kwargs:
+            # Nome e CPF fazem parte do texto de busca do funcionário vinculado
+            from apps.rh.busca import reindexar_funcionarios
+            from apps.rh.models import Funcionario
+            reindexar_funcionarios(Funcionario.all_objects.filter(pessoa_fisica=pessoa))
+
         if enderecos is not None:
             EnderecoService.atualizar_enderecos_pessoa_fisica(
                 pessoa, enderecos, updated_by
@@ -129,12 +136,14 @@ class PessoaFisicaService:
 
     @staticmethod
     @transaction.atomic
-    def delete(pessoa: PessoaFisica, user=None) -> None:
+    def delete(pessoa: PessoaFisica, user=None, lote=None) -> None:
+        lote = lote or uuid.uuid4()
+
         for vinculo in pessoa.enderecos_vinculados.filter(deleted_at__isnull=True):
-            EnderecoService.remove_vinculo_pessoa_fisica(vinculo, user=user)
+            EnderecoService.remove_vinculo_pessoa_fisica(vinculo, user=user, lote=lote)
 
         for vinculo in pessoa.contatos_vinculados.filter(deleted_at__isnull=True):
-            ContatoService.remove_vinculo_pessoa_fisica(vinculo, user=user)
+            ContatoService.remove_vinculo_pessoa_fisica(vinculo, user=user, lote=lote)
 
         # for vinculo in pessoa.documentos_vinculados.filter(deleted_at__isnull=True):
         #     DocumentoService.remove_vinculo_pessoa_fisica(vinculo, user=user)
@@ -143,12 +152,20 @@ class PessoaFisicaService:
         # for anexo in anexos:
         #     AnexoService.delete(anexo, user=user)
 
-        pessoa.delete(user=user)
+        pessoa.delete(user=user, lote=lote)
 
     @staticmethod
     @transaction.atomic
     def restore(pessoa: PessoaFisica, user=None) -> PessoaFisica:
+        lote = pessoa.lote_exclusao
         pessoa.restore(user=user)
+
+        if lote:
+            EnderecoService.restaurar_enderecos_pessoa_fisica(pessoa, lote, user)
+            ContatoService.restaurar_contatos_pessoa_fisica(pessoa, lote, user)
+            DocumentoService.restaurar_documentos_pessoa_fisica(pessoa, lote, user)
+            AnexoService.restaurar_anexos_entidade(pessoa, lote, user)
+
         return pessoa
 
     @staticmethod
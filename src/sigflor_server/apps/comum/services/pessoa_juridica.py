@@ -1,3 +1,4 @@
+import uuid
 from typing import Optional, List , Dict, Any
 from django.db import transaction
 
@@ -110,13 +111,14 @@ class PessoaJuridicaService:
 
     @staticmethod
     @transaction.atomic
-    def delete(pessoa: PessoaJuridica, user=None) -> None:
+    def delete(pessoa: PessoaJuridica, user=None, lote=None) -> None:
+        lote = lote or uuid.uuid4()
 
         for vinculo in pessoa.enderecos_vinculados.filter(deleted_at__isnull=True):
-            EnderecoService.remove_vinculo_pessoa_juridica(vinculo, user=user)
+            EnderecoService.remove_vinculo_pessoa_juridica(vinculo, user=user, lote=lote)
 
         for vinculo in pessoa.contatos_vinculados.filter(deleted_at__isnull=True):
-            ContatoService.remove_vinculo_pessoa_juridica(vinculo, user=user)
+            ContatoService.remove_vinculo_pessoa_juridica(vinculo, user=user, lote=lote)
 
         # for vinculo in pessoa.documentos_vinculados.filter(deleted_at__isnull=True):
         #     DocumentoService.remove_vinculo_pessoa_juridica(vinculo, user=user)
@@ -125,19 +127,19 @@ class PessoaJuridicaService:
         # for anexo in anexos:
         #     AnexoService.delete(anexo, user=user)
 
-        pessoa.delete(user=user)
+        pessoa.delete(user=user, lote=lote)
 
     @staticmethod
     @transaction.atomic
     def restore(pessoa: PessoaJuridica, user=None) -> PessoaJuridica:
-        data_delecao = pessoa.deleted_at
+        lote = pessoa.lote_exclusao
         pessoa.restore(user=user)
 
-        if data_delecao:
-            EnderecoService.restaurar_enderecos_pessoa_juridica(pessoa, data_delecao, user)
-            ContatoService.restaurar_contatos_pessoa_juridica(pessoa, data_delecao, user)
-            DocumentoService.restaurar_documentos_pessoa_juridica(pessoa, data_delecao, user)
-            AnexoService.restaurar_anexos_entidade(pessoa, data_delecao, user)
+        if lote:
+            EnderecoService.restaurar_enderecos_pessoa_juridica(pessoa, lote, user)
+            ContatoService.restaurar_contatos_pessoa_juridica(pessoa, lote, user)
+            DocumentoService.restaurar_documentos_pessoa_juridica(pessoa, lote, user)
+            AnexoService.restaurar_anexos_entidade(pessoa, lote, user)
 
         return pessoa
 
@@ -0,0 +1,119 @@
+from collections import defaultdict
+from datetime import date
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.autenticacao.models import Usuario
+from ..scope import FilialScope
+from ..selectors.documento import (
+    FAIXA_VENCIDO, FAIXAS_VENCIMENTO, documento_vencimento_queryset
+)
+
+CHAVE_VERSAO = 'comum:vencimentos:versao'
+CHAVE_RESUMO = 'comum:vencimentos:{versao}:{data}'
+
+# A data de referência faz parte da chave: o resumo "vira" à meia-noite mesmo sem escrita.
+RESUMO_TIMEOUT = 60 * 60 * 24
+
+FAIXAS = (FAIXA_VENCIDO, *(faixa for faixa, _ in FAIXAS_VENCIMENTO))
+
+
+class VencimentoDocumentoService:
+    """
+    Resumo de vencimento de documentos por filial, titular e faixa.
+
+    As contagens vêm de uma única agregação sobre
+    `documento_vencimento_queryset` e ficam em cache (globais, sem escopo)
+    até a próxima escrita de documento ou vínculo (ver `invalidar`) ou até a
+    virada do dia. O escopo de filiais do usuário é aplicado sobre o
+    resultado em cache. O comando `resumo_vencimentos_documentos` recalcula o
+    resumo de madrugada para que o primeiro acesso do dia não pague a consulta.
+
+    A troca de equipe de um funcionário não invalida o cache: a filial dos
+    seus documentos é atualizada na virada do dia.
+    """
+
+    @staticmethod
+    def resumo(*, user: Usuario = None, data_referencia: date = None) -> dict:
+        data_referencia = data_referencia or timezone.localdate()
+        grupos = VencimentoDocumentoService._grupos(data_referencia)
+
+        if user is not None:
+            escopo = FilialScope.for_user(user)
+            grupos = [
+                g for g in grupos
+                if g['filial_id'] is None or escopo.permite(g['filial_id'])
+            ]
+
+        totais = dict.fromkeys(FAIXAS, 0)
+        for grupo in grupos:
+            totais[grupo['faixa']] += grupo['total']
+
+        return {
+            'data_referencia': data_referencia,
+            'totais': totais,
+            'grupos': grupos,
+        }
+
+    @staticmethod
+    def recalcular(*, data_referencia: date = None) -> dict:
+        """Descarta o resumo em cache e o recalcula (uso noturno)."""
+        data_referencia = data_referencia or timezone.localdate()
+        chave = VencimentoDocumentoService._chave(data_referencia)
+        cache.delete(chave)
+        return VencimentoDocumentoService.resumo(data_referencia=data_referencia)
+
+    @staticmethod
+    def invalidar() -> None:
+        """Descarta os resumos em cache (após o commit da transação corrente)."""
+        def incrementar():
+            cache.add(CHAVE_VERSAO, 0, timeout=None)
+            try:
+                cache.incr(CHAVE_VERSAO)
+            except ValueError:
+                cache.set(CHAVE_VERSAO, 1, timeout=None)
+        transaction.on_commit(incrementar)
+
+    @staticmethod
+    def _chave(data_referencia: date) -> str:
+        return CHAVE_RESUMO.format(
+            versao=cache.get(CHAVE_VERSAO, 0),
+            data=data_referencia.isoformat()
+        )
+
+    @staticmethod
+    def _grupos(data_referencia: date) -> list[dict]:
+        chave = VencimentoDocumentoService._chave(data_referencia)
+        grupos = cache.get(chave)
+        if grupos is not None:
+            return grupos
+
+        contagens = defaultdict(dict)
+        nomes = {}
+        for linha in (
+            documento_vencimento_queryset(data_referencia=data_referencia)
+            .values('filial_ref', 'filial_nome', 'titular', 'faixa')
+            .annotate(total=Count('pk'))
+            .order_by()
+        ):
+            contagens[(linha['filial_ref'], linha['titular'])][linha['faixa']] = linha['total']
+            nomes[linha['filial_ref']] = linha['filial_nome']
+
+        grupos = [
+            {
+                'filial_id': filial_id,
+                'filial_nome': nomes[filial_id],
+                'titular': titular,
+                'faixa': faixa,
+                'total': total,
+            }
+            for (filial_id, titular), faixas in contagens.items()
+            for faixa, total in faixas.items()
+        ]
+        grupos.sort(key=lambda g: (g['filial_nome'] or '', g['titular'], FAIXAS.index(g['faixa'])))
+
+        cache.set(chave, grupos, timeout=RESUMO_TIMEOUT)
+        return grupos
@@ -0,0 +1,165 @@
+"""
+Fila de tarefas em segundo plano gravada no banco do projeto, sem broker.
+
+Enfileiramento: `enfileirar(funcao, **parametros)` grava uma `Tarefa` na
+transação corrente. Os workers só a enxergam depois do commit e ela some
+junto com um rollback, a mesma garantia de um `transaction.on_commit`, mas
+sem a janela em que o processo cai entre o commit e a gravação da tarefa.
+`funcao` precisa ser uma função de módulo (ou método estático) de `apps.*`;
+os parâmetros precisam ser serializáveis em JSON (passe ids, não objetos).
+
+Execução: o comando `processar_tarefas` roda N threads que reivindicam uma
+tarefa por vez (`SELECT ... FOR UPDATE SKIP LOCKED` onde o banco suporta,
+seguido de um UPDATE condicional que decide a posse nos demais). A função
+roda dentro de `transaction.atomic`: uma falha desfaz as gravações parciais
+antes da nova tentativa.
+
+Falhas: a tarefa volta para a fila com espera exponencial (`ESPERA_BASE`
+dobrando a cada tentativa, até `ESPERA_MAXIMA`) até `max_tentativas`. Erros
+de validação e registros inexistentes não mudam numa nova tentativa e
+encerram a tarefa como FALHOU na hora. Tarefas presas em EXECUTANDO por
+mais de `TEMPO_LIMITE_EXECUCAO` (worker derrubado) voltam para a fila.
+
+Métricas: cada execução grava `espera_ms` (fila) e `duracao_ms`
+(execução); `metricas()` agrega por função e status.
+"""
+
+import importlib
+import random
+import time
+import traceback
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import transaction
+from django.db.models import Avg, Count, F, Max
+from django.utils import timezone
+
+from .models import StatusTarefa, Tarefa
+
+ESPERA_BASE = timedelta(seconds=30)
+ESPERA_MAXIMA = timedelta(hours=1)
+TEMPO_LIMITE_EXECUCAO = timedelta(minutes=30)
+
+_ERROS_DEFINITIVOS = (ValidationError, ObjectDoesNotExist)
+
+
+def enfileirar(
+    funcao: Callable,
+    *,
+    atraso: Optional[timedelta] = None,
+    max_tentativas: Optional[int] = None,
+    **parametros
+) -> Tarefa:
+    caminho = _caminho(funcao)
+    if _resolver(caminho) != funcao:
+        raise ValueError(f'{caminho} não é acessível pelo caminho do módulo.')
+
+    tarefa = Tarefa(funcao=caminho, parametros=parametros)
+    if atraso:
+        tarefa.executar_apos = timezone.now() + atraso
+    if max_tentativas is not None:
+        tarefa.max_tentativas = max_tentativas
+    tarefa.save()
+    return tarefa
+
+
+def reivindicar(trabalhador: str) -> Optional[Tarefa]:
+    """Marca a próxima tarefa disponível como EXECUTANDO para `trabalhador`."""
+    agora = timezone.now()
+    with transaction.atomic():
+        candidatas = list(
+            Tarefa.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=StatusTarefa.PENDENTE, executar_apos__lte=agora)
+            .order_by('executar_apos')
+            .values_list('pk', flat=True)[:5]
+        )
+        for pk in candidatas:
+            # Sem suporte a SKIP LOCKED (SQLite), o UPDATE condicional decide quem leva
+            if Tarefa.objects.filter(pk=pk, status=StatusTarefa.PENDENTE).update(
+                status=StatusTarefa.EXECUTANDO,
+                tentativas=F('tentativas') + 1,
+                iniciada_em=agora,
+                trabalhador=trabalhador,
+            ):
+                return Tarefa.objects.get(pk=pk)
+    return None
+
+
+def executar(tarefa: Tarefa) -> Tarefa:
+    inicio = time.perf_counter()
+    try:
+        with transaction.atomic():
+            _resolver(tarefa.funcao)(**tarefa.parametros)
+    except Exception as erro:
+        definitivo = isinstance(erro, _ERROS_DEFINITIVOS) or tarefa.tentativas >= tarefa.max_tentativas
+        tarefa.status = StatusTarefa.FALHOU if definitivo else StatusTarefa.PENDENTE
+        tarefa.ultimo_erro = traceback.format_exc()
+        if not definitivo:
+            tarefa.executar_apos = timezone.now() + _espera(tarefa.tentativas)
+    else:
+        tarefa.status = StatusTarefa.CONCLUIDA
+        tarefa.ultimo_erro = ''
+
+    tarefa.duracao_ms = int((time.perf_counter() - inicio) * 1000)
+    tarefa.espera_ms = max(0, int((tarefa.iniciada_em - tarefa.created_at).total_seconds() * 1000))
+    tarefa.concluida_em = timezone.now() if tarefa.status == StatusTarefa.CONCLUIDA else None
+    tarefa.save(update_fields=[
+        'status', 'ultimo_erro', 'executar_apos', 'duracao_ms', 'espera_ms', 'concluida_em',
+    ])
+    return tarefa
+
+
+def recuperar_travadas(tempo_limite: timedelta = TEMPO_LIMITE_EXECUCAO) -> int:
+    """Devolve à fila as tarefas de workers que caíram no meio da execução."""
+    limite = timezone.now() - tempo_limite
+    travadas = Tarefa.objects.filter(status=StatusTarefa.EXECUTANDO, iniciada_em__lt=limite)
+    esgotadas = travadas.filter(tentativas__gte=F('max_tentativas')).update(
+        status=StatusTarefa.FALHOU,
+        ultimo_erro='Tempo limite de execução excedido.',
+    )
+    return esgotadas + travadas.update(
+        status=StatusTarefa.PENDENTE,
+        executar_apos=timezone.now(),
+        ultimo_erro='Tempo limite de execução excedido.',
+    )
+
+
+def metricas(desde=None) -> list[dict]:
+    """Totais e tempos (ms) por função e status, opcionalmente a partir de `desde`."""
+    qs = Tarefa.objects.all()
+    if desde is not None:
+        qs = qs.filter(created_at__gte=desde)
+    return list(
+        qs.values('funcao', 'status')
+        .annotate(
+            total=Count('id'),
+            duracao_media_ms=Avg('duracao_ms'),
+            duracao_max_ms=Max('duracao_ms'),
+            espera_media_ms=Avg('espera_ms'),
+            espera_max_ms=Max('espera_ms'),
+        )
+        .order_by('funcao', 'status')
+    )
+
+
+def _espera(tentativas: int) -> timedelta:
+    espera = min(ESPERA_BASE * 2 ** max(0, tentativas - 1), ESPERA_MAXIMA)
+    # Variação aleatória evita que falhas simultâneas voltem todas no mesmo instante
+    return espera * random.uniform(0.8, 1.2)
+
+
+def _caminho(funcao: Callable) -> str:
+    return f'{funcao.__module__}:{funcao.__qualname__}'
+
+
+def _resolver(caminho: str) -> Callable:
+    modulo, _, nome = caminho.partition(':')
+    if not modulo.startswith('apps.') or not nome or '<' in nome:
+        raise ValueError(f'Função de tarefa inválida: {caminho}')
+    alvo = importlib.import_module(modulo)
+    for parte in nome.split('.'):
+        alvo = getattr(alvo, parte)
+    return alvo
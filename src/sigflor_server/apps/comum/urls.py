@@ -7,7 +7,10 @@ from .views import (
     DeficienciaViewSet,
     FilialViewSet,
     ProjetoViewSet,
-    EnumsView
+    DocumentoVencimentoViewSet,
+    EnumsView,
+    EstatisticasFiliaisView,
+    MetricasView
 )
 
 router = DefaultRouter()
@@ -20,11 +23,17 @@ router.register(r'clientes', ClienteViewSet, basename='cliente')
 router.register(r'filiais', FilialViewSet, basename='filial')
 router.register(r'projetos', ProjetoViewSet, basename='projeto')
 
+# Alertas
+router.register(r'documentos-vencimento', DocumentoVencimentoViewSet, basename='documento-vencimento')
+
 
 
 router.register(r'deficiencias', DeficienciaViewSet, basename='deficiencia')
 
 urlpatterns = [
+    # Painel assíncrono: antes do router, na mesma URL da antiga action
+    path('filiais/estatisticas/', EstatisticasFiliaisView.as_view(), name='filial-estatisticas'),
     path('', include(router.urls)),
-    path("enums/", EnumsView.as_view(), name="enums")
+    path("enums/", EnumsView.as_view(), name="enums"),
+    path("metricas/", MetricasView.as_view(), name="metricas"),
 ]
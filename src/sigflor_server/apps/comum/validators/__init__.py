@@ -1,10 +1,14 @@
 from .contatos import ContatosValidator
 from .enderecos import EnderecoValidator
-from .documentos import validar_cnpj, validar_cpf, validar_tipo_arquivo
+from .documentos import (
+    completar_cnpj, completar_cpf, validar_cnpj, validar_cpf, validar_tipo_arquivo
+)
 
 __all__ = [
     'ContatosValidator',
     'EnderecoValidator',
+    'completar_cnpj',
+    'completar_cpf',
     'validar_cnpj',
     'validar_cpf',
     'validar_tipo_arquivo',
@@ -1,6 +1,32 @@
 from django.core.exceptions import ValidationError
 
 
+_PESOS_CNPJ = ([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2], [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+_PESOS_CPF = ([10, 9, 8, 7, 6, 5, 4, 3, 2], [11, 10, 9, 8, 7, 6, 5, 4, 3, 2])
+
+
+def _calcular_digito(base: str, pesos: list) -> int:
+    soma = sum(int(base[i]) * pesos[i] for i in range(len(pesos)))
+    resto = soma % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def _completar_digitos(base: str, pesos: tuple) -> str:
+    digito1 = _calcular_digito(base, pesos[0])
+    digito2 = _calcular_digito(f'{base}{digito1}', pesos[1])
+    return f'{base}{digito1}{digito2}'
+
+
+def completar_cnpj(base: str) -> str:
+    """Acrescenta os dígitos verificadores aos 12 primeiros dígitos de um CNPJ."""
+    return _completar_digitos(base, _PESOS_CNPJ)
+
+
+def completar_cpf(base: str) -> str:
+    """Acrescenta os dígitos verificadores aos 9 primeiros dígitos de um CPF."""
+    return _completar_digitos(base, _PESOS_CPF)
+
+
 def validar_cnpj(cnpj: str) -> None:
     """Valida CNPJ usando o algoritmo oficial."""
     if not cnpj or len(cnpj) != 14 or not cnpj.isdigit():
@@ -9,18 +35,7 @@ def validar_cnpj(cnpj: str) -> None:
     if len(set(cnpj)) == 1:
         raise ValidationError("CNPJ inválido: todos os dígitos são iguais.")
 
-    def calcular_digito(cnpj_base, pesos):
-        soma = sum(int(cnpj_base[i]) * pesos[i] for i in range(len(pesos)))
-        resto = soma % 11
-        return 0 if resto < 2 else 11 - resto
-
-    pesos1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    digito1 = calcular_digito(cnpj[:12], pesos1)
-
-    pesos2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    digito2 = calcular_digito(cnpj[:13], pesos2)
-
-    if int(cnpj[12]) != digito1 or int(cnpj[13]) != digito2:
+    if completar_cnpj(cnpj[:12]) != cnpj:
         raise ValidationError("CNPJ inválido: dígitos verificadores incorretos.")
 
 
@@ -32,18 +47,7 @@ def validar_cpf(cpf: str) -> None:
     if len(set(cpf)) == 1:
         raise ValidationError("CPF inválido: todos os dígitos são iguais.")
 
-    def calcular_digito(cpf_base, pesos):
-        soma = sum(int(cpf_base[i]) * pesos[i] for i in range(len(pesos)))
-        resto = soma % 11
-        return 0 if resto < 2 else 11 - resto
-
-    pesos1 = [10, 9, 8, 7, 6, 5, 4, 3, 2]
-    digito1 = calcular_digito(cpf[:9], pesos1)
-
-    pesos2 = [11, 10, 9, 8, 7, 6, 5, 4, 3, 2]
-    digito2 = calcular_digito(cpf[:10], pesos2)
-
-    if int(cpf[9]) != digito1 or int(cpf[10]) != digito2:
+    if completar_cpf(cpf[:9]) != cpf:
         raise ValidationError("CPF inválido: dígitos verificadores incorretos.")
 
 
@@ -1,21 +1,30 @@
 from .empresas import EmpresaViewSet
 from .clientes import ClienteViewSet
 from .documentos import DocumentoViewSet
+from .vencimentos import DocumentoVencimentoViewSet
 from .anexos import AnexoViewSet
 from .deficiencias import DeficienciaViewSet
 from .filiais import FilialViewSet
 from .projeto import ProjetoViewSet
 from .enums import EnumsView
-from .base import BaseRBACViewSet
+from .paineis import PainelAssincronoView, EstatisticasFiliaisView
+from .metricas import MetricasView
+from .base import BaseRBACViewSet, CamposEsparsosMixin, KeysetPaginatedMixin
 
 __all__ = [
     'EmpresaViewSet',
     'ClienteViewSet',
     'DocumentoViewSet',
+    'DocumentoVencimentoViewSet',
     'AnexoViewSet',
     'DeficienciaViewSet',
     'FilialViewSet',
     'ProjetoViewSet',
     'EnumsView',
-    'BaseRBACViewSet'
+    'PainelAssincronoView',
+    'EstatisticasFiliaisView',
+    'MetricasView',
+    'BaseRBACViewSet',
+    'KeysetPaginatedMixin',
+    'CamposEsparsosMixin',
 ]
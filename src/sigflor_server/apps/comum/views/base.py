@@ -1,6 +1,13 @@
+import hashlib
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from apps.comum.permissions import HasPermission
+from apps.comum.pagination import KeysetPagination
+from apps.comum.campos import campos_solicitados, projetar_queryset, serializer_esparso
 
 class BaseRBACViewSet(viewsets.ModelViewSet):
     """
@@ -38,4 +45,82 @@ class BaseRBACViewSet(viewsets.ModelViewSet):
         if permissoes_requeridas:
             permissao_classes.append(HasPermission(permissoes_requeridas))
             
-        return [permission() for permission in permissao_classes]
\ No newline at end of file
+        return [permission() for permission in permissao_classes]
+
+
+class KeysetPaginatedMixin:
+    """
+    Habilita a paginação por cursor (KeysetPagination) em um ViewSet
+    baseado em selectors, inclusive nas actions customizadas de listagem.
+
+    Atributos:
+        keyset_ordering (tuple): Chave de ordenação opcional. Se omitida,
+            usa a ordenação do queryset retornado pelo selector.
+    """
+    pagination_class = KeysetPagination
+    keyset_ordering = None
+
+    def listar_paginado(self, queryset, serializer_class):
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = serializer_class(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = serializer_class(queryset, many=True)
+        return Response(serializer.data)
+
+
+class CamposEsparsosMixin:
+    """
+    Habilita `?fields=a,b,c` nas listagens do ViewSet (ver apps/comum/campos.py).
+
+    O `list` e o `listar_paginado` das actions de listagem passam a reduzir o
+    serializer e a projeção do queryset aos campos pedidos. Deve vir antes de
+    KeysetPaginatedMixin na herança.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.listar_paginado(queryset, self.get_serializer_class())
+
+    def listar_paginado(self, queryset, serializer_class):
+        campos = campos_solicitados(self.request, serializer_class)
+        if campos is not None:
+            queryset = projetar_queryset(queryset, serializer_class, campos)
+            serializer_class = serializer_esparso(serializer_class, campos)
+
+        contexto = self.get_serializer_context()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = serializer_class(page, many=True, context=contexto)
+            return self.get_paginated_response(serializer.data)
+        serializer = serializer_class(queryset, many=True, context=contexto)
+        return Response(serializer.data)
+
+
+def detalhe_condicional(obter_versao):
+    """
+    Decorator de `retrieve` para GET condicional (ETag e Last-Modified).
+
+    `obter_versao(request, pk)` deve devolver, com uma consulta barata, o
+    datetime da última alteração do recurso (ou None para seguir o fluxo
+    normal da view). Se o cliente já tiver essa versão (If-None-Match ou
+    If-Modified-Since), a resposta é um 304 e o corpo do retrieve, com seus
+    prefetches e serializer, não é executado.
+
+    Uso no ViewSet:
+        @detalhe_condicional(lambda request, pk: selectors.x_versao(user=request.user, pk=pk))
+        def retrieve(self, request, pk=None): ...
+    """
+    def versao(request, pk=None, *args, **kwargs):
+        # Calculada uma única vez para o ETag e o Last-Modified
+        if not hasattr(request, '_versao_detalhe'):
+            request._versao_detalhe = obter_versao(request, pk)
+        return request._versao_detalhe
+
+    def etag(request, pk=None, *args, **kwargs):
+        valor = versao(request, pk)
+        if valor is None:
+            return None
+        return hashlib.sha256(f'{pk}:{valor.isoformat()}'.encode()).hexdigest()[:32]
+
+    return method_decorator(condition(etag_func=etag, last_modified_func=versao))
@@ -3,7 +3,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
-from .base import BaseRBACViewSet
+from .base import BaseRBACViewSet, CamposEsparsosMixin
 from ..serializers import (
     ClienteSerializer, 
     ClienteCreateSerializer,
@@ -16,7 +16,7 @@ from ..services import ClienteService
 from .. import selectors
 
 
-class ClienteViewSet(BaseRBACViewSet):
+class ClienteViewSet(CamposEsparsosMixin, BaseRBACViewSet):
 
     permissao_leitura = 'comum_clientes_ler'
     permissao_escrita = 'comum_clientes_escrever'
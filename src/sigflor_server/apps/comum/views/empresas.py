@@ -2,7 +2,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
-from .base import BaseRBACViewSet
+from .base import BaseRBACViewSet, CamposEsparsosMixin
 from ..models import Empresa
 from ..serializers import (
     EmpresaSerializer, 
@@ -15,7 +15,7 @@ from ..services import EmpresaService
 from .. import selectors
 
 
-class EmpresaViewSet(BaseRBACViewSet):
+class EmpresaViewSet(CamposEsparsosMixin, BaseRBACViewSet):
 
     permissao_leitura = 'comum_empresas_ler'
     permissao_escrita = 'comum_empresas_escrever'
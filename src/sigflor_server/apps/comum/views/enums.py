@@ -1,7 +1,40 @@
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from ..registro_enums import buscar_todos_enums
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.views import View
+
+from ..registro_enums import obter_registro
+
+
+class EnumsView(View):
+    """
+    Enums de todos os apps, servidos a partir do registro montado no startup.
+
+    Não passa pelo pipeline do DRF (autenticação, negociação, renderização):
+    devolve os bytes pré-serializados com ETag forte e responde 304 quando o
+    cliente envia o mesmo ETag em If-None-Match.
+    """
 
-class EnumsView(APIView):
     def get(self, request):
-        return Response(buscar_todos_enums())
+        registro = obter_registro()
+
+        if _etag_corresponde(request.headers.get('If-None-Match'), registro.etag):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(registro.conteudo, content_type='application/json')
+
+        response['ETag'] = registro.etag
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=getattr(settings, 'ENUMS_CACHE_MAX_AGE', 60 * 60 * 24)
+        )
+        return response
+
+
+def _etag_corresponde(cabecalho: str, etag: str) -> bool:
+    if not cabecalho:
+        return False
+    candidatos = {valor.strip() for valor in cabecalho.split(',')}
+    # If-None-Match usa comparação fraca: W/"x" corresponde a "x"
+    return '*' in candidatos or etag in candidatos or f'W/{etag}' in candidatos
@@ -2,7 +2,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
-from .base import BaseRBACViewSet
+from .base import BaseRBACViewSet, CamposEsparsosMixin
 from ..models import Filial
 from ..serializers import (
     FilialSerializer, 
@@ -15,7 +15,7 @@ from ..services import FilialService
 from .. import selectors
 
 
-class FilialViewSet(BaseRBACViewSet):
+class FilialViewSet(CamposEsparsosMixin, BaseRBACViewSet):
 
     permissao_leitura = 'comum_filiais_ler'
     permissao_escrita = 'comum_filiais_escrever'
@@ -25,7 +25,6 @@ class FilialViewSet(BaseRBACViewSet):
         'suspender': 'comum_filiais_escrever',
         'restaurar': 'comum_filiais_escrever',
         'ativas': 'comum_filiais_ler',
-        'estatisticas': 'comum_filiais_ler',
         'selecao': 'comum_filiais_ler',
     }
 
@@ -129,13 +128,6 @@ class FilialViewSet(BaseRBACViewSet):
         serializer = self.get_serializer(filial)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
-    @action(detail=False, methods=['get'])
-    def estatisticas(self, request):
-        stats = selectors.estatisticas_filiais(
-            user=request.user
-        )
-        return Response(stats, status=status.HTTP_200_OK)
-
     @action(detail=False, methods=['get'])
     def selecao(self, request):
         filiais = selectors.filial_list_selection(user=request.user)
@@ -0,0 +1,19 @@
+from django.http import HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from ..metricas import registro
+
+
+class MetricasView(APIView):
+    """
+    Métricas por endpoint do processo atual, no formato texto do Prometheus.
+    Restrito a usuários administradores (is_staff).
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(
+            registro.exportar(),
+            content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
@@ -0,0 +1,84 @@
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import exceptions
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.comum.permissions import HasPermission
+from .. import selectors
+
+
+class PainelAssincronoView(View):
+    """
+    Base das views assíncronas de painel (somente GET).
+
+    Fora do pipeline do DRF, como EnumsView, para que o handler seja `async`
+    e as consultas rodem com `em_paralelo` (apps/comum/assincrono.py). A
+    autenticação (JWT) e as permissões são as mesmas dos ViewSets, executadas
+    numa thread síncrona antes das consultas.
+
+    Atributos:
+        permissao (str): Código RBAC exigido, como em `permissoes_acoes`.
+            Sem código, valem as DEFAULT_PERMISSION_CLASSES.
+
+    Subclasses implementam `async def consultar(self, request, user) -> dict`.
+    """
+    permissao = None
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            user = await sync_to_async(self._autenticar)(request)
+        except exceptions.APIException as exc:
+            return self._resposta_erro(request, exc)
+
+        dados = await self.consultar(request, user)
+        return JsonResponse(dados, encoder=JSONEncoder, json_dumps_params={'ensure_ascii': False})
+
+    async def consultar(self, request, user) -> dict:
+        raise NotImplementedError
+
+    def _autenticar(self, request):
+        drf_request = Request(
+            request,
+            authenticators=[classe() for classe in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+        )
+
+        if self.permissao:
+            permissoes = [IsAuthenticated(), HasPermission(self.permissao)]
+        else:
+            permissoes = [classe() for classe in api_settings.DEFAULT_PERMISSION_CLASSES]
+
+        for permissao in permissoes:
+            if not permissao.has_permission(drf_request, self):
+                if drf_request.authenticators and not drf_request.successful_authenticator:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permissao, 'message', None))
+
+        return drf_request.user
+
+    def _resposta_erro(self, request, exc):
+        """Mesma resposta de erro dos ViewSets (ver APIView.handle_exception e core/exceptions.py)."""
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            autenticadores = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+            cabecalho = autenticadores[0]().authenticate_header(request) if autenticadores else None
+            if cabecalho:
+                exc.auth_header = cabecalho
+            else:
+                exc.status_code = 403
+
+        erro = api_settings.EXCEPTION_HANDLER(exc, {'view': self, 'request': request})
+        response = JsonResponse(erro.data, status=erro.status_code, encoder=JSONEncoder, safe=False)
+        for cabecalho in ('WWW-Authenticate', 'Retry-After'):
+            if erro.has_header(cabecalho):
+                response[cabecalho] = erro[cabecalho]
+        return response
+
+
+class EstatisticasFiliaisView(PainelAssincronoView):
+    permissao = 'comum_filiais_ler'
+
+    async def consultar(self, request, user) -> dict:
+        return await selectors.estatisticas_filiais_async(user=user)
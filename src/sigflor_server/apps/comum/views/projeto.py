@@ -2,7 +2,7 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
-from .base import BaseRBACViewSet
+from .base import BaseRBACViewSet, CamposEsparsosMixin, KeysetPaginatedMixin
 from ..models import Projeto
 from ..serializers import (
     ProjetoSerializer, 
@@ -14,7 +14,7 @@ from ..serializers import (
 from ..services import ProjetoService
 from .. import selectors
 
-class ProjetoViewSet(BaseRBACViewSet):
+class ProjetoViewSet(CamposEsparsosMixin, KeysetPaginatedMixin, BaseRBACViewSet):
     
     permissao_leitura = 'cadastros_projetos_ler'
     permissao_escrita = 'cadastros_projetos_escrever'
@@ -0,0 +1,66 @@
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.utils.dateparse import parse_date
+
+from .base import BaseRBACViewSet, KeysetPaginatedMixin
+from ..models import Documento
+from ..serializers import DocumentoVencimentoSerializer
+from ..services import VencimentoDocumentoService
+from .. import selectors
+
+
+class DocumentoVencimentoViewSet(KeysetPaginatedMixin, BaseRBACViewSet):
+    """
+    Painel de vencimento de documentos de funcionários e empresas.
+
+    - list: itens paginados por cursor, do vencimento mais antigo ao mais
+      distante. Filtros: filial_id, titular (FUNCIONARIO/EMPRESA), faixa
+      (VENCIDO, ATE_7_DIAS, ATE_30_DIAS, ATE_90_DIAS).
+    - resumo: contagens por filial, titular e faixa (em cache).
+    """
+
+    permissao_leitura = 'comum_documentos_ler'
+    permissoes_acoes = {
+        'resumo': 'comum_documentos_ler',
+    }
+    http_method_names = ['get', 'head', 'options']
+
+    queryset = Documento.objects.filter(deleted_at__isnull=True)
+    serializer_class = DocumentoVencimentoSerializer
+
+    def get_queryset(self):
+        params = self.request.query_params
+        return selectors.documento_vencimento_list(
+            user=self.request.user,
+            filial_id=params.get('filial_id'),
+            titular=params.get('titular'),
+            faixa=params.get('faixa'),
+        )
+
+    def list(self, request, *args, **kwargs):
+        return self.listar_paginado(self.get_queryset(), DocumentoVencimentoSerializer)
+
+    @action(detail=False, methods=['get'])
+    def resumo(self, request):
+        """
+        Contagens por filial, titular e faixa de vencimento.
+        Parâmetro opcional: data_referencia (AAAA-MM-DD).
+        """
+        data_referencia = request.query_params.get('data_referencia')
+        if data_referencia:
+            try:
+                data_referencia = parse_date(data_referencia)
+            except ValueError:  # bem formada, mas inexistente (ex: 2026-02-30)
+                data_referencia = None
+            if data_referencia is None:
+                return Response(
+                    {'data_referencia': ['Data inválida. Use AAAA-MM-DD.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        resumo = VencimentoDocumentoService.resumo(
+            user=request.user,
+            data_referencia=data_referencia
+        )
+        return Response(resumo)
@@ -6,3 +6,9 @@ class RhConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.rh'
     verbose_name = 'RH - Recursos Humanos'
+
+    def ready(self):
+        from django.db.models.signals import post_migrate
+        from .busca import criar_indice_trigram
+
+        post_migrate.connect(criar_indice_trigram, sender=self)
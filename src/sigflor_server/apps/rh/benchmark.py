@@ -0,0 +1,361 @@
+"""
+Medição dos selectors e services mais usados, para comparar commits.
+
+Cada caso (`@caso`) é preparado uma vez (escolhe os registros de trabalho)
+e executado `aquecimento` + `repeticoes` vezes; só as repetições entram na
+estatística. Por repetição são medidos o tempo total e, com o coletor de
+apps.comum.metricas, o número de consultas e o tempo gasto no banco.
+Consultas de selectors são materializadas (uma página de TAMANHO_PAGINA
+linhas, como na listagem paginada). Casos que gravam rodam numa transação
+desfeita ao final de cada repetição, então a base não muda entre execuções.
+
+O resultado é um dict serializável em JSON com os metadados da execução
+(commit, banco, volumes) e as medições por caso; `comparar` confronta dois
+resultados e aponta as variações. Um caso que falha registra o erro e não
+interrompe os demais.
+
+Os volumes vêm do banco configurado; para uma base comparável use o
+comando `gerar_dados_sinteticos` com a mesma escala e semente.
+"""
+
+import platform
+import statistics
+import subprocess
+import time
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from apps.comum import metricas
+
+TAMANHO_PAGINA = 50
+REPETICOES_PADRAO = 20
+AQUECIMENTO_PADRAO = 2
+
+# Variação do p50 (%) a partir da qual `comparar` marca o caso
+LIMIAR_VARIACAO_PADRAO = 10.0
+
+_CASOS = {}
+
+
+class _Desfazer(Exception):
+    """Interrompe a transação de um caso que grava, para desfazê-la."""
+
+
+def caso(nome: str, *, grava: bool = False):
+    """
+    Registra um caso. A função decorada recebe o usuário e retorna a
+    callable medida em cada repetição (a preparação fica fora da medição).
+    """
+    def decorator(preparar):
+        _CASOS[nome] = (preparar, grava)
+        return preparar
+    return decorator
+
+
+def casos_disponiveis() -> list[str]:
+    return list(_CASOS)
+
+
+# ----------------------------------------------------------------------
+# Casos
+# ----------------------------------------------------------------------
+
+@caso('rh.funcionario_list')
+def _funcionario_list(user):
+    from .selectors import funcionario_list
+    return lambda: list(funcionario_list(user=user)[:TAMANHO_PAGINA])
+
+
+@caso('rh.funcionario_list.busca')
+def _funcionario_list_busca(user):
+    from .models import Funcionario
+    from .selectors import funcionario_list
+
+    amostra = Funcionario.objects.select_related('pessoa_fisica').order_by('matricula').first()
+    termo = amostra.pessoa_fisica.nome_completo.split()[-1] if amostra else 'silva'
+    return lambda: list(funcionario_list(user=user, busca=termo)[:TAMANHO_PAGINA])
+
+
+@caso('rh.funcionario_detail')
+def _funcionario_detail(user):
+    from .selectors import funcionario_detail
+    pk = _funcionario_com_equipe().pk
+    return lambda: funcionario_detail(user=user, pk=pk)
+
+
+@caso('rh.aniversariantes_mes')
+def _aniversariantes_mes(user):
+    from .selectors import aniversariantes_mes
+    return lambda: list(aniversariantes_mes(user=user)[:TAMANHO_PAGINA])
+
+
+@caso('rh.equipe_list')
+def _equipe_list(user):
+    from .selectors import equipe_list
+    return lambda: list(equipe_list(user=user)[:TAMANHO_PAGINA])
+
+
+@caso('rh.estatisticas')
+def _estatisticas_rh(user):
+    from .selectors import estatisticas_rh
+    return lambda: estatisticas_rh(user=user)
+
+
+@caso('rh.estatisticas.async')
+def _estatisticas_rh_async(user):
+    from .selectors import estatisticas_rh_async
+    return lambda: async_to_sync(estatisticas_rh_async)(user=user)
+
+
+@caso('rh.dependentes.estatisticas')
+def _estatisticas_dependentes(user):
+    from .selectors import estatisticas_dependentes
+    return lambda: estatisticas_dependentes(user=user)
+
+
+@caso('comum.filiais.estatisticas')
+def _estatisticas_filiais(user):
+    from apps.comum.selectors import estatisticas_filiais
+    return lambda: estatisticas_filiais(user=user)
+
+
+@caso('sst.asos_periodicos.simulacao')
+def _asos_periodicos(user):
+    from apps.sst.services import AgendamentoASOService
+    return lambda: AgendamentoASOService.gerar_periodicos(simular=True)
+
+
+@caso('rh.equipe.adicionar_membro', grava=True)
+def _adicionar_membro(user):
+    from .models import Equipe
+    from .services import EquipeService
+
+    funcionario = _funcionario_com_equipe()
+    equipe = Equipe.objects.exclude(
+        membros__funcionario=funcionario
+    ).order_by('nome').first()
+    hoje = timezone.localdate()
+    return lambda: EquipeService.adicionar_membro(
+        equipe=equipe,
+        funcionario=funcionario,
+        data_entrada=hoje,
+        created_by=user,
+    )
+
+
+@caso('sst.aso.gerar_solicitacao', grava=True)
+def _gerar_solicitacao(user):
+    from apps.sst.models.enums import Tipo
+    from apps.sst.services import ASOService
+
+    funcionario = _funcionario_com_equipe(sem_aso_aberto=Tipo.PERIODICO)
+    return lambda: ASOService.gerar_solicitacao(
+        funcionario=funcionario,
+        tipo=Tipo.PERIODICO,
+        user=user,
+    )
+
+
+def _funcionario_com_equipe(*, sem_aso_aberto: str = None):
+    """
+    Funcionário ativo e alocado (determinístico, para comparar execuções).
+
+    Com `sem_aso_aberto`, ignora quem já tem ASO desse tipo em aberto, que
+    faria ASOService.gerar_solicitacao recusar a solicitação.
+    """
+    from apps.sst.models import ASO
+    from apps.sst.models.enums import Status
+    from .models import Funcionario
+    from .models.enums import StatusFuncionario
+
+    qs = Funcionario.objects.filter(
+        status=StatusFuncionario.ATIVO,
+        alocacoes_equipe__data_saida__isnull=True,
+    )
+    if sem_aso_aberto:
+        qs = qs.exclude(Exists(ASO.objects.filter(
+            funcionario=OuterRef('pk'),
+            tipo=sem_aso_aberto,
+            status__in=[Status.ABERTO, Status.EM_ANDAMENTO],
+            deleted_at__isnull=True,
+        )))
+
+    funcionario = qs.order_by('matricula').first()
+    if funcionario is None:
+        raise LookupError('Nenhum funcionário ativo alocado em equipe. Rode gerar_dados_sinteticos.')
+    return funcionario
+
+
+# ----------------------------------------------------------------------
+# Execução
+# ----------------------------------------------------------------------
+
+def executar(
+    *,
+    user,
+    casos: list[str] = None,
+    repeticoes: int = REPETICOES_PADRAO,
+    aquecimento: int = AQUECIMENTO_PADRAO,
+) -> dict:
+    """
+    Returns:
+        {'metadados': {...}, 'casos': {nome: medicoes}}
+    """
+    desconhecidos = set(casos or ()) - set(_CASOS)
+    if desconhecidos:
+        raise ValueError(f"Casos desconhecidos: {', '.join(sorted(desconhecidos))}")
+
+    _instrumentar()
+    inicio = timezone.now()
+    resultados = {}
+    for nome in casos or _CASOS:
+        preparar, grava = _CASOS[nome]
+        resultados[nome] = _medir(preparar, grava, user=user, repeticoes=repeticoes, aquecimento=aquecimento)
+
+    return {
+        'metadados': _metadados(inicio, repeticoes=repeticoes, aquecimento=aquecimento),
+        'casos': resultados,
+    }
+
+
+def _medir(preparar, grava: bool, *, user, repeticoes: int, aquecimento: int) -> dict:
+    tempos, consultas, tempos_banco = [], [], []
+    try:
+        funcao = preparar(user)
+        for indice in range(aquecimento + repeticoes):
+            with metricas.coletar() as coletor:
+                inicio = time.perf_counter()
+                _chamar(funcao, grava)
+                duracao = time.perf_counter() - inicio
+            if indice >= aquecimento:
+                tempos.append(duracao * 1000)
+                consultas.append(coletor.consultas)
+                tempos_banco.append(coletor.tempo_banco * 1000)
+    except Exception as erro:
+        return {'erro': f'{type(erro).__name__}: {erro}'}
+
+    tempos.sort()
+    return {
+        'repeticoes': len(tempos),
+        'min_ms': round(tempos[0], 3),
+        'p50_ms': round(statistics.median(tempos), 3),
+        'p95_ms': round(_percentil(tempos, 95), 3),
+        'max_ms': round(tempos[-1], 3),
+        'media_ms': round(statistics.fmean(tempos), 3),
+        'banco_media_ms': round(statistics.fmean(tempos_banco), 3),
+        'consultas': max(consultas),
+        'consultas_variam': min(consultas) != max(consultas),
+        'erro': None,
+    }
+
+
+def _chamar(funcao, grava: bool) -> None:
+    if not grava:
+        funcao()
+        return
+    try:
+        with transaction.atomic():
+            funcao()
+            raise _Desfazer
+    except _Desfazer:
+        pass
+
+
+def _percentil(valores_ordenados: list, percentil: float) -> float:
+    posicao = (len(valores_ordenados) - 1) * percentil / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(valores_ordenados) - 1)
+    fracao = posicao - inferior
+    return valores_ordenados[inferior] * (1 - fracao) + valores_ordenados[superior] * fracao
+
+
+def _instrumentar() -> None:
+    """Contagem de consultas mesmo com METRICAS_HABILITADAS desligado."""
+    metricas.instalar()
+    for conexao in connections.all(initialized_only=True):
+        metricas.instrumentar_conexao(conexao)
+
+
+def _metadados(inicio, *, repeticoes: int, aquecimento: int) -> dict:
+    from apps.comum.models import Filial, Projeto
+    from apps.sst.models import ASO, EntregaEPI
+    from .models import Dependente, Equipe, Funcionario
+
+    conexao = connections['default']
+    return {
+        'commit': _commit_atual(),
+        'inicio': inicio.isoformat(),
+        'duracao_s': round((timezone.now() - inicio) / timedelta(seconds=1), 3),
+        'repeticoes': repeticoes,
+        'aquecimento': aquecimento,
+        'python': platform.python_version(),
+        'banco': {
+            'vendor': conexao.vendor,
+            'versao': '.'.join(map(str, conexao.get_database_version())),
+        },
+        'volumes': {
+            'filiais': Filial.objects.count(),
+            'projetos': Projeto.objects.count(),
+            'funcionarios': Funcionario.objects.count(),
+            'dependentes': Dependente.objects.count(),
+            'equipes': Equipe.objects.count(),
+            'asos': ASO.objects.count(),
+            'entregas_epi': EntregaEPI.objects.count(),
+        },
+    }
+
+
+def _commit_atual():
+    try:
+        saida = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=5, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return saida.stdout.strip() or None
+
+
+# ----------------------------------------------------------------------
+# Comparação
+# ----------------------------------------------------------------------
+
+def comparar(atual: dict, base: dict, *, limiar: float = LIMIAR_VARIACAO_PADRAO) -> list[dict]:
+    """
+    Variação de cada caso presente nos dois resultados. `situacao` é
+    'pior'/'melhor' quando o p50 varia mais que `limiar` (%) ou o número de
+    consultas muda, 'igual' caso contrário e 'erro' se algum dos lados falhou.
+    """
+    linhas = []
+    for nome, medicao in atual['casos'].items():
+        anterior = base.get('casos', {}).get(nome)
+        if anterior is None:
+            continue
+        if medicao.get('erro') or anterior.get('erro'):
+            linhas.append({'caso': nome, 'situacao': 'erro'})
+            continue
+
+        variacao = (medicao['p50_ms'] - anterior['p50_ms']) / anterior['p50_ms'] * 100 if anterior['p50_ms'] else 0.0
+        delta_consultas = medicao['consultas'] - anterior['consultas']
+        if delta_consultas > 0 or variacao > limiar:
+            situacao = 'pior'
+        elif delta_consultas < 0 or variacao < -limiar:
+            situacao = 'melhor'
+        else:
+            situacao = 'igual'
+
+        linhas.append({
+            'caso': nome,
+            'situacao': situacao,
+            'p50_ms': medicao['p50_ms'],
+            'p50_ms_base': anterior['p50_ms'],
+            'variacao_p50_pct': round(variacao, 1),
+            'consultas': medicao['consultas'],
+            'consultas_base': anterior['consultas'],
+        })
+    return linhas
@@ -0,0 +1,121 @@
+"""
+Busca textual de funcionários.
+
+Cada funcionário guarda em `busca_texto` uma versão normalizada (minúscula,
+sem acentos e sem pontuação de documentos) de nome, CPF, matrícula e cargo,
+no formato ' nome cpf matricula cargo '. O espaço inicial permite testar
+"começa com" por palavra usando `contains(' ' + termo)`.
+
+No PostgreSQL a coluna recebe um índice GIN com `gin_trgm_ops` (pg_trgm),
+que atende `LIKE '%termo%'` sem varredura sequencial. No SQLite a mesma
+consulta roda sem índice especializado (fallback de desenvolvimento).
+"""
+
+import re
+import unicodedata
+
+from django.db import connections
+from django.db.models import Case, IntegerField, QuerySet, Value, When
+
+INDICE_TRIGRAM = 'funcionarios_busca_texto_trgm'
+
+_PONTUACAO_DOCUMENTO = re.compile(r'[.\-/]')
+_ESPACOS = re.compile(r'\s+')
+
+
+def normalizar_texto_busca(texto: str) -> str:
+    if not texto:
+        return ''
+    texto = unicodedata.normalize('NFKD', str(texto))
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    texto = _PONTUACAO_DOCUMENTO.sub('', texto.lower())
+    return _ESPACOS.sub(' ', texto).strip()
+
+
+def montar_texto_busca(funcionario) -> str:
+    partes = [
+        funcionario.pessoa_fisica.nome_completo,
+        funcionario.pessoa_fisica.cpf,
+        funcionario.matricula,
+        funcionario.cargo.nome if funcionario.cargo_id else '',
+    ]
+    return f" {normalizar_texto_busca(' '.join(p for p in partes if p))} "
+
+
+def buscar_funcionarios(qs: QuerySet, termo: str) -> QuerySet:
+    """
+    Filtra `qs` pelos tokens do termo (todos devem aparecer) e anota
+    `busca_rank` para ordenação:
+        0 - o nome começa com o primeiro token
+        1 - alguma palavra começa com o primeiro token
+        2 - o token aparece no meio de uma palavra
+    """
+    tokens = normalizar_texto_busca(termo).split(' ')
+    tokens = [t for t in tokens if t]
+    if not tokens:
+        return qs.annotate(busca_rank=Value(0, output_field=IntegerField()))
+
+    for token in tokens:
+        qs = qs.filter(busca_texto__contains=token)
+
+    primeiro = tokens[0]
+    return qs.annotate(
+        busca_rank=Case(
+            When(busca_texto__startswith=f' {primeiro}', then=Value(0)),
+            When(busca_texto__contains=f' {primeiro}', then=Value(1)),
+            default=Value(2),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def reindexar_funcionarios(qs: QuerySet = None, *, chunk_size: int = 1000) -> int:
+    """Recalcula `busca_texto` em lote. Retorna a quantidade de registros atualizados."""
+    from .models import Funcionario
+
+    if qs is None:
+        qs = Funcionario.all_objects.all()
+
+    qs = qs.select_related('pessoa_fisica', 'cargo').order_by('pk')
+
+    total = 0
+    lote = []
+    for funcionario in qs.iterator(chunk_size=chunk_size):
+        texto = montar_texto_busca(funcionario)
+        if funcionario.busca_texto != texto:
+            funcionario.busca_texto = texto
+            lote.append(funcionario)
+        if len(lote) >= chunk_size:
+            Funcionario.objects.bulk_update(lote, ['busca_texto'])
+            total += len(lote)
+            lote = []
+
+    if lote:
+        Funcionario.objects.bulk_update(lote, ['busca_texto'])
+        total += len(lote)
+
+    return total
+
+
+def criar_indice_trigram(sender=None, using='default', **kwargs) -> None:
+    """
+    Garante a extensão pg_trgm e o índice GIN de `busca_texto` (apenas PostgreSQL).
+    Conectado ao `post_migrate` do app rh; idempotente.
+    """
+    from .models import Funcionario
+
+    conexao = connections[using]
+    if conexao.vendor != 'postgresql':
+        return
+
+    tabela = Funcionario._meta.db_table
+    if tabela not in conexao.introspection.table_names():
+        return
+
+    with conexao.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS {INDICE_TRIGRAM} '
+            f'ON {tabela} USING gin (busca_texto gin_trgm_ops) '
+            f'WHERE deleted_at IS NULL'
+        )
@@ -0,0 +1,125 @@
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.rh import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        'Mede tempo e número de consultas dos selectors e services mais usados. '
+        'Gera JSON para comparação entre commits.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'casos',
+            nargs='*',
+            help='Casos a executar (padrão: todos). Veja --listar.'
+        )
+        parser.add_argument(
+            '--listar',
+            action='store_true',
+            help='Lista os casos disponíveis e sai.'
+        )
+        parser.add_argument(
+            '--repeticoes',
+            type=int,
+            default=benchmark.REPETICOES_PADRAO,
+            help='Execuções medidas por caso.'
+        )
+        parser.add_argument(
+            '--aquecimento',
+            type=int,
+            default=benchmark.AQUECIMENTO_PADRAO,
+            help='Execuções descartadas antes das medidas (cache do banco e do processo).'
+        )
+        parser.add_argument(
+            '--usuario',
+            help='Username usado nos selectors (padrão: o primeiro superusuário).'
+        )
+        parser.add_argument(
+            '--saida',
+            help='Grava o JSON neste arquivo em vez de imprimi-lo.'
+        )
+        parser.add_argument(
+            '--comparar',
+            help='JSON de uma execução anterior; inclui a comparação no resultado.'
+        )
+        parser.add_argument(
+            '--limiar',
+            type=float,
+            default=benchmark.LIMIAR_VARIACAO_PADRAO,
+            help='Variação do p50 (%%) considerada significativa na comparação.'
+        )
+
+    def handle(self, *args, **options):
+        if options['listar']:
+            for nome in benchmark.casos_disponiveis():
+                self.stdout.write(nome)
+            return
+
+        if options['repeticoes'] < 1 or options['aquecimento'] < 0:
+            raise CommandError('Use --repeticoes >= 1 e --aquecimento >= 0.')
+
+        base = None
+        if options['comparar']:
+            try:
+                base = json.loads(Path(options['comparar']).read_text(encoding='utf-8'))
+            except (OSError, ValueError) as erro:
+                raise CommandError(f"Não foi possível ler {options['comparar']}: {erro}")
+
+        try:
+            resultado = benchmark.executar(
+                user=self._usuario(options['usuario']),
+                casos=options['casos'] or None,
+                repeticoes=options['repeticoes'],
+                aquecimento=options['aquecimento'],
+            )
+        except ValueError as erro:
+            raise CommandError(str(erro))
+
+        if base is not None:
+            resultado['comparacao'] = {
+                'commit_base': base.get('metadados', {}).get('commit'),
+                'limiar_pct': options['limiar'],
+                'casos': benchmark.comparar(resultado, base, limiar=options['limiar']),
+            }
+
+        conteudo = json.dumps(resultado, ensure_ascii=False, indent=2)
+        if not options['saida']:
+            self.stdout.write(conteudo)
+            return
+
+        Path(options['saida']).write_text(conteudo + '\n', encoding='utf-8')
+        for nome, medicao in resultado['casos'].items():
+            if medicao['erro']:
+                self.stdout.write(self.style.ERROR(f"{nome}: {medicao['erro']}"))
+            else:
+                self.stdout.write(
+                    f"{nome}: p50 {medicao['p50_ms']} ms, p95 {medicao['p95_ms']} ms, "
+                    f"{medicao['consultas']} consulta(s)"
+                )
+        for linha in resultado.get('comparacao', {}).get('casos', []):
+            if linha['situacao'] in ('pior', 'melhor'):
+                estilo = self.style.WARNING if linha['situacao'] == 'pior' else self.style.SUCCESS
+                self.stdout.write(estilo(
+                    f"{linha['caso']}: {linha['situacao']} ({linha['variacao_p50_pct']:+}% p50, "
+                    f"{linha['consultas_base']} -> {linha['consultas']} consultas)"
+                ))
+        self.stdout.write(self.style.SUCCESS(f"Resultado gravado em {options['saida']}."))
+
+    def _usuario(self, username):
+        Usuario = get_user_model()
+        if username:
+            try:
+                return Usuario.objects.get(username=username)
+            except Usuario.DoesNotExist:
+                raise CommandError(f'Usuário {username} não encontrado.')
+
+        usuario = Usuario.objects.filter(is_superuser=True, is_active=True).order_by('pk').first()
+        if usuario is None:
+            raise CommandError('Nenhum superusuário ativo; informe --usuario.')
+        return usuario
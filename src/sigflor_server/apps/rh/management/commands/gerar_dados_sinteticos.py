@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.rh.sinteticos import TAMANHO_LOTE_PADRAO, VOLUMES_PADRAO, gerar
+
+
+class Command(BaseCommand):
+    help = (
+        'Popula o banco com dados sintéticos em volume (filiais, projetos, funcionários, '
+        'dependentes, equipes, ASOs e entregas de EPI) para medições de desempenho.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--escala',
+            type=float,
+            default=1.0,
+            help='Multiplicador dos volumes padrão (ex: 0.01 gera 1.000 funcionários).'
+        )
+        parser.add_argument(
+            '--semente',
+            type=int,
+            default=1,
+            help='Semente do gerador; a mesma semente gera os mesmos nomes e documentos.'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=TAMANHO_LOTE_PADRAO,
+            help='Quantidade de funcionários por lote de gravação.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas informa os volumes que seriam gerados.'
+        )
+
+    def handle(self, *args, **options):
+        if options['escala'] <= 0:
+            raise CommandError('A escala deve ser maior que zero.')
+
+        if options['dry_run']:
+            for chave, valor in VOLUMES_PADRAO.items():
+                self.stdout.write(f"{chave}: {max(1, int(valor * options['escala']))}")
+            return
+
+        relatorio = gerar(
+            escala=options['escala'],
+            tamanho_lote=options['chunk_size'],
+            semente=options['semente'],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            'Dados sintéticos gerados: '
+            + ', '.join(f'{valor} {chave}' for chave, valor in relatorio.items())
+            + '.'
+        ))
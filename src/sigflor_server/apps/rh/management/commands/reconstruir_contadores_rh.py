@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.rh.services.estatisticas import ContadorFuncionarioService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula a tabela de contadores de funcionários usada pelos dashboards do RH.'
+
+    def handle(self, *args, **options):
+        total = ContadorFuncionarioService.reconstruir()
+        self.stdout.write(self.style.SUCCESS(f'{total} contador(es) reconstruído(s).'))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.rh.busca import criar_indice_trigram, reindexar_funcionarios
+
+
+class Command(BaseCommand):
+    help = 'Recalcula o texto de busca normalizado de todos os funcionários.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Quantidade de registros por lote de atualização.'
+        )
+
+    def handle(self, *args, **options):
+        criar_indice_trigram()
+        total = reindexar_funcionarios(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'{total} funcionário(s) reindexado(s).'))
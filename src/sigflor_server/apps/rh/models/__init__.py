@@ -2,6 +2,7 @@ from .cargos import Cargo, CargoDocumento
 from .funcionarios import Funcionario
 from .dependentes import Dependente
 from .equipes import Equipe, EquipeFuncionario
+from .estatisticas import ContadorFuncionario
 from .enums import NivelCargo, RiscoPadrao, StatusFuncionario
 
 __all__ = [
@@ -11,6 +12,7 @@ __all__ = [
     'Dependente',
     'Equipe',
     'EquipeFuncionario',
+    'ContadorFuncionario',
     'RiscoPadrao',
     'NivelCargo',
     'StatusFuncionario',
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 
 from apps.comum.models.base import SoftDeleteModel
@@ -71,21 +71,30 @@ class Dependente(SoftDeleteModel):
         self._atualizar_flag_funcionario()
         return result
 
-    def delete(self, user=None):
-        result = super().delete(user=user)
+    def delete(self, user=None, lote=None):
+        result = super().delete(user=user, lote=lote)
         self._atualizar_flag_funcionario()
         return result
 
     def _atualizar_flag_funcionario(self):
+        """Mantém `Funcionario.tem_dependente` e os contadores do RH em dia."""
+        from ..services.estatisticas import ContadorFuncionarioService
         from .funcionarios import Funcionario
-        tem_dependentes = Dependente.objects.filter(
-            funcionario=self.funcionario,
-            ativo=True,
-            deleted_at__isnull=True
-        ).exists()
-        Funcionario.objects.filter(pk=self.funcionario_id).update(
-            tem_dependente=tem_dependentes
-        )
+
+        with transaction.atomic():
+            funcionario = Funcionario.all_objects.select_for_update().get(pk=self.funcionario_id)
+            tem_dependentes = Dependente.objects.filter(
+                funcionario=funcionario,
+                ativo=True,
+                deleted_at__isnull=True
+            ).exists()
+            if funcionario.tem_dependente == tem_dependentes:
+                return
+
+            estado_anterior = ContadorFuncionarioService.estado(funcionario)
+            funcionario.tem_dependente = tem_dependentes
+            Funcionario.all_objects.filter(pk=funcionario.pk).update(tem_dependente=tem_dependentes)
+            ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
 
     @property
     def nome_completo(self):
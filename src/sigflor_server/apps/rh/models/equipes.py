@@ -1,5 +1,5 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 
 from apps.comum.models.base import SoftDeleteModel
@@ -68,8 +68,31 @@ class Equipe(SoftDeleteModel):
         return self.nome
 
     def save(self, *args, **kwargs):
+        """Grava a equipe; na troca de projeto, move os membros ativos nos contadores do RH."""
+        from ..services.estatisticas import ContadorFuncionarioService
+        from .funcionarios import Funcionario
+
         self.full_clean()
-        return super().save(*args, **kwargs)
+        if self._state.adding:
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic():
+            projeto_anterior = Equipe.all_objects.filter(pk=self.pk).values_list('projeto_id', flat=True).first()
+            if projeto_anterior == self.projeto_id:
+                return super().save(*args, **kwargs)
+
+            membros = list(Funcionario.all_objects.select_for_update().filter(
+                pk__in=EquipeFuncionario.objects.filter(
+                    equipe=self,
+                    data_saida__isnull=True,
+                    deleted_at__isnull=True
+                ).values('funcionario_id')
+            ))
+            estados_anteriores = ContadorFuncionarioService.estados(membros)
+            result = super().save(*args, **kwargs)
+            for pk, estado in ContadorFuncionarioService.estados(membros).items():
+                ContadorFuncionarioService.registrar(estados_anteriores[pk], estado)
+        return result
 
     @property
     def membros_count(self):
@@ -143,8 +166,17 @@ class EquipeFuncionario(SoftDeleteModel):
         return f'{self.funcionario.nome} em {self.equipe.nome}'
 
     def save(self, *args, **kwargs):
+        """Grava a alocação e move o funcionário para a filial resultante nos contadores do RH."""
+        from ..services.estatisticas import ContadorFuncionarioService
+        from .funcionarios import Funcionario
+
         self.full_clean()
-        return super().save(*args, **kwargs)
+        with transaction.atomic():
+            funcionario = Funcionario.all_objects.select_for_update().get(pk=self.funcionario_id)
+            estado_anterior = ContadorFuncionarioService.estado(funcionario)
+            result = super().save(*args, **kwargs)
+            ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
+        return result
 
     @property
     def is_ativo(self):
@@ -0,0 +1,64 @@
+from django.db import models
+from django.db.models import Q
+
+from .enums import StatusFuncionario, TipoContrato
+
+
+class ContadorFuncionario(models.Model):
+    """
+    Totais pré-agregados de funcionários (não excluídos) por
+    (empresa, filial, status, tipo_contrato, cargo).
+
+    Mantido de forma incremental pelo ContadorFuncionarioService a cada
+    transição do FuncionarioService, na mesma transação. Os dashboards leem
+    estas poucas linhas em vez de agregar a tabela de funcionários.
+    Em caso de divergência, reconstruir com `reconstruir_contadores_rh`.
+    """
+
+    empresa = models.ForeignKey(
+        'comum.Empresa',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    filial = models.ForeignKey(
+        'comum.Filial',
+        on_delete=models.CASCADE,
+        related_name='+',
+        null=True,
+        blank=True,
+        help_text='Filial do projeto do funcionário (nulo quando sem projeto)'
+    )
+    cargo = models.ForeignKey(
+        'rh.Cargo',
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    status = models.CharField(max_length=30, choices=StatusFuncionario.choices)
+    tipo_contrato = models.CharField(max_length=30, choices=TipoContrato.choices)
+
+    quantidade = models.IntegerField(default=0)
+    com_dependentes = models.IntegerField(
+        default=0,
+        help_text='Quantos destes funcionários possuem dependentes ativos'
+    )
+
+    class Meta:
+        db_table = 'funcionarios_contadores'
+        verbose_name = 'Contador de Funcionários'
+        verbose_name_plural = 'Contadores de Funcionários'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['empresa', 'filial', 'cargo', 'status', 'tipo_contrato'],
+                condition=Q(filial__isnull=False),
+                name='uniq_contador_funcionario'
+            ),
+            # NULL não conflita em UNIQUE; a chave sem filial precisa da sua própria restrição
+            models.UniqueConstraint(
+                fields=['empresa', 'cargo', 'status', 'tipo_contrato'],
+                condition=Q(filial__isnull=True),
+                name='uniq_contador_funcionario_sem_filial'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.empresa_id} / {self.filial_id} / {self.status} / {self.tipo_contrato}: {self.quantidade}'
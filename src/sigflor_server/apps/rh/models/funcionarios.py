@@ -1,9 +1,13 @@
 import uuid
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Length
 from django.utils import timezone
 
+from apps.comum import sequencias
 from apps.comum.models.base import SoftDeleteModel
 from apps.comum.models.enums import UF
+from ..busca import montar_texto_busca
 from .enums import (
     TipoContrato, 
     StatusFuncionario,
@@ -13,6 +17,9 @@ from .enums import (
     TamanhoCalcado,
 )
 
+# Dígitos do sequencial anual da matrícula (AAAA + sequencial + dígito de controle)
+DIGITOS_SEQUENCIA_MATRICULA = 4
+
 
 class Funcionario(SoftDeleteModel):
 
@@ -168,6 +175,13 @@ class Funcionario(SoftDeleteModel):
         help_text='Tamanho do calçado (39, 40, 41, etc.)'
     )
 
+    busca_texto = models.TextField(
+        blank=True,
+        default='',
+        editable=False,
+        help_text='Nome, CPF, matrícula e cargo normalizados para busca (mantido no save)'
+    )
+
     class Meta:
         db_table = 'funcionarios'
         verbose_name = 'Funcionário'
@@ -187,29 +201,64 @@ class Funcionario(SoftDeleteModel):
             self.matricula = self._gerar_matricula()
         if self.salario_nominal is None and self.cargo and self.cargo.salario_base:
             self.salario_nominal = self.cargo.salario_base
+        self.busca_texto = montar_texto_busca(self)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'busca_texto' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'busca_texto']
         self.full_clean()
         return super().save(*args, **kwargs)
 
     def _gerar_matricula(self):
-        ano = timezone.now().year
-        ultimo = Funcionario.objects.filter(
+        return self.gerar_matriculas(1)[0]
+
+    @classmethod
+    def gerar_matriculas(cls, quantidade: int, *, ano: int = None) -> list[str]:
+        """
+        Gera `quantidade` matrículas do ano (padrão: o corrente) a partir da
+        sequência `funcionario.matricula.AAAA`.
+        """
+        ano = ano or timezone.now().year
+        chave = f'funcionario.matricula.{ano}'
+        inicial = lambda: cls._ultima_sequencia_matricula(ano)
+
+        if quantidade == 1:
+            numeros = [sequencias.proximo(chave, inicial=inicial)]
+        else:
+            primeiro = sequencias.reservar(chave, quantidade, inicial=inicial)
+            numeros = range(primeiro, primeiro + quantidade)
+
+        if numeros[-1] >= 10 ** DIGITOS_SEQUENCIA_MATRICULA:
+            raise ValidationError(
+                f'Sequencial de matrículas de {ano} esgotado '
+                f'({DIGITOS_SEQUENCIA_MATRICULA} dígitos).'
+            )
+
+        # Formato: AAAANNNND (Ano + Sequencial 4 dígitos + Dígito de controle)
+        matriculas = []
+        for n in numeros:
+            base = f'{ano}{n:0{DIGITOS_SEQUENCIA_MATRICULA}d}'
+            matriculas.append(f'{base}{cls._calcular_digito_controle(base)}')
+        return matriculas
+
+    @staticmethod
+    def _ultima_sequencia_matricula(ano: int) -> int:
+        """Maior sequencial já gravado no ano (inicializa o contador uma única vez)."""
+        # Tamanho antes do valor: em texto, '20269999X' viria antes de matrículas fora do formato, como '202610000X'
+        ultimo = Funcionario.all_objects.filter(
             matricula__startswith=str(ano)
-        ).order_by('-matricula').first()
+        ).annotate(
+            tamanho_matricula=Length('matricula')
+        ).order_by('-tamanho_matricula', '-matricula').first()
 
         if ultimo:
             try:
-                seq = int(ultimo.matricula[4:8]) + 1
+                return int(ultimo.matricula[4:-1])
             except ValueError:
-                seq = 1
-        else:
-            seq = 1
-
-        # Formato: AAAANNNND (Ano + Sequencial 4 dígitos + Dígito de controle)
-        base = f'{ano}{seq:04d}'
-        digito = self._calcular_digito_controle(base)
-        return f'{base}{digito}'
+                return 0
+        return 0
 
-    def _calcular_digito_controle(self, base: str) -> int:
+    @staticmethod
+    def _calcular_digito_controle(base: str) -> int:
         soma = sum(int(d) * (i + 1) for i, d in enumerate(base))
         return soma % 10
 
@@ -4,6 +4,7 @@ from django.db.models import Prefetch
 
 from ..models import Cargo, CargoDocumento, Funcionario
 from apps.autenticacao.models.usuarios import Usuario
+from .funcionario import _restringir_por_alocacao
 
 def cargo_list(
     *,
@@ -51,7 +52,7 @@ def cargo_detail(*, user: Usuario, pk: str) -> Cargo:
     ).get(pk=pk, deleted_at__isnull=True)
 
 def cargo_get_by_id_irrestrito(*, user: Usuario, pk: str) -> Optional[Cargo]:
-    return Cargo.objects.filter(pk=pk).first()
+    return Cargo.all_objects.filter(pk=pk).first()
 
 def cargo_list_selection(*, user: Usuario) -> QuerySet[Cargo]:
     return Cargo.objects.filter(
@@ -62,13 +63,9 @@ def funcionarios_por_cargo(*, user: Usuario, cargo_id: str) -> QuerySet[Funciona
     qs = Funcionario.objects.filter(
         cargo_id=cargo_id,
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'projeto')
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
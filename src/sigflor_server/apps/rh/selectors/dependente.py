@@ -1,8 +1,12 @@
-from django.db.models import QuerySet, Q, Count
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet, Q, Count, Sum
 from rest_framework.exceptions import PermissionDenied
 
-from ..models import Funcionario, Dependente
+from ..models import ContadorFuncionario, Funcionario, Dependente, EquipeFuncionario
 from apps.autenticacao.models.usuarios import Usuario
+from apps.comum.assincrono import em_paralelo, em_sequencia
+from apps.comum.scope import FilialScope
+from .funcionario import _restringir_por_alocacao
 
 # ============================================================================
 # Dependente Selectors
@@ -23,15 +27,10 @@ def dependente_list(
     ).select_related(
         'funcionario',
         'funcionario__pessoa_fisica',
-        'funcionario__projeto', # Necessário para o filtro regional
         'pessoa_fisica'
     )
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(funcionario__projeto__filial__in=user.allowed_filiais.all()) |
-            Q(funcionario__projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user, funcionario='funcionario_id')
 
     if apenas_ativos:
         qs = qs.filter(ativo=True)
@@ -59,14 +58,19 @@ def dependente_detail(*, user: Usuario, pk) -> Dependente:
     dependente = Dependente.objects.select_related(
         'funcionario',
         'funcionario__pessoa_fisica',
-        'funcionario__projeto',
         'pessoa_fisica'
     ).get(pk=pk, deleted_at__isnull=True)
 
-    if not user.is_superuser and dependente.funcionario.projeto:
-        if not user.allowed_filiais.filter(
-            id=dependente.funcionario.projeto.filial_id
-        ).exists():
+    # A filial do funcionário vem das suas alocações ativas em equipe
+    escopo = FilialScope.for_user(user)
+    if not escopo.irrestrito:
+        filiais = EquipeFuncionario.objects.filter(
+            funcionario_id=dependente.funcionario_id,
+            data_saida__isnull=True,
+            deleted_at__isnull=True
+        ).values_list('equipe__projeto__filial_id', flat=True)
+        filiais = list(filiais)
+        if filiais and not any(escopo.permite(filial_id) for filial_id in filiais):
             raise PermissionDenied("Usuário não tem acesso a este dependente.")
 
     return dependente
@@ -81,11 +85,7 @@ def dependentes_por_funcionario(*, user: Usuario, funcionario_id: str) -> QueryS
 
     # Validação de acesso já implícita se o usuário chegou até aqui via API do funcionário,
     # mas reforçamos por segurança
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(funcionario__projeto__filial__in=user.allowed_filiais.all()) |
-            Q(funcionario__projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user, funcionario='funcionario_id')
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
@@ -95,45 +95,40 @@ def funcionarios_com_dependentes(*, user: Usuario) -> QuerySet:
     qs = Funcionario.objects.filter(
         tem_dependente=True,
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'projeto')
+    ).select_related('pessoa_fisica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
 
-def estatisticas_dependentes(*, user: Usuario) -> dict:
-    """Retorna estatísticas de dependentes."""
+def _consultas_estatisticas_dependentes(user: Usuario) -> dict:
+    escopo = FilialScope.for_user(user)
     qs = Dependente.objects.filter(deleted_at__isnull=True, ativo=True)
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(funcionario__projeto__filial__in=user.allowed_filiais.all()) |
-            Q(funcionario__projeto__isnull=True)
-        ).distinct()
-
-    total = qs.count()
-    irrf = qs.filter(dependencia_irrf=True).count()
-
-    por_parentesco = qs.values('parentesco').annotate(
-        total=Count('id')
-    ).order_by('-total')
-
-    funcionarios_qs = Funcionario.objects.filter(tem_dependente=True, deleted_at__isnull=True)
-    if not user.is_superuser:
-        funcionarios_qs = funcionarios_qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        )
-    funcionarios_com_dep = funcionarios_qs.count()
+    qs = _restringir_por_alocacao(qs, user, funcionario='funcionario_id')
+
+    contadores = ContadorFuncionario.objects.all()
+    contadores = escopo.apply(contadores, path='filial', allow_null=True)
 
     return {
-        'total_dependentes': total,
-        'irrf': irrf,
-        'por_parentesco': list(por_parentesco),
-        'funcionarios_com_dependentes': funcionarios_com_dep,
+        'total_dependentes': qs.count,
+        'irrf': qs.filter(dependencia_irrf=True).count,
+        'por_parentesco': lambda: list(
+            qs.values('parentesco').annotate(total=Count('id')).order_by('-total')
+        ),
+        'funcionarios_com_dependentes': lambda: (
+            contadores.aggregate(total=Sum('com_dependentes'))['total'] or 0
+        ),
     }
+
+
+def estatisticas_dependentes(*, user: Usuario) -> dict:
+    """Retorna estatísticas de dependentes."""
+    return em_sequencia(_consultas_estatisticas_dependentes(user))
+
+
+async def estatisticas_dependentes_async(*, user: Usuario) -> dict:
+    """Mesmo resultado de `estatisticas_dependentes`, com as consultas em paralelo."""
+    consultas = await sync_to_async(_consultas_estatisticas_dependentes)(user)
+    return await em_paralelo(consultas)
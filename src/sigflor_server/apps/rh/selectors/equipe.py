@@ -1,8 +1,9 @@
-from django.db.models import QuerySet, Q
+from django.db.models import Count, QuerySet, Q
 from rest_framework.exceptions import PermissionDenied
 
 from ..models import Equipe, EquipeFuncionario
 from apps.autenticacao.models.usuarios import Usuario
+from apps.comum.scope import FilialScope
 
 # ============================================================================
 # Equipe Selectors
@@ -26,10 +27,14 @@ def equipe_list(
         'lider__pessoa_fisica',
         'coordenador',
         'coordenador__pessoa_fisica'
+    ).annotate(
+        membros_ativos=Count('membros', filter=Q(
+            membros__data_saida__isnull=True,
+            membros__deleted_at__isnull=True
+        ))
     )
 
-    if not user.is_superuser:
-        qs = qs.filter(projeto__filial__in=user.allowed_filiais.all()).distinct()
+    qs = FilialScope.for_user(user).apply(qs, path='projeto__filial')
 
     if apenas_ativas:
         qs = qs.filter(ativa=True)
@@ -64,9 +69,8 @@ def equipe_detail(*, user: Usuario, pk) -> Equipe:
         'membros__funcionario__pessoa_fisica'
     ).get(pk=pk, deleted_at__isnull=True)
 
-    if not user.is_superuser:
-        if not user.allowed_filiais.filter(id=equipe.projeto.filial_id).exists():
-            raise PermissionDenied("Usuário não tem acesso a esta equipe.")
+    if not FilialScope.for_user(user).permite(equipe.projeto.filial_id):
+        raise PermissionDenied("Usuário não tem acesso a esta equipe.")
 
     return equipe
 
@@ -82,8 +86,7 @@ def equipes_por_projeto(*, user: Usuario, projeto_id: str) -> QuerySet:
         'projeto__filial'
     )
 
-    if not user.is_superuser:
-        qs = qs.filter(projeto__filial__in=user.allowed_filiais.all()).distinct()
+    qs = FilialScope.for_user(user).apply(qs, path='projeto__filial')
 
     return qs.order_by('nome')
 
@@ -101,9 +104,7 @@ def membros_equipe(*, user: Usuario, equipe_id: str, apenas_ativos: bool = True)
     )
 
     # Validar permissão regional baseada na equipe
-    if not user.is_superuser:
-        # Se o usuário não tiver acesso à equipe, retorna vazio (ou poderia lançar erro)
-        qs = qs.filter(equipe__projeto__filial__in=user.allowed_filiais.all())
+    qs = FilialScope.for_user(user).apply(qs, path='equipe__projeto__filial')
 
     if apenas_ativos:
         qs = qs.filter(data_saida__isnull=True)
@@ -1,14 +1,38 @@
-from django.db.models import QuerySet, Q, Count
+from asgiref.sync import sync_to_async
+from django.db.models import Exists, F, Max, OuterRef, QuerySet, Q, Subquery, Sum
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied
 
-from ..models import Funcionario, enums
+from ..models import ContadorFuncionario, Dependente, EquipeFuncionario, Funcionario, enums
 from apps.autenticacao.models.usuarios import Usuario
+from apps.comum.models import PessoaFisicaContato, PessoaFisicaDocumento, PessoaFisicaEndereco
+from apps.comum.assincrono import em_paralelo, em_sequencia
+from apps.comum.scope import FilialScope
+from ..busca import buscar_funcionarios
 
 # ============================================================================
 # Funcionário Selectors
 # ============================================================================
 
+def _restringir_por_alocacao(qs: QuerySet, user: Usuario, *, funcionario: str = 'pk') -> QuerySet:
+    """Aplica o escopo de filial pela alocação ativa do funcionário em equipe.
+
+    `funcionario` é o caminho, a partir de `qs`, até o id do funcionário.
+    Funcionários sem alocação ativa continuam visíveis.
+    """
+    escopo = FilialScope.for_user(user)
+    if escopo.irrestrito:
+        return qs
+    alocacoes = EquipeFuncionario.objects.filter(
+        funcionario=OuterRef(funcionario),
+        data_saida__isnull=True,
+        deleted_at__isnull=True,
+    )
+    return qs.filter(
+        Exists(escopo.apply(alocacoes, path='equipe__projeto__filial')) | ~Exists(alocacoes)
+    )
+
 def funcionario_list(
     *,
     user: Usuario,
@@ -29,20 +53,14 @@ def funcionario_list(
         'cargo',
         'empresa',
         'empresa__pessoa_juridica',
-        'projeto',
-        'projeto__filial',
     )
 
     # # Filtro Regional (RBAC por Filial)
-    # if not user.is_superuser:
-    #     # O funcionário pertence a um projeto, que pertence a uma filial.
-    #     # Se o funcionário não tiver projeto, ele pode ficar "invisível" ou visível apenas para admin.
-    #     # Aqui assumimos que se tiver projeto, filtramos. Se não, permitimos (ou bloqueamos).
-    #     # Regra segura: Só mostra se estiver em projeto de filial permitida OU se não tiver projeto (staged).
-    #     qs = qs.filter(
-    #         Q(projeto__filial__in=user.allowed_filiais.all()) |
-    #         Q(projeto__isnull=True)
-    #     ).distinct()
+    # # O funcionário pertence a um projeto, que pertence a uma filial.
+    # # Se o funcionário não tiver projeto, ele pode ficar "invisível" ou visível apenas para admin.
+    # # Aqui assumimos que se tiver projeto, filtramos. Se não, permitimos (ou bloqueamos).
+    # # Regra segura: Só mostra se estiver em projeto de filial permitida OU se não tiver projeto (staged).
+    # qs = FilialScope.for_user(user).apply(qs, path='projeto__filial', allow_null=True)
 
     if apenas_ativos:
         qs = qs.filter(status=enums.StatusFuncionario.ATIVO)
@@ -63,15 +81,18 @@ def funcionario_list(
         qs = qs.filter(cargo_id=cargo_id)
 
     if projeto_id:
-        qs = qs.filter(projeto_id=projeto_id)
+        # O projeto do funcionário é o da sua alocação ativa em equipe
+        qs = qs.filter(Exists(EquipeFuncionario.objects.filter(
+            funcionario=OuterRef('pk'),
+            equipe__projeto_id=projeto_id,
+            data_saida__isnull=True,
+            deleted_at__isnull=True
+        )))
 
     if busca:
-        qs = qs.filter(
-            Q(pessoa_fisica__nome_completo__icontains=busca) |
-            Q(pessoa_fisica__cpf__icontains=busca) |
-            Q(matricula__icontains=busca) |
-            Q(cargo__nome__icontains=busca)
-        )
+        # Coluna normalizada com índice trigram (ver apps/rh/busca.py)
+        qs = buscar_funcionarios(qs, busca)
+        return qs.order_by('busca_rank', 'pessoa_fisica__nome_completo')
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
@@ -84,8 +105,6 @@ def funcionario_detail(*, user: Usuario, pk) -> Funcionario:
         'cargo',
         'empresa',
         'empresa__pessoa_juridica',
-        'projeto',
-        'projeto__filial',
     ).prefetch_related(
         # Correção dos caminhos de prefetch para usar as tabelas de vínculo corretas
         'pessoa_fisica__enderecos_vinculados__endereco',
@@ -93,46 +112,94 @@ def funcionario_detail(*, user: Usuario, pk) -> Funcionario:
         'pessoa_fisica__documentos_vinculados__documento',
         'dependentes',
         'dependentes__pessoa_fisica',
-        'alocacoes',
-        'alocacoes__projeto',
         'alocacoes_equipe',
-        'alocacoes_equipe__equipe'
+        'alocacoes_equipe__equipe__projeto'
     ).get(pk=pk, deleted_at__isnull=True)
 
-    if not user.is_superuser and funcionario.projeto:
-        if not user.allowed_filiais.filter(id=funcionario.projeto.filial_id).exists():
-            raise PermissionDenied("Usuário não tem acesso à filial deste funcionário.")
+    # O projeto (e a filial) do funcionário vem das alocações ativas em equipe
+    ativas = [
+        alocacao for alocacao in funcionario.alocacoes_equipe.all()
+        if alocacao.data_saida is None and alocacao.deleted_at is None
+    ]
+    escopo = FilialScope.for_user(user)
+    if ativas and not any(escopo.permite(a.equipe.projeto.filial_id) for a in ativas):
+        raise PermissionDenied("Usuário não tem acesso à filial deste funcionário.")
 
     return funcionario
 
 
+def funcionario_versao(*, user: Usuario, pk):
+    """
+    Versão do detalhe do funcionário para requisições condicionais (ETag/Last-Modified).
+
+    É o maior `updated_at` entre o funcionário, a pessoa física, o cargo, a
+    empresa (e sua pessoa jurídica) e as linhas que o retrieve pré-carrega
+    (vínculos de endereço, contato e documento, dependentes e alocações em
+    equipe, com os registros vinculados), numa única consulta sem instanciar
+    nada. Vínculos removidos também contam, já
+    que a exclusão lógica atualiza o `updated_at`.
+
+    Retorna None se o funcionário não existir ou estiver fora do escopo do
+    usuário; nesse caso a view segue o fluxo normal (404/403).
+    """
+    def ultima_alteracao(modelo, campo, relacionado, outer):
+        return Coalesce(
+            Subquery(
+                modelo.all_objects.filter(**{campo: OuterRef(outer)})
+                .values(campo)
+                .annotate(versao=Max(Greatest('updated_at', f'{relacionado}__updated_at')))
+                .values('versao')[:1]
+            ),
+            F('updated_at')
+        )
+
+    qs = Funcionario.objects.filter(pk=pk, deleted_at__isnull=True)
+
+    qs = _restringir_por_alocacao(qs, user)
+
+    return qs.annotate(
+        versao=Greatest(
+            'updated_at',
+            'pessoa_fisica__updated_at',
+            'cargo__updated_at',
+            'empresa__updated_at',
+            'empresa__pessoa_juridica__updated_at',
+            ultima_alteracao(PessoaFisicaEndereco, 'pessoa_fisica', 'endereco', 'pessoa_fisica_id'),
+            ultima_alteracao(PessoaFisicaContato, 'pessoa_fisica', 'contato', 'pessoa_fisica_id'),
+            ultima_alteracao(PessoaFisicaDocumento, 'pessoa_fisica', 'documento', 'pessoa_fisica_id'),
+            ultima_alteracao(Dependente, 'funcionario', 'pessoa_fisica', 'pk'),
+            ultima_alteracao(EquipeFuncionario, 'funcionario', 'equipe', 'pk'),
+        )
+    ).values_list('versao', flat=True).first()
+
+
 def funcionarios_por_empresa(*, user: Usuario, empresa_id: str) -> QuerySet:
     """Lista funcionários de uma empresa específica."""
     qs = Funcionario.objects.filter(
         empresa_id=empresa_id,
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'cargo', 'projeto')
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
 
 def funcionarios_por_projeto(*, user: Usuario, projeto_id: str) -> QuerySet:
     """Lista funcionários de um projeto específico."""
+    # O projeto do funcionário é o da sua alocação ativa em equipe
+    alocacoes = EquipeFuncionario.objects.filter(
+        funcionario=OuterRef('pk'),
+        equipe__projeto_id=projeto_id,
+        data_saida__isnull=True,
+        deleted_at__isnull=True,
+    )
+    alocacoes = FilialScope.for_user(user).apply(alocacoes, path='equipe__projeto__filial')
+
     qs = Funcionario.objects.filter(
-        projeto_id=projeto_id,
+        Exists(alocacoes),
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'cargo')
-
-    if not user.is_superuser:
-        # Verifica se o usuário tem acesso à filial do projeto solicitado
-        # Como estamos filtrando por um projeto específico, podemos checar a filial dele indiretamente
-        qs = qs.filter(projeto__filial__in=user.allowed_filiais.all()).distinct()
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
@@ -142,13 +209,9 @@ def funcionarios_ativos(*, user: Usuario) -> QuerySet:
     qs = Funcionario.objects.filter(
         status=enums.StatusFuncionario.ATIVO,
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'cargo', 'projeto')
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
@@ -158,13 +221,9 @@ def funcionarios_afastados(*, user: Usuario) -> QuerySet:
     qs = Funcionario.objects.filter(
         status__in=[enums.StatusFuncionario.AFASTADO, enums.StatusFuncionario.FERIAS],
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'cargo', 'projeto')
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('pessoa_fisica__nome_completo')
 
@@ -175,13 +234,9 @@ def funcionarios_admitidos_periodo(*, user: Usuario, data_inicio, data_fim) -> Q
         data_admissao__gte=data_inicio,
         data_admissao__lte=data_fim,
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'cargo', 'projeto')
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('-data_admissao')
 
@@ -192,13 +247,9 @@ def funcionarios_demitidos_periodo(*, user: Usuario, data_inicio, data_fim) -> Q
         data_demissao__gte=data_inicio,
         data_demissao__lte=data_fim,
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'cargo', 'projeto')
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('-data_demissao')
 
@@ -212,55 +263,103 @@ def aniversariantes_mes(*, user: Usuario, mes: int = None) -> QuerySet:
         pessoa_fisica__data_nascimento__month=mes,
         status=enums.StatusFuncionario.ATIVO,
         deleted_at__isnull=True
-    ).select_related('pessoa_fisica', 'projeto')
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
-        qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
+    qs = _restringir_por_alocacao(qs, user)
 
     return qs.order_by('pessoa_fisica__data_nascimento__day')
 
 
-def estatisticas_rh(*, user: Usuario) -> dict:
-    """Retorna estatísticas gerais do RH."""
-    qs = Funcionario.objects.filter(deleted_at__isnull=True)
+def funcionarios_pendencias_admissao(
+    *,
+    user: Usuario,
+    projeto_id: str = None,
+    empresa_id: str = None,
+    cargo_id: str = None
+) -> QuerySet:
+    """
+    Funcionários aguardando admissão, para o painel de pendências.
+    O vínculo com projeto (e a filial do escopo) vem da alocação ativa em equipe.
+    """
+    qs = Funcionario.objects.filter(
+        status=enums.StatusFuncionario.AGUARDANDO_ADMISSAO,
+        deleted_at__isnull=True
+    ).select_related('pessoa_fisica', 'cargo', 'empresa__pessoa_juridica')
 
-    if not user.is_superuser:
+    alocacoes = EquipeFuncionario.objects.filter(
+        funcionario=OuterRef('pk'),
+        data_saida__isnull=True,
+        deleted_at__isnull=True
+    )
+
+    escopo = FilialScope.for_user(user)
+    if not escopo.irrestrito:
         qs = qs.filter(
-            Q(projeto__filial__in=user.allowed_filiais.all()) |
-            Q(projeto__isnull=True)
-        ).distinct()
-
-    total = qs.count()
-    ativos = qs.filter(status=enums.StatusFuncionario.ATIVO).count()
-    afastados = qs.filter(status__in=[
-        enums.StatusFuncionario.AFASTADO,
-        enums.StatusFuncionario.FERIAS
-    ]).count()
-
-    por_tipo_contrato = qs.filter(
-        status=enums.StatusFuncionario.ATIVO
-    ).values('tipo_contrato').annotate(
-        total=Count('id')
-    ).order_by('-total')
-
-    por_cargo = qs.filter(
-        status=enums.StatusFuncionario.ATIVO
-    ).values('cargo__nome').annotate(
-        total=Count('id')
-    ).order_by('-total')[:10]
+            Exists(escopo.apply(alocacoes, path='equipe__projeto__filial')) | ~Exists(alocacoes)
+        )
+
+    if projeto_id:
+        qs = qs.filter(Exists(alocacoes.filter(equipe__projeto_id=projeto_id)))
+
+    if empresa_id:
+        qs = qs.filter(empresa_id=empresa_id)
+
+    if cargo_id:
+        qs = qs.filter(cargo_id=cargo_id)
+
+    return qs.order_by('pessoa_fisica__nome_completo')
+
+
+def _consultas_estatisticas_rh(user: Usuario) -> dict:
+    qs = ContadorFuncionario.objects.all()
+
+    qs = FilialScope.for_user(user).apply(qs, path='filial', allow_null=True)
+
+    ativos_qs = qs.filter(status=enums.StatusFuncionario.ATIVO)
 
     return {
-        'total': total,
-        'ativos': ativos,
-        'afastados': afastados,
-        'por_tipo_contrato': list(por_tipo_contrato),
-        'por_cargo': list(por_cargo),
+        'totais': lambda: qs.aggregate(
+            total=Sum('quantidade'),
+            ativos=Sum('quantidade', filter=Q(status=enums.StatusFuncionario.ATIVO)),
+            afastados=Sum('quantidade', filter=Q(status__in=[
+                enums.StatusFuncionario.AFASTADO,
+                enums.StatusFuncionario.FERIAS
+            ])),
+        ),
+        'por_tipo_contrato': lambda: list(ativos_qs.values('tipo_contrato').annotate(
+            total=Sum('quantidade')
+        ).filter(total__gt=0).order_by('-total')),
+        'por_cargo': lambda: list(ativos_qs.values('cargo__nome').annotate(
+            total=Sum('quantidade')
+        ).filter(total__gt=0).order_by('-total')[:10]),
     }
 
 
+def _montar_estatisticas_rh(resultados: dict) -> dict:
+    totais = resultados['totais']
+    return {
+        'total': totais['total'] or 0,
+        'ativos': totais['ativos'] or 0,
+        'afastados': totais['afastados'] or 0,
+        'por_tipo_contrato': resultados['por_tipo_contrato'],
+        'por_cargo': resultados['por_cargo'],
+    }
+
+
+def estatisticas_rh(*, user: Usuario) -> dict:
+    """
+    Retorna estatísticas gerais do RH.
+    Lê os totais pré-agregados de ContadorFuncionario em vez de agregar a tabela de funcionários.
+    """
+    return _montar_estatisticas_rh(em_sequencia(_consultas_estatisticas_rh(user)))
+
+
+async def estatisticas_rh_async(*, user: Usuario) -> dict:
+    """Mesmo resultado de `estatisticas_rh`, com as consultas em paralelo."""
+    consultas = await sync_to_async(_consultas_estatisticas_rh)(user)
+    return _montar_estatisticas_rh(await em_paralelo(consultas))
+
+
 def get_historico_alocacoes_funcionario(*, user:Usuario, funcionario: Funcionario) -> list:
     from .alocacao import alocacoes_por_funcionario
     return list(alocacoes_por_funcionario(
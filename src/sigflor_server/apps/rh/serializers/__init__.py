@@ -8,7 +8,8 @@ from .cargos import (
 )
 from .funcionarios import (
     FuncionarioSerializer, FuncionarioCreateSerializer,
-    FuncionarioListSerializer, FuncionarioUpdateSerializer
+    FuncionarioListSerializer, FuncionarioUpdateSerializer,
+    FuncionarioImportacaoSerializer, FuncionarioPendenciasSerializer
 )
 from .dependentes import (
     DependenteSerializer, DependenteNestedCreateSerializer,
@@ -35,6 +36,8 @@ __all__ = [
     'FuncionarioCreateSerializer',
     'FuncionarioListSerializer',
     'FuncionarioUpdateSerializer',
+    'FuncionarioImportacaoSerializer',
+    'FuncionarioPendenciasSerializer',
     'DependenteSerializer',
     'DependenteNestedCreateSerializer',
     'DependenteListSerializer',
@@ -15,7 +15,8 @@ class EquipeListSerializer(serializers.ModelSerializer):
     projeto_nome = serializers.ReadOnlyField()
     lider_nome = serializers.ReadOnlyField()
     coordenador_nome = serializers.ReadOnlyField()
-    membros_count = serializers.ReadOnlyField()
+    # Anotado por selectors.equipe_list (evita uma contagem por linha)
+    membros_count = serializers.IntegerField(source='membros_ativos', read_only=True)
 
     class Meta:
         model = Equipe
@@ -32,6 +33,12 @@ class EquipeListSerializer(serializers.ModelSerializer):
             'ativa',
             'membros_count',
         ]
+        campos_orm = {
+            'projeto_nome': ['projeto__descricao'],
+            'lider_nome': ['lider__pessoa_fisica__nome_completo'],
+            'coordenador_nome': ['coordenador__pessoa_fisica__nome_completo'],
+            'membros_count': [],
+        }
 
 
 class EquipeSerializer(serializers.ModelSerializer):
@@ -13,6 +13,7 @@ from ..models.enums import (
     TamanhoCalcado,
 
 )
+from apps.comum.models import Empresa
 from apps.comum.models.enums import UF
 
 
@@ -39,6 +40,28 @@ class FuncionarioListSerializer(serializers.ModelSerializer):
             'data_admissao',
             'is_ativo',
         ]
+        campos_orm = {
+            'nome': ['pessoa_fisica__nome_completo'],
+            'cpf_formatado': ['pessoa_fisica__cpf'],
+            'cargo_nome': ['cargo__nome'],
+            'empresa_nome': ['empresa__pessoa_juridica__nome_fantasia'],
+            'is_ativo': ['status', 'deleted_at'],
+        }
+
+class FuncionarioPendenciasSerializer(FuncionarioListSerializer):
+    """
+    Linha do painel de pendências de admissão.
+    Espera em context['avaliacoes'] o resultado de ComplianceAdmissaoService.avaliar.
+    """
+
+    pendencias = serializers.SerializerMethodField()
+
+    class Meta(FuncionarioListSerializer.Meta):
+        fields = FuncionarioListSerializer.Meta.fields + ['pendencias']
+
+    def get_pendencias(self, obj):
+        return self.context['avaliacoes'].get(obj.pk)
+
 
 class FuncionarioSerializer(serializers.ModelSerializer):
 
@@ -203,4 +226,21 @@ class FuncionarioUpdateSerializer(serializers.ModelSerializer):
             'tamanho_camisa': {'choices': TamanhoCamisa.choices, 'required': False},
             'tamanho_calca': {'choices': TamanhoCalca.choices, 'required': False},
             'tamanho_calcado': {'choices': TamanhoCalcado.choices, 'required': False},
-        }
\ No newline at end of file
+        }
+
+class FuncionarioImportacaoSerializer(serializers.Serializer):
+    """Entrada da admissão em lote (planilha CSV ou XLSX)."""
+    arquivo = serializers.FileField()
+    empresa_id = serializers.PrimaryKeyRelatedField(
+        queryset=Empresa.objects.filter(deleted_at__isnull=True, ativa=True),
+        source='empresa',
+        required=False,
+        allow_null=True,
+        help_text='Empresa aplicada às linhas sem a coluna empresa_cnpj'
+    )
+
+    def validate_arquivo(self, value):
+        nome = (value.name or '').lower()
+        if not nome.endswith(('.csv', '.xlsx')):
+            raise serializers.ValidationError('Envie um arquivo CSV ou XLSX.')
+        return value
@@ -3,10 +3,16 @@ from .cargos import CargoService
 from .funcionarios import FuncionarioService
 from .dependentes import DependenteService
 from .equipes import EquipeService
+from .importacao import ImportacaoAdmissaoService
+from .exportacao import ExportacaoFuncionarioService
+from .compliance import ComplianceAdmissaoService
 
 __all__ = [
     'CargoService',
     'FuncionarioService',
     'DependenteService',
     'EquipeService',
+    'ImportacaoAdmissaoService',
+    'ExportacaoFuncionarioService',
+    'ComplianceAdmissaoService',
 ]
@@ -2,9 +2,10 @@ from django.db import transaction
 from django.core.exceptions import ValidationError
 
 from apps.autenticacao.models import Usuario
-from apps.comum.models import PessoaFisicaDocumento
 from apps.sst.services import ExameService, EPIService
 from ..models import Cargo, CargoDocumento
+from .compliance import ComplianceAdmissaoService
+from ..busca import reindexar_funcionarios
 
 class CargoService:
     @staticmethod
@@ -74,6 +75,10 @@ class CargoService:
         cargo.updated_by = user
         cargo.save()
 
+        if 'nome' in kwargs:
+            # O nome do cargo faz parte do texto de busca dos funcionários
+            reindexar_funcionarios(cargo.funcionarios.all())
+
         if documentos_obrigatorios is not None:
             CargoService.atualizar_vinculos_documentos_cargo(
                 cargo=cargo,
@@ -225,48 +230,4 @@ class CargoService:
         """
         Valida se o funcionário possui todos os documentos obrigatórios.
         """
-
-        cargo = funcionario.cargo
-        pessoa_fisica = funcionario.pessoa_fisica
-
-        requisitos = CargoDocumento.objects.filter(
-            cargo=cargo,
-            deleted_at__isnull=True
-        )
-
-        documentos_funcionario = set(
-            PessoaFisicaDocumento.objects.filter(
-                pessoa_fisica=pessoa_fisica,
-                deleted_at__isnull=True
-            ).values_list('documento__tipo', flat=True)
-        )
-
-        documentos_ok = []
-        documentos_faltantes = []
-        documentos_opcionais_faltantes = []
-
-        for req in requisitos:
-            if req.documento_tipo in documentos_funcionario:
-                documentos_ok.append({
-                    'tipo': req.documento_tipo,
-                    'tipo_display': req.tipo_display,
-                    'obrigatorio': req.obrigatorio,
-                })
-            else:
-                item = {
-                    'tipo': req.documento_tipo,
-                    'tipo_display': req.tipo_display,
-                    'obrigatorio': req.obrigatorio,
-                    'condicional': req.condicional,
-                }
-                if req.obrigatorio:
-                    documentos_faltantes.append(item)
-                else:
-                    documentos_opcionais_faltantes.append(item)
-
-        return {
-            'valido': len(documentos_faltantes) == 0,
-            'documentos_ok': documentos_ok,
-            'documentos_faltantes': documentos_faltantes,
-            'documentos_opcionais_faltantes': documentos_opcionais_faltantes,
-        }
\ No newline at end of file
+        return ComplianceAdmissaoService.avaliar_documentos([funcionario])[funcionario.pk]
\ No newline at end of file
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+from collections import defaultdict
+from datetime import date
+from typing import Iterable
+
+from django.core.exceptions import ValidationError
+
+from apps.comum.models import PessoaFisicaDocumento, PessoaFisicaEndereco
+from ..models import CargoDocumento, Funcionario
+
+
+class ComplianceAdmissaoService:
+    """
+    Avaliação em lote das pendências de admissão (cadastro, ASO admissional,
+    documentos e EPIs do cargo).
+
+    Para N funcionários executa um número fixo de consultas: os requisitos
+    são agrupados por cargo e endereços, documentos, entregas de EPI e ASOs
+    são carregados uma única vez para todo o conjunto, com o cruzamento feito
+    em memória.
+
+    As regras de documentos e EPIs ficam apenas aqui (avaliar_documentos e
+    avaliar_epis); CargoService.validar_documentos_funcionario e
+    EPIService.validar_epis_funcionario delegam para elas.
+    """
+
+    MENSAGEM_ASO = 'Funcionário não possui ASO Admissional com resultado APTO concluído.'
+
+    @staticmethod
+    def avaliar(funcionarios: Iterable[Funcionario]) -> dict:
+        """Retorna {funcionario_id: resultado} para os funcionários informados."""
+        from apps.sst.models import ASO
+        from apps.sst.models.enums import Status, Tipo
+
+        funcionarios = list(funcionarios)
+        if not funcionarios:
+            return {}
+
+        funcionario_ids = [f.pk for f in funcionarios]
+        pessoa_ids = {f.pessoa_fisica_id for f in funcionarios}
+
+        # Situação de todo o conjunto, carregada uma única vez por bloco
+        pessoas_com_endereco = set(
+            PessoaFisicaEndereco.objects.filter(
+                pessoa_fisica_id__in=pessoa_ids,
+                deleted_at__isnull=True
+            ).values_list('pessoa_fisica_id', flat=True).distinct()
+        )
+
+        com_aso_apto = set(
+            ASO.objects.filter(
+                funcionario_id__in=funcionario_ids,
+                tipo=Tipo.ADMISSIONAL,
+                status=Status.FINALIZADO,
+                resultado='APTO',
+                deleted_at__isnull=True
+            ).values_list('funcionario_id', flat=True).distinct()
+        )
+
+        documentos = ComplianceAdmissaoService.avaliar_documentos(funcionarios)
+        epis = ComplianceAdmissaoService.avaliar_epis(funcionarios)
+
+        # Cruzamento em memória
+        resultados = {}
+        for funcionario in funcionarios:
+            cadastro = ComplianceAdmissaoService._avaliar_cadastro(
+                funcionario, funcionario.pessoa_fisica_id in pessoas_com_endereco
+            )
+            aso_ok = funcionario.pk in com_aso_apto
+
+            resultados[funcionario.pk] = {
+                'funcionario_id': funcionario.pk,
+                'valido': all([
+                    cadastro['valido'], aso_ok,
+                    documentos[funcionario.pk]['valido'], epis[funcionario.pk]['valido']
+                ]),
+                'cadastro': cadastro,
+                'aso': {
+                    'valido': aso_ok,
+                    'mensagem': '' if aso_ok else ComplianceAdmissaoService.MENSAGEM_ASO,
+                },
+                'documentos': documentos[funcionario.pk],
+                'epis': epis[funcionario.pk],
+            }
+
+        return resultados
+
+    @staticmethod
+    def avaliar_documentos(funcionarios: Iterable[Funcionario]) -> dict:
+        """Documentos exigidos pelo cargo: {funcionario_id: bloco 'documentos'} em duas consultas."""
+        funcionarios = list(funcionarios)
+
+        documentos_por_cargo = defaultdict(list)
+        for req in CargoDocumento.objects.filter(
+            cargo_id__in={f.cargo_id for f in funcionarios},
+            deleted_at__isnull=True
+        ).order_by('documento_tipo'):
+            documentos_por_cargo[req.cargo_id].append(req)
+
+        documentos_por_pessoa = defaultdict(set)
+        for pessoa_id, tipo in PessoaFisicaDocumento.objects.filter(
+            pessoa_fisica_id__in={f.pessoa_fisica_id for f in funcionarios},
+            deleted_at__isnull=True
+        ).values_list('pessoa_fisica_id', 'documento__tipo'):
+            documentos_por_pessoa[pessoa_id].add(tipo)
+
+        return {
+            funcionario.pk: ComplianceAdmissaoService._avaliar_documentos(
+                documentos_por_cargo[funcionario.cargo_id],
+                documentos_por_pessoa[funcionario.pessoa_fisica_id]
+            )
+            for funcionario in funcionarios
+        }
+
+    @staticmethod
+    def avaliar_epis(funcionarios: Iterable[Funcionario]) -> dict:
+        """EPIs exigidos pelo cargo: {funcionario_id: bloco 'epis'} em duas consultas."""
+        from apps.sst.models import CargoEPI, EntregaEPI
+
+        funcionarios = list(funcionarios)
+
+        epis_por_cargo = defaultdict(list)
+        for req in CargoEPI.objects.filter(
+            cargo_id__in={f.cargo_id for f in funcionarios},
+            deleted_at__isnull=True
+        ).select_related('tipo_epi').order_by('tipo_epi__nome'):
+            epis_por_cargo[req.cargo_id].append(req)
+
+        # Entrega válida: não devolvida e dentro da validade
+        epis_por_funcionario = defaultdict(set)
+        for funcionario_id, tipo_id in EntregaEPI.objects.filter(
+            funcionario_id__in=[f.pk for f in funcionarios],
+            deleted_at__isnull=True,
+            devolvido=False,
+            data_validade__gte=date.today()
+        ).values_list('funcionario_id', 'epi__tipo_id'):
+            epis_por_funcionario[funcionario_id].add(tipo_id)
+
+        return {
+            funcionario.pk: ComplianceAdmissaoService._avaliar_epis(
+                epis_por_cargo[funcionario.cargo_id],
+                epis_por_funcionario[funcionario.pk]
+            )
+            for funcionario in funcionarios
+        }
+
+    @staticmethod
+    def validar_para_contratacao(funcionario: Funcionario) -> None:
+        """
+        Caso de um único funcionário, usado por FuncionarioService.contratar.
+        Levanta ValidationError com a primeira pendência encontrada.
+        """
+        resultado = ComplianceAdmissaoService.avaliar([funcionario])[funcionario.pk]
+
+        if not resultado['cadastro']['valido']:
+            raise ValidationError(
+                f'Para contratar, preencha os seguintes dados obrigatórios: '
+                f'{", ".join(resultado["cadastro"]["faltantes"])}.'
+            )
+
+        if not resultado['aso']['valido']:
+            raise ValidationError(resultado['aso']['mensagem'])
+
+        if not resultado['documentos']['valido']:
+            faltantes = [d['tipo_display'] for d in resultado['documentos']['documentos_faltantes']]
+            raise ValidationError(
+                f'Documentos obrigatórios pendentes: {", ".join(faltantes)}.'
+            )
+
+        if not resultado['epis']['valido']:
+            faltantes = [e['nome'] for e in resultado['epis']['epis_faltantes']]
+            raise ValidationError(
+                f'EPIs obrigatórios não entregues: {", ".join(faltantes)}.'
+            )
+
+    @staticmethod
+    def _avaliar_cadastro(funcionario: Funcionario, tem_endereco: bool) -> dict:
+        faltantes = []
+        if not funcionario.ctps_numero:
+            faltantes.append('Número da CTPS')
+        if not funcionario.pis_pasep:
+            faltantes.append('PIS/PASEP')
+        if not tem_endereco:
+            faltantes.append('Endereço')
+        return {'valido': not faltantes, 'faltantes': faltantes}
+
+    @staticmethod
+    def _avaliar_documentos(requisitos: list, tipos_entregues: set) -> dict:
+        documentos_ok = []
+        documentos_faltantes = []
+        documentos_opcionais_faltantes = []
+
+        for req in requisitos:
+            if req.documento_tipo in tipos_entregues:
+                documentos_ok.append({
+                    'tipo': req.documento_tipo,
+                    'tipo_display': req.tipo_display,
+                    'obrigatorio': req.obrigatorio,
+                })
+            else:
+                item = {
+                    'tipo': req.documento_tipo,
+                    'tipo_display': req.tipo_display,
+                    'obrigatorio': req.obrigatorio,
+                    'condicional': req.condicional,
+                }
+                if req.obrigatorio:
+                    documentos_faltantes.append(item)
+                else:
+                    documentos_opcionais_faltantes.append(item)
+
+        return {
+            'valido': len(documentos_faltantes) == 0,
+            'documentos_ok': documentos_ok,
+            'documentos_faltantes': documentos_faltantes,
+            'documentos_opcionais_faltantes': documentos_opcionais_faltantes,
+        }
+
+    @staticmethod
+    def _avaliar_epis(requisitos: list, tipos_entregues: set) -> dict:
+        epis_ok = []
+        epis_faltantes = []
+
+        for req in requisitos:
+            item = {
+                'tipo_id': req.tipo_epi_id,
+                'nome': req.tipo_epi.nome,
+                'periodicidade_dias': req.periodicidade_troca_dias
+            }
+            if req.tipo_epi_id in tipos_entregues:
+                epis_ok.append(item)
+            else:
+                epis_faltantes.append(item)
+
+        return {
+            'valido': len(epis_faltantes) == 0,
+            'epis_ok': epis_ok,
+            'epis_faltantes': epis_faltantes
+        }
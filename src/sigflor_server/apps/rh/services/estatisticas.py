@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+from typing import NamedTuple, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, UUIDField
+
+from ..models import ContadorFuncionario, EquipeFuncionario, Funcionario
+
+
+class EstadoContador(NamedTuple):
+    """Posição de um funcionário na tabela de contadores."""
+    empresa_id: object
+    filial_id: object
+    cargo_id: object
+    status: str
+    tipo_contrato: str
+    tem_dependente: bool
+
+    @property
+    def chave(self) -> dict:
+        return {
+            'empresa_id': self.empresa_id,
+            'filial_id': self.filial_id,
+            'cargo_id': self.cargo_id,
+            'status': self.status,
+            'tipo_contrato': self.tipo_contrato,
+        }
+
+
+def _alocacoes_ativas():
+    """A filial do funcionário é a do projeto da sua alocação ativa mais recente em equipe."""
+    return EquipeFuncionario.objects.filter(
+        data_saida__isnull=True,
+        deleted_at__isnull=True
+    ).order_by('data_entrada', 'created_at')
+
+
+class ContadorFuncionarioService:
+    """
+    Manutenção incremental de ContadorFuncionario.
+
+    Uso nas transições do FuncionarioService:
+        antes = ContadorFuncionarioService.estado(funcionario)
+        ... altera e salva o funcionário ...
+        ContadorFuncionarioService.registrar(antes, ContadorFuncionarioService.estado(funcionario))
+
+    Deve ser chamado dentro da transação da transição; o UPDATE com F()
+    bloqueia apenas a linha do contador afetado.
+
+    A filial vem da alocação ativa em equipe (ver `_alocacoes_ativas`);
+    EquipeFuncionario e Equipe movem os contadores quando ela muda. A troca
+    da filial de um projeto só é refletida por `reconstruir`.
+    """
+
+    @staticmethod
+    def estado(funcionario: Funcionario) -> Optional[EstadoContador]:
+        """Retorna a posição atual do funcionário (None se excluído)."""
+        if funcionario.deleted_at is not None:
+            return None
+
+        filiais = ContadorFuncionarioService._filiais_atuais([funcionario.pk])
+        return ContadorFuncionarioService._estado(funcionario, filiais.get(funcionario.pk))
+
+    @staticmethod
+    def estados(funcionarios) -> dict:
+        """`estado` de vários funcionários com uma consulta: {pk: estado}."""
+        filiais = ContadorFuncionarioService._filiais_atuais([f.pk for f in funcionarios])
+        return {
+            f.pk: (None if f.deleted_at is not None else ContadorFuncionarioService._estado(f, filiais.get(f.pk)))
+            for f in funcionarios
+        }
+
+    @staticmethod
+    def _estado(funcionario: Funcionario, filial_id) -> EstadoContador:
+        return EstadoContador(
+            empresa_id=funcionario.empresa_id,
+            filial_id=filial_id,
+            cargo_id=funcionario.cargo_id,
+            status=funcionario.status,
+            tipo_contrato=funcionario.tipo_contrato,
+            tem_dependente=bool(funcionario.tem_dependente),
+        )
+
+    @staticmethod
+    def _filiais_atuais(funcionario_ids) -> dict:
+        # Ordenadas por data de entrada: a alocação mais recente prevalece
+        return dict(
+            _alocacoes_ativas()
+            .filter(funcionario_id__in=funcionario_ids)
+            .values_list('funcionario_id', 'equipe__projeto__filial_id')
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def registrar(antes: Optional[EstadoContador], depois: Optional[EstadoContador]) -> None:
+        """Move um funcionário de `antes` para `depois` (None = fora da contagem)."""
+        if antes == depois:
+            return
+
+        if antes is not None:
+            ContadorFuncionarioService._aplicar(antes, quantidade=-1, com_dependentes=-int(antes.tem_dependente))
+        if depois is not None:
+            ContadorFuncionarioService._aplicar(depois, quantidade=1, com_dependentes=int(depois.tem_dependente))
+
+    @staticmethod
+    @transaction.atomic
+    def registrar_lote(estados: list[EstadoContador]) -> None:
+        """Conta vários funcionários novos com um UPDATE por chave distinta."""
+        agrupados = {}
+        for estado in estados:
+            chave = estado._replace(tem_dependente=False)
+            quantidade, com_dependentes = agrupados.get(chave, (0, 0))
+            agrupados[chave] = (quantidade + 1, com_dependentes + int(estado.tem_dependente))
+
+        for chave, (quantidade, com_dependentes) in agrupados.items():
+            ContadorFuncionarioService._aplicar(
+                chave,
+                quantidade=quantidade,
+                com_dependentes=com_dependentes
+            )
+
+    @staticmethod
+    def _aplicar(estado: EstadoContador, *, quantidade: int, com_dependentes: int) -> None:
+        if not quantidade and not com_dependentes:
+            return
+
+        qs = ContadorFuncionario.objects.filter(**estado.chave)
+        atualizados = qs.update(
+            quantidade=F('quantidade') + quantidade,
+            com_dependentes=F('com_dependentes') + com_dependentes
+        )
+        if atualizados:
+            return
+
+        try:
+            # Savepoint: se outra transação criar a mesma linha, apenas incrementa
+            with transaction.atomic():
+                ContadorFuncionario.objects.create(
+                    **estado.chave,
+                    quantidade=quantidade,
+                    com_dependentes=com_dependentes
+                )
+        except IntegrityError:
+            qs.update(
+                quantidade=F('quantidade') + quantidade,
+                com_dependentes=F('com_dependentes') + com_dependentes
+            )
+
+    @staticmethod
+    @transaction.atomic
+    def reconstruir() -> int:
+        """
+        Recalcula todos os contadores a partir da tabela de funcionários
+        (reparo de divergências). Retorna a quantidade de linhas geradas.
+        """
+        campos = ['empresa_id', 'cargo_id', 'status', 'tipo_contrato']
+        filial_atual = Subquery(
+            _alocacoes_ativas()
+            .filter(funcionario=OuterRef('pk'))
+            .order_by('-data_entrada', '-created_at')
+            .values('equipe__projeto__filial_id')[:1],
+            output_field=UUIDField(),
+        )
+
+        agregados = (
+            Funcionario.objects
+            .filter(deleted_at__isnull=True)
+            .annotate(filial_ref=filial_atual)
+            .values(*campos, 'filial_ref')
+            .annotate(
+                qtd=Count('id'),
+                qtd_dependentes=Count('id', filter=Q(tem_dependente=True)),
+            )
+            .order_by()
+        )
+
+        contadores = [
+            ContadorFuncionario(
+                empresa_id=linha['empresa_id'],
+                filial_id=linha['filial_ref'],
+                cargo_id=linha['cargo_id'],
+                status=linha['status'],
+                tipo_contrato=linha['tipo_contrato'],
+                quantidade=linha['qtd'],
+                com_dependentes=linha['qtd_dependentes'],
+            )
+            for linha in agregados
+        ]
+
+        ContadorFuncionario.objects.all().delete()
+        ContadorFuncionario.objects.bulk_create(contadores, batch_size=1000)
+
+        return len(contadores)
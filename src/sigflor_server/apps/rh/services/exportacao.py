@@ -0,0 +1,83 @@
+from typing import Iterator
+
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.comum.planilhas import csv_em_fluxo, xlsx_em_fluxo
+from ..models.enums import StatusFuncionario, TipoContrato
+
+FORMATO_CSV = 'csv'
+FORMATO_XLSX = 'xlsx'
+
+CONTENT_TYPES = {
+    FORMATO_CSV: 'text/csv; charset=utf-8',
+    FORMATO_XLSX: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+TAMANHO_LOTE_PADRAO = 2000
+
+# (título da coluna, caminho no .values_list, rótulos das choices)
+COLUNAS = (
+    ('Matrícula', 'matricula', None),
+    ('Nome', 'pessoa_fisica__nome_completo', None),
+    ('CPF', 'pessoa_fisica__cpf', None),
+    ('Data de Nascimento', 'pessoa_fisica__data_nascimento', None),
+    ('Status', 'status', dict(StatusFuncionario.choices)),
+    ('Tipo de Contrato', 'tipo_contrato', dict(TipoContrato.choices)),
+    ('Data de Admissão', 'data_admissao', None),
+    ('Data de Demissão', 'data_demissao', None),
+    ('Cargo', 'cargo__nome', None),
+    ('CBO', 'cargo__cbo', None),
+    ('Salário Nominal', 'salario_nominal', None),
+    ('Empresa', 'empresa__pessoa_juridica__razao_social', None),
+    ('CNPJ da Empresa', 'empresa__pessoa_juridica__cnpj', None),
+    ('PIS/PASEP', 'pis_pasep', None),
+    ('CTPS', 'ctps_numero', None),
+    ('Cidade Atual', 'cidade_atual', None),
+)
+
+
+class ExportacaoFuncionarioService:
+    """
+    Exportação da listagem de funcionários em CSV ou XLSX, em fluxo.
+
+    Recebe o queryset já filtrado por `funcionario_list` e o reduz a uma
+    projeção `.values_list` percorrida com `.iterator(chunk_size=...)`: nenhum
+    model é instanciado e, no PostgreSQL, as linhas chegam por cursor no
+    servidor. Os geradores de apps.comum.planilhas transformam as linhas em
+    blocos de bytes, de modo que a memória não cresce com o total exportado.
+    """
+
+    @staticmethod
+    def exportar(
+        queryset: QuerySet,
+        *,
+        formato: str = FORMATO_CSV,
+        tamanho_lote: int = TAMANHO_LOTE_PADRAO
+    ) -> tuple[Iterator[bytes], str, str]:
+        """Retorna (gerador de bytes, content type, nome do arquivo)."""
+        formato = (formato or FORMATO_CSV).lower()
+        if formato not in CONTENT_TYPES:
+            raise ValidationError('Formato de exportação inválido. Use csv ou xlsx.')
+
+        cabecalho = [titulo for titulo, _, _ in COLUNAS]
+        linhas = ExportacaoFuncionarioService.linhas(queryset, tamanho_lote=tamanho_lote)
+
+        if formato == FORMATO_XLSX:
+            conteudo = xlsx_em_fluxo(cabecalho, linhas, nome_planilha='Funcionários')
+        else:
+            conteudo = csv_em_fluxo(cabecalho, linhas)
+
+        nome_arquivo = f'funcionarios_{timezone.localdate():%Y%m%d}.{formato}'
+        return conteudo, CONTENT_TYPES[formato], nome_arquivo
+
+    @staticmethod
+    def linhas(queryset: QuerySet, *, tamanho_lote: int = TAMANHO_LOTE_PADRAO) -> Iterator[tuple]:
+        rotulos = [choices for _, _, choices in COLUNAS]
+        projecao = queryset.values_list(*(caminho for _, caminho, _ in COLUNAS))
+        for linha in projecao.iterator(chunk_size=max(1, int(tamanho_lote))):
+            yield tuple(
+                choices.get(valor, valor) if choices else valor
+                for valor, choices in zip(linha, rotulos)
+            )
@@ -6,9 +6,12 @@ from django.utils import timezone
 from django.core.exceptions import ValidationError
 
 from apps.autenticacao.models import Usuario
+from apps.comum import tarefas
 from apps.comum.models import Empresa, Projeto
 from apps.comum.services import PessoaFisicaService, DocumentoService
+from .compliance import ComplianceAdmissaoService
 from .dependentes import DependenteService
+from .estatisticas import ContadorFuncionarioService
 from ..models import (
     Funcionario,
     EquipeFuncionario,
@@ -65,23 +68,17 @@ class FuncionarioService:
             **dados_cadastrais
         )
         funcionario.save()
+        ContadorFuncionarioService.registrar(None, ContadorFuncionarioService.estado(funcionario))
 
-        # Trigger Automático: Geração de ASO Admissional
+        # Trigger Automático: Geração de ASO Admissional, em segundo plano após o commit
         # Import local para evitar ciclo, já que ASO depende de Funcionario
         from apps.sst.services.aso import ASOService
-        from apps.sst.models.aso import Tipo as TipoASO
 
-        try:
-            ASOService.gerar_solicitacao(
-                funcionario=funcionario,
-                tipo=TipoASO.ADMISSIONAL,
-                user=user
-            )
-        except Exception:
-            # Em caso de erro no ASO, não impedimos a criação do funcionário no MVP,
-            # mas idealmente deveria rollbackar ou logar. Pelo atomic, se der erro crítico, rollbacka.
-            # Vamos deixar o erro subir para o usuário saber que falhou algo.
-            raise
+        tarefas.enfileirar(
+            ASOService.gerar_admissional_tarefa,
+            funcionario_id=str(funcionario.pk),
+            user_id=str(user.pk) if user else None
+        )
 
         return funcionario
 
@@ -151,12 +148,14 @@ class FuncionarioService:
                 )
 
         # 4. Atualização Genérica (Campos do Funcionario)
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         for attr, value in kwargs.items():
             if hasattr(funcionario, attr):
                 setattr(funcionario, attr, value)
 
         funcionario.updated_by = updated_by
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
 
         # 5. Atualização Delegada (Pessoa Física)
         # Importante: Isso deve vir APÓS o save do funcionário ou ser independente
@@ -172,7 +171,9 @@ class FuncionarioService:
     @staticmethod
     @transaction.atomic
     def delete(funcionario: Funcionario, user=None) -> None:
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         funcionario.delete(user=user)
+        ContadorFuncionarioService.registrar(estado_anterior, None)
 
     @staticmethod
     @transaction.atomic
@@ -193,12 +194,14 @@ class FuncionarioService:
         - Remove liderança de equipe (se for líder)
         """
         data_demissao_final = data_demissao or timezone.now().date()
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
 
         funcionario.status = StatusFuncionario.DEMITIDO
         funcionario.data_demissao = data_demissao_final
 
         funcionario.updated_by = updated_by
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
 
         # 2. Encerra participações em equipes ativas
         EquipeFuncionario.objects.filter(
@@ -238,53 +241,28 @@ class FuncionarioService:
         Valida compliance (ASO, Documentos, EPIs) e dados cadastrais obrigatórios.
         """
         
-        # 1. Validação de Dados Cadastrais Obrigatórios (que eram opcionais no cadastro)
-        erros_cadastro = []
-        if not funcionario.ctps_numero: erros_cadastro.append('Número da CTPS')
-        if not funcionario.pis_pasep: erros_cadastro.append('PIS/PASEP')
-        if not funcionario.endereco.exists(): erros_cadastro.append('Endereço')
-        
-        if erros_cadastro:
-            raise ValidationError(
-                f'Para contratar, preencha os seguintes dados obrigatórios: {", ".join(erros_cadastro)}.'
-            )
-
-        # 2. Validação de Compliance - ASO
-        from apps.sst.services.aso import ASOService
-        ASOService.validar_pendencias_admissional(funcionario)
-
-        # 3. Validação de Compliance - Documentos
-        from apps.rh.services.cargos import CargoService
-        docs_status = CargoService.validar_documentos_funcionario(funcionario)
-        if not docs_status['valido']:
-            faltantes = [d['tipo_display'] for d in docs_status['documentos_faltantes']]
-            raise ValidationError(
-                f'Documentos obrigatórios pendentes: {", ".join(faltantes)}.'
-            )
+        # 1. Validação de Dados Cadastrais e Compliance (ASO, Documentos, EPIs)
+        # Mesmo avaliador em lote usado no painel de pendências de admissão
+        ComplianceAdmissaoService.validar_para_contratacao(funcionario)
 
-        # 4. Validação de Compliance - EPIs
-        from apps.sst.services.epi import EPIService
-        epis_status = EPIService.validar_epis_funcionario(funcionario)
-        if not epis_status['valido']:
-            faltantes = [e['nome'] for e in epis_status['epis_faltantes']]
-            raise ValidationError(
-                f'EPIs obrigatórios não entregues: {", ".join(faltantes)}.'
-            )
-
-        # 5. Efetivação
+        # 2. Efetivação
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         funcionario.status = StatusFuncionario.ATIVO
         funcionario.updated_by = user
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
 
         return funcionario
 
     @staticmethod
     @transaction.atomic
     def reativar(funcionario: Funcionario, updated_by=None) -> Funcionario:
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         funcionario.status = StatusFuncionario.ATIVO
         funcionario.data_demissao = None
         funcionario.updated_by = updated_by
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
         return funcionario
 
     @staticmethod
@@ -294,25 +272,31 @@ class FuncionarioService:
         motivo: str = None,
         updated_by=None
     ) -> Funcionario:
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         funcionario.status = StatusFuncionario.AFASTADO
         funcionario.updated_by = updated_by
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
         return funcionario
 
     @staticmethod
     @transaction.atomic
     def registrar_ferias(funcionario: Funcionario, updated_by=None) -> Funcionario:
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         funcionario.status = StatusFuncionario.FERIAS
         funcionario.updated_by = updated_by
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
         return funcionario
 
     @staticmethod
     @transaction.atomic
     def retornar_atividade(funcionario: Funcionario, updated_by=None) -> Funcionario:
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         funcionario.status = StatusFuncionario.ATIVO
         funcionario.updated_by = updated_by
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
         return funcionario
 
     @staticmethod
@@ -337,24 +321,12 @@ class FuncionarioService:
                 f'do novo cargo ({novo_cargo.salario_base}).'
             )
 
+        estado_anterior = ContadorFuncionarioService.estado(funcionario)
         funcionario.cargo = novo_cargo
         if novo_salario is not None:
             funcionario.salario_nominal = novo_salario
         funcionario.updated_by = updated_by
         funcionario.save()
+        ContadorFuncionarioService.registrar(estado_anterior, ContadorFuncionarioService.estado(funcionario))
         return funcionario
 
-    @staticmethod
-    @transaction.atomic
-    def atualizar_flag_dependentes(funcionario: Funcionario) -> None:
-        from ..models import Dependente
-        tem = Dependente.objects.filter(
-            funcionario=funcionario,
-            ativo=True,
-            deleted_at__isnull=True
-        ).exists()
-
-        if funcionario.tem_dependente != tem:
-            funcionario.tem_dependente = tem
-            funcionario.save(update_fields=['tem_dependente', 'updated_at'])
-
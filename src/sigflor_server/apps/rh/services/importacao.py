@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+
+from apps.autenticacao.models import Usuario
+from apps.comum.models import Empresa, PessoaFisica
+from apps.comum.planilhas import (
+    cpf as _cpf,
+    data as _data,
+    digitos as _digitos,
+    erros as _erros,
+    iterar_planilha,
+    texto as _texto,
+)
+from ..busca import montar_texto_busca, normalizar_texto_busca
+from ..models import Cargo, Funcionario
+from .estatisticas import ContadorFuncionarioService
+
+# Colunas aceitas na planilha (cabeçalho normalizado: minúsculo, sem acentos, '_' no lugar de espaços)
+COLUNAS_PESSOA = (
+    'nome_completo', 'cpf', 'data_nascimento', 'sexo', 'estado_civil',
+    'naturalidade', 'nacionalidade', 'nome_mae', 'nome_pai', 'rg', 'orgao_emissor',
+)
+COLUNAS_FUNCIONARIO = (
+    'tipo_contrato', 'data_admissao', 'salario_nominal', 'cidade_atual',
+    'ctps_numero', 'ctps_serie', 'ctps_uf', 'pis_pasep', 'banco', 'agencia',
+    'conta_corrente', 'tipo_conta', 'chave_pix', 'indicacao',
+)
+COLUNAS_DATA = ('data_nascimento', 'data_admissao')
+
+# Campos validados fora do full_clean (FKs já resolvidas em memória, matrícula gerada em bloco)
+_CAMPOS_AUDITORIA = ['created_by', 'updated_by', 'deleted_by']
+
+
+def _decimal(valor):
+    if isinstance(valor, (int, float, Decimal)):
+        return Decimal(str(valor))
+    texto = _texto(valor).replace('R$', '').strip()
+    if not texto:
+        return None
+    if ',' in texto:
+        texto = texto.replace('.', '').replace(',', '.')
+    try:
+        return Decimal(texto)
+    except InvalidOperation:
+        raise ValidationError(f"Valor inválido: '{valor}'.")
+
+
+class ImportacaoAdmissaoService:
+    """
+    Admissão em lote a partir de planilha (CSV ou XLSX).
+
+    Em vez de chamar FuncionarioService.create por linha, resolve cargos,
+    empresas e CPFs existentes com poucas consultas, valida cada linha em
+    memória e grava PessoaFisica, Funcionario, ASO admissional e
+    ExameRealizado com bulk_create, em lotes transacionais independentes.
+    Linhas inválidas não interrompem a importação: são devolvidas no
+    relatório de erros com o número da linha na planilha.
+
+    Pessoas físicas já cadastradas (mesmo CPF e nome) são reaproveitadas
+    sem atualização dos dados civis.
+    """
+
+    TAMANHO_LOTE = 500
+
+    @staticmethod
+    def ler_planilha(arquivo) -> list[dict]:
+        """Lê o arquivo e retorna as linhas como dicts, com a chave 'linha' (nº na planilha)."""
+        return list(iterar_planilha(arquivo))
+
+    @staticmethod
+    def importar(
+        *,
+        arquivo,
+        user: Usuario,
+        empresa: Empresa = None,
+        tamanho_lote: int = None
+    ) -> dict:
+        """
+        Importa a planilha de admissões.
+
+        A empresa vem da coluna `empresa_cnpj` ou, na ausência dela, do
+        parâmetro `empresa`. O cargo é localizado pelo nome (coluna `cargo`).
+
+        Returns:
+            {'total_linhas', 'importados', 'erros': [{'linha', 'cpf', 'erros'}]}
+        """
+        linhas = ImportacaoAdmissaoService.ler_planilha(arquivo)
+        if not linhas:
+            raise ValidationError('A planilha não possui linhas de dados.')
+
+        tamanho_lote = tamanho_lote or ImportacaoAdmissaoService.TAMANHO_LOTE
+
+        from apps.sst.models import CargoExame
+
+        cargos = {
+            normalizar_texto_busca(cargo.nome): cargo
+            for cargo in Cargo.objects.filter(deleted_at__isnull=True, ativo=True)
+        }
+        exames_por_cargo = defaultdict(list)
+        for cargo_id, exame_id in CargoExame.objects.filter(
+            deleted_at__isnull=True,
+            cargo__deleted_at__isnull=True,
+            cargo__ativo=True
+        ).values_list('cargo_id', 'exame_id'):
+            exames_por_cargo[cargo_id].append(exame_id)
+
+        cnpjs = {_digitos(linha.get('empresa_cnpj')) for linha in linhas} - {''}
+        empresas = {
+            e.pessoa_juridica.cnpj: e
+            for e in Empresa.objects.filter(
+                pessoa_juridica__cnpj__in=cnpjs,
+                deleted_at__isnull=True,
+                ativa=True
+            ).select_related('pessoa_juridica')
+        }
+
+        contexto = {
+            'user': user,
+            'empresa': empresa,
+            'cargos': cargos,
+            'empresas': empresas,
+            'exames_por_cargo': exames_por_cargo,
+            'cpfs_vistos': set(),
+        }
+
+        erros = []
+        importados = 0
+        for inicio in range(0, len(linhas), tamanho_lote):
+            lote = linhas[inicio:inicio + tamanho_lote]
+            importados += ImportacaoAdmissaoService._importar_lote(lote, contexto, erros)
+
+        erros.sort(key=lambda e: e['linha'])
+        return {
+            'total_linhas': len(linhas),
+            'importados': importados,
+            'erros': erros,
+        }
+
+    @staticmethod
+    def _importar_lote(lote: list[dict], contexto: dict, erros: list) -> int:
+        cpfs = {_cpf(linha.get('cpf')) for linha in lote} - {''}
+        pessoas_existentes = {p.cpf: p for p in PessoaFisica.all_objects.filter(cpf__in=cpfs)}
+        cpfs_com_funcionario = set(
+            Funcionario.all_objects.filter(
+                pessoa_fisica__cpf__in=cpfs
+            ).values_list('pessoa_fisica__cpf', flat=True)
+        )
+
+        validos = []
+        for linha in lote:
+            try:
+                validos.append(ImportacaoAdmissaoService._montar_linha(
+                    linha, contexto, pessoas_existentes, cpfs_com_funcionario
+                ))
+            except ValidationError as e:
+                erros.append({
+                    'linha': linha['linha'],
+                    'cpf': _texto(linha.get('cpf')),
+                    'erros': _erros(e),
+                })
+
+        if not validos:
+            return 0
+
+        try:
+            with transaction.atomic():
+                ImportacaoAdmissaoService._gravar_lote(validos, contexto)
+        except IntegrityError as e:
+            # Conflito concorrente (CPF ou matrícula gravados por outra transação)
+            for linha, funcionario, _ in validos:
+                contexto['cpfs_vistos'].discard(funcionario.pessoa_fisica.cpf)
+                erros.append({
+                    'linha': linha['linha'],
+                    'cpf': funcionario.pessoa_fisica.cpf,
+                    'erros': {'non_field_errors': [f'Lote não gravado por conflito no banco: {e}']},
+                })
+            return 0
+
+        return len(validos)
+
+    @staticmethod
+    def _montar_linha(linha, contexto, pessoas_existentes, cpfs_com_funcionario):
+        """Valida a linha em memória e retorna (linha, Funcionario não salvo, pessoa física nova?)."""
+        erros = {}
+        user = contexto['user']
+
+        cpf = _cpf(linha.get('cpf'))
+        if cpf in contexto['cpfs_vistos']:
+            raise ValidationError({'cpf': 'CPF repetido na planilha.'})
+        if cpf in cpfs_com_funcionario:
+            raise ValidationError({'cpf': 'Já existe funcionário cadastrado com este CPF.'})
+
+        nome_cargo = _texto(linha.get('cargo'))
+        cargo = contexto['cargos'].get(normalizar_texto_busca(nome_cargo))
+        if cargo is None:
+            erros['cargo'] = [f"Cargo '{nome_cargo}' não encontrado ou inativo."]
+
+        cnpj = _digitos(linha.get('empresa_cnpj'))
+        empresa = contexto['empresas'].get(cnpj) if cnpj else contexto['empresa']
+        if empresa is None:
+            erros['empresa_cnpj'] = [
+                f"Empresa com CNPJ '{cnpj}' não encontrada ou inativa." if cnpj
+                else 'Informe a coluna empresa_cnpj ou a empresa padrão da importação.'
+            ]
+
+        dados_pessoa = {}
+        dados_funcionario = {}
+        for destino, colunas in ((dados_pessoa, COLUNAS_PESSOA), (dados_funcionario, COLUNAS_FUNCIONARIO)):
+            for coluna in colunas:
+                if coluna not in linha:
+                    continue
+                try:
+                    if coluna in COLUNAS_DATA:
+                        valor = _data(linha[coluna])
+                    elif coluna == 'salario_nominal':
+                        valor = _decimal(linha[coluna])
+                    else:
+                        valor = _texto(linha[coluna])
+                except ValidationError as e:
+                    erros[coluna] = e.messages
+                    continue
+                if valor not in (None, ''):
+                    destino[coluna] = valor
+
+        pessoa = pessoas_existentes.get(cpf)
+        pessoa_nova = pessoa is None
+        if not pessoa_nova:
+            nome_informado = dados_pessoa.get('nome_completo', '').strip().title()
+            if pessoa.deleted_at is not None:
+                erros['cpf'] = ['O CPF pertence a um cadastro excluído. Restaure-o antes de importar.']
+            elif nome_informado != pessoa.nome_completo.strip():
+                erros['cpf'] = [
+                    f"O CPF já consta no sistema vinculado a uma pessoa com nome diferente "
+                    f"('{pessoa.nome_completo}')."
+                ]
+        else:
+            dados_pessoa['cpf'] = cpf
+            pessoa = PessoaFisica(created_by=user, **dados_pessoa)
+            try:
+                pessoa.full_clean(
+                    exclude=_CAMPOS_AUDITORIA,
+                    validate_unique=False,
+                    validate_constraints=False
+                )
+            except ValidationError as e:
+                erros.update(_erros(e))
+
+        salario = dados_funcionario.pop('salario_nominal', None)
+        if cargo is not None:
+            if salario is None:
+                if cargo.salario_base:
+                    salario = cargo.salario_base
+                else:
+                    erros['salario_nominal'] = [
+                        'Salário nominal é obrigatório quando o cargo não possui salário base definido.'
+                    ]
+            elif cargo.salario_base and salario < cargo.salario_base:
+                erros['salario_nominal'] = [
+                    'Salário nominal não pode ser inferior ao salário base do cargo.'
+                ]
+
+        if erros:
+            raise ValidationError(erros)
+
+        funcionario = Funcionario(
+            pessoa_fisica=pessoa,
+            empresa=empresa,
+            cargo=cargo,
+            salario_nominal=salario,
+            created_by=user,
+            **dados_funcionario
+        )
+        funcionario.full_clean(
+            exclude=['pessoa_fisica', 'empresa', 'cargo', 'matricula', *_CAMPOS_AUDITORIA],
+            validate_unique=False,
+            validate_constraints=False
+        )
+
+        contexto['cpfs_vistos'].add(cpf)
+        return linha, funcionario, pessoa_nova
+
+    @staticmethod
+    def _gravar_lote(validos: list, contexto: dict) -> None:
+        from apps.sst.models import ASO, ExameRealizado
+        from apps.sst.models.enums import Status, StatusExame, Tipo
+
+        user = contexto['user']
+        funcionarios = [funcionario for _, funcionario, _ in validos]
+
+        for funcionario, matricula in zip(funcionarios, Funcionario.gerar_matriculas(len(funcionarios))):
+            funcionario.matricula = matricula
+            funcionario.busca_texto = montar_texto_busca(funcionario)
+
+        PessoaFisica.objects.bulk_create([
+            funcionario.pessoa_fisica
+            for _, funcionario, pessoa_nova in validos
+            if pessoa_nova
+        ])
+        Funcionario.objects.bulk_create(funcionarios)
+
+        asos = ASO.objects.bulk_create([
+            ASO(
+                funcionario=funcionario,
+                tipo=Tipo.ADMISSIONAL,
+                status=Status.ABERTO,
+                created_by=user
+            )
+            for funcionario in funcionarios
+        ])
+        ExameRealizado.objects.bulk_create([
+            ExameRealizado(
+                aso=aso,
+                exame_id=exame_id,
+                status=StatusExame.PENDENTE,
+                created_by=user
+            )
+            for aso in asos
+            for exame_id in contexto['exames_por_cargo'][aso.funcionario.cargo_id]
+        ])
+
+        ContadorFuncionarioService.registrar_lote(
+            list(ContadorFuncionarioService.estados(funcionarios).values())
+        )
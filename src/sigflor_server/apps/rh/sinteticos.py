@@ -0,0 +1,445 @@
+"""
+Geração de dados sintéticos em volume para medir selectors e services.
+
+Os volumes padrão (VOLUMES_PADRAO) imitam uma operação grande: 50 filiais,
+500 projetos e 100 mil funcionários, com dependentes, equipes, ASOs (com os
+exames do cargo) e entregas de EPI. `escala` multiplica todos os volumes
+(ex: 0.01 para uma base de desenvolvimento).
+
+Tudo é gravado com bulk_create, em lotes transacionais de `tamanho_lote`
+funcionários; saves e signals não rodam, então os campos derivados
+(matrícula, número do projeto, texto de busca, `tem_dependente`) são
+preenchidos aqui e os contadores do RH são reconstruídos no final.
+
+CPFs e CNPJs são válidos (dígitos calculados por apps.comum.validators) e
+derivados da `semente`: a mesma semente gera os mesmos documentos, então
+use outra semente para acrescentar dados a uma base já semeada.
+"""
+
+import random
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.comum import sequencias
+from apps.comum.models import (
+    Cliente, Empresa, Filial, PessoaFisica, PessoaJuridica, Projeto
+)
+from apps.comum.models.enums import UF, EstadoCivil, Sexo, StatusProjeto
+from apps.comum.validators import completar_cnpj, completar_cpf
+from .busca import montar_texto_busca
+from .models import (
+    Cargo, Dependente, Equipe, EquipeFuncionario, Funcionario
+)
+from .models.enums import NivelCargo, Parentesco, StatusFuncionario, TipoContrato, TipoEquipe
+from .services.estatisticas import ContadorFuncionarioService
+
+VOLUMES_PADRAO = {
+    'empresas': 3,
+    'clientes': 40,
+    'filiais': 50,
+    'projetos': 500,
+    'funcionarios': 100_000,
+}
+
+TAMANHO_LOTE_PADRAO = 2000
+MEMBROS_POR_EQUIPE = 20
+
+# Proporções por funcionário
+TAXA_COM_DEPENDENTES = 0.4
+TAXA_ASO_PERIODICO = 0.3
+ENTREGAS_EPI_POR_FUNCIONARIO = (1, 4)
+# Admissões espalhadas por 20 anos: ~5 mil por ano no volume padrão, dentro
+# das 9999 matrículas anuais
+ANOS_ADMISSAO = 20
+
+_NOMES = (
+    'Ana', 'Bruno', 'Carla', 'Daniel', 'Eduarda', 'Felipe', 'Gabriela', 'Henrique',
+    'Isabela', 'João', 'Larissa', 'Marcos', 'Natália', 'Otávio', 'Paula', 'Rafael',
+    'Sabrina', 'Thiago', 'Vanessa', 'Wellington',
+)
+_SOBRENOMES = (
+    'Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves', 'Pereira',
+    'Lima', 'Gomes', 'Costa', 'Ribeiro', 'Martins', 'Carvalho', 'Almeida', 'Lopes',
+    'Soares', 'Vieira', 'Barbosa', 'Rocha',
+)
+_CIDADES = (
+    'Campo Grande', 'Três Lagoas', 'Ribas do Rio Pardo', 'Água Clara', 'Brasilândia',
+    'Selvíria', 'Inocência', 'Aparecida do Taboado', 'Dourados', 'Chapadão do Sul',
+)
+
+# (nome, nível, salário base, CBO)
+_CARGOS = (
+    ('Auxiliar Florestal', NivelCargo.OPERACIONAL, '1518.00', '632005'),
+    ('Operador de Motosserra', NivelCargo.OPERACIONAL, '1900.00', '632120'),
+    ('Operador de Harvester', NivelCargo.OPERACIONAL, '3200.00', '641015'),
+    ('Operador de Forwarder', NivelCargo.OPERACIONAL, '3000.00', '641015'),
+    ('Viveirista', NivelCargo.OPERACIONAL, '1700.00', '621005'),
+    ('Motorista', NivelCargo.OPERACIONAL, '2400.00', '782510'),
+    ('Mecânico', NivelCargo.TECNICO, '2900.00', '914405'),
+    ('Técnico de Segurança do Trabalho', NivelCargo.TECNICO, '3500.00', '351605'),
+    ('Técnico Florestal', NivelCargo.TECNICO, '3300.00', '321210'),
+    ('Encarregado de Campo', NivelCargo.SUPERVISAO, '3800.00', '630105'),
+    ('Supervisor Operacional', NivelCargo.SUPERVISAO, '4800.00', '630105'),
+    ('Coordenador de Projeto', NivelCargo.COORDENACAO, '7500.00', '142105'),
+)
+_EXAMES = (
+    ('Exame Clínico', 12),
+    ('Audiometria', 12),
+    ('Hemograma', 12),
+    ('Acuidade Visual', 24),
+    ('Eletrocardiograma', 24),
+    ('Espirometria', None),
+)
+# (tipo, troca em dias)
+_TIPOS_EPI = (
+    ('Botina de Segurança', 180),
+    ('Luva de Vaqueta', 30),
+    ('Protetor Auricular Plug', 30),
+    ('Capacete com Jugular', 365),
+    ('Óculos de Proteção', 90),
+    ('Perneira de Segurança', 180),
+    ('Calça Anticorte', 180),
+)
+
+
+def gerar(*, escala: float = 1.0, tamanho_lote: int = TAMANHO_LOTE_PADRAO, semente: int = 1, user=None) -> dict:
+    """
+    Returns:
+        {'empresas', 'clientes', 'filiais', 'projetos', 'funcionarios',
+         'dependentes', 'equipes', 'asos', 'exames_realizados', 'entregas_epi'}
+        com a quantidade gravada de cada um.
+    """
+    volumes = {chave: max(1, int(valor * escala)) for chave, valor in VOLUMES_PADRAO.items()}
+    tamanho_lote = max(MEMBROS_POR_EQUIPE, int(tamanho_lote))
+    gerador = _Gerador(random.Random(semente), semente, user)
+
+    with transaction.atomic():
+        catalogo = gerador.catalogo()
+        estrutura = gerador.estrutura(volumes)
+
+    relatorio = {chave: len(estrutura[chave]) for chave in ('empresas', 'clientes', 'filiais', 'projetos')}
+    for chave in ('funcionarios', 'dependentes', 'equipes', 'asos', 'exames_realizados', 'entregas_epi'):
+        relatorio[chave] = 0
+
+    restantes = volumes['funcionarios']
+    while restantes > 0:
+        quantidade = min(tamanho_lote, restantes)
+        with transaction.atomic():
+            for chave, total in gerador.lote_funcionarios(quantidade, catalogo, estrutura).items():
+                relatorio[chave] += total
+        restantes -= quantidade
+
+    ContadorFuncionarioService.reconstruir()
+    return relatorio
+
+
+class _Gerador:
+
+    def __init__(self, rng: random.Random, semente: int, user):
+        self.rng = rng
+        self.semente = semente
+        self.user = user
+        self.hoje = timezone.localdate()
+        # Faixas de documentos derivadas da semente, percorridas em sequência (sem repetição)
+        self._cpfs = _documentos(completar_cpf, 9, rng.randrange(10 ** 8, 8 * 10 ** 8))
+        self._cnpjs = _documentos(completar_cnpj, 8, rng.randrange(10 ** 7, 8 * 10 ** 7), sufixo='0001')
+        self._equipes = 0
+
+    # ------------------------------------------------------------------
+    # Catálogos (reaproveitados entre execuções)
+    # ------------------------------------------------------------------
+
+    def catalogo(self) -> dict:
+        from apps.sst.models import EPI, CargoEPI, CargoExame, Exame, TipoEPI
+
+        cargos = []
+        for nome, nivel, salario, cbo in _CARGOS:
+            cargo, _ = Cargo.objects.get_or_create(
+                nome=nome,
+                defaults={'nivel': nivel, 'salario_base': Decimal(salario), 'cbo': cbo, 'created_by': self.user},
+            )
+            cargos.append(cargo)
+
+        exames = {}
+        for nome, periodicidade in _EXAMES:
+            exame, _ = Exame.objects.get_or_create(nome=nome, defaults={'created_by': self.user})
+            exames[exame.pk] = periodicidade
+
+        tipos_epi = {}
+        epis_por_tipo = {}
+        for indice, (nome, troca_dias) in enumerate(_TIPOS_EPI):
+            tipo, _ = TipoEPI.objects.get_or_create(nome=nome, defaults={'created_by': self.user})
+            tipos_epi[tipo.pk] = troca_dias
+            epis_por_tipo[tipo.pk] = [
+                EPI.objects.get_or_create(
+                    ca=f'{90000 + indice * 10 + variante}',
+                    defaults={'tipo': tipo, 'fabricante': f'Fabricante {variante + 1}', 'created_by': self.user},
+                )[0].pk
+                for variante in range(2)
+            ]
+
+        exames_por_cargo = {}
+        tipos_epi_por_cargo = {}
+        for cargo in cargos:
+            exames_cargo = self.rng.sample(list(exames), k=self.rng.randint(2, len(exames)))
+            for exame_id in exames_cargo:
+                CargoExame.objects.get_or_create(
+                    cargo=cargo, exame_id=exame_id,
+                    defaults={'periodicidade_meses': exames[exame_id], 'created_by': self.user},
+                )
+            exames_por_cargo[cargo.pk] = list(
+                CargoExame.objects.filter(cargo=cargo).values_list('exame_id', 'periodicidade_meses')
+            )
+
+            for tipo_id in self.rng.sample(list(tipos_epi), k=self.rng.randint(2, 5)):
+                CargoEPI.objects.get_or_create(
+                    cargo=cargo, tipo_epi_id=tipo_id,
+                    defaults={'periodicidade_troca_dias': tipos_epi[tipo_id], 'created_by': self.user},
+                )
+            tipos_epi_por_cargo[cargo.pk] = list(
+                CargoEPI.objects.filter(cargo=cargo).values_list('tipo_epi_id', 'periodicidade_troca_dias')
+            )
+
+        return {
+            'cargos': cargos,
+            'exames_por_cargo': exames_por_cargo,
+            'tipos_epi_por_cargo': tipos_epi_por_cargo,
+            'epis_por_tipo': epis_por_tipo,
+        }
+
+    # ------------------------------------------------------------------
+    # Empresas, clientes, filiais e projetos
+    # ------------------------------------------------------------------
+
+    def estrutura(self, volumes: dict) -> dict:
+        empresas = self._pessoas_juridicas(Empresa, volumes['empresas'], 'Florestal')
+        clientes = self._pessoas_juridicas(
+            Cliente, volumes['clientes'], 'Celulose',
+            empresa_gestora=lambda: self.rng.choice(empresas)
+        )
+
+        filiais = Filial.objects.bulk_create([
+            Filial(
+                nome=f'Filial {indice + 1:03d}',
+                codigo_interno=f'SIN-{self.semente}-{indice + 1:03d}',
+                empresa=self.rng.choice(empresas),
+                created_by=self.user,
+            )
+            for indice in range(volumes['filiais'])
+        ])
+
+        prefixo = f'PRJ-{self.hoje.year}{self.hoje.month:02d}-'
+        primeiro = sequencias.reservar(
+            f'projeto.numero.{self.hoje.year}{self.hoje.month:02d}',
+            volumes['projetos'],
+            inicial=lambda: Projeto._ultimo_numero(prefixo)
+        )
+        projetos = []
+        for indice in range(volumes['projetos']):
+            cliente = self.rng.choice(clientes)
+            projetos.append(Projeto(
+                numero=f'{prefixo}{primeiro + indice:04d}',
+                descricao=f'Manejo Florestal - Talhão {indice + 1}',
+                cliente=cliente,
+                empresa_id=cliente.empresa_gestora_id,
+                filial=self.rng.choice(filiais),
+                data_inicio=self.hoje - timedelta(days=self.rng.randint(30, 2000)),
+                status=StatusProjeto.EM_EXECUCAO,
+                created_by=self.user,
+            ))
+        Projeto.objects.bulk_create(projetos)
+
+        return {'empresas': empresas, 'clientes': clientes, 'filiais': filiais, 'projetos': projetos}
+
+    def _pessoas_juridicas(self, modelo, quantidade: int, ramo: str, **extras) -> list:
+        pessoas = PessoaJuridica.objects.bulk_create([
+            PessoaJuridica(
+                razao_social=f'{ramo} {self.rng.choice(_SOBRENOMES)} {indice + 1} Ltda',
+                cnpj=next(self._cnpjs),
+                created_by=self.user,
+            )
+            for indice in range(quantidade)
+        ])
+        return modelo.objects.bulk_create([
+            modelo(
+                pessoa_juridica=pessoa,
+                created_by=self.user,
+                **{campo: valor() for campo, valor in extras.items()}
+            )
+            for pessoa in pessoas
+        ])
+
+    # ------------------------------------------------------------------
+    # Funcionários e tudo que pende deles
+    # ------------------------------------------------------------------
+
+    def lote_funcionarios(self, quantidade: int, catalogo: dict, estrutura: dict) -> dict:
+        from apps.sst.models import ASO, EntregaEPI, ExameRealizado
+        from apps.sst.models.enums import Resultado, ResultadoExame, Status, StatusExame, Tipo
+
+        rng = self.rng
+        pessoas = [self._pessoa_fisica(idade=(18, 60)) for _ in range(quantidade)]
+        funcionarios = []
+        for pessoa in pessoas:
+            cargo = rng.choice(catalogo['cargos'])
+            funcionarios.append(Funcionario(
+                pessoa_fisica=pessoa,
+                empresa=rng.choice(estrutura['empresas']),
+                cargo=cargo,
+                data_admissao=self._data_admissao(pessoa),
+                status=rng.choices(
+                    [StatusFuncionario.ATIVO, StatusFuncionario.AFASTADO, StatusFuncionario.FERIAS,
+                     StatusFuncionario.AGUARDANDO_ADMISSAO],
+                    weights=[85, 4, 6, 5]
+                )[0],
+                tipo_contrato=rng.choices([TipoContrato.CLT, TipoContrato.TEMPORARIO], weights=[92, 8])[0],
+                salario_nominal=cargo.salario_base,
+                cidade_atual=rng.choice(_CIDADES),
+                created_by=self.user,
+            ))
+        # Matrícula do ano de admissão: o sequencial anual tem 4 dígitos
+        por_ano = defaultdict(list)
+        for funcionario in funcionarios:
+            por_ano[funcionario.data_admissao.year].append(funcionario)
+        for ano, admitidos in por_ano.items():
+            for funcionario, matricula in zip(admitidos, Funcionario.gerar_matriculas(len(admitidos), ano=ano)):
+                funcionario.matricula = matricula
+                funcionario.busca_texto = montar_texto_busca(funcionario)
+
+        # Dependentes antes do bulk_create dos funcionários, para gravar `tem_dependente` junto
+        dependentes = []
+        for funcionario in funcionarios:
+            if rng.random() >= TAXA_COM_DEPENDENTES:
+                continue
+            funcionario.tem_dependente = True
+            for _ in range(rng.randint(1, 3)):
+                dependentes.append(Dependente(
+                    funcionario=funcionario,
+                    pessoa_fisica=self._pessoa_fisica(idade=(0, 17)),
+                    parentesco=Parentesco.FILHO,
+                    dependencia_irrf=rng.random() < 0.7,
+                    created_by=self.user,
+                ))
+
+        PessoaFisica.objects.bulk_create(pessoas + [d.pessoa_fisica for d in dependentes])
+        Funcionario.objects.bulk_create(funcionarios)
+        Dependente.objects.bulk_create(dependentes)
+
+        equipes, alocacoes = self._equipes_do_lote(funcionarios, estrutura['projetos'])
+
+        asos, exames = [], []
+        for funcionario in funcionarios:
+            tipos = [(Tipo.ADMISSIONAL, funcionario.data_admissao)]
+            if rng.random() < TAXA_ASO_PERIODICO:
+                tipos.append((Tipo.PERIODICO, self.hoje - timedelta(days=rng.randint(0, 60))))
+            for tipo, emissao in tipos:
+                finalizado = tipo == Tipo.ADMISSIONAL and funcionario.status != StatusFuncionario.AGUARDANDO_ADMISSAO
+                aso = ASO(
+                    funcionario=funcionario,
+                    tipo=tipo,
+                    status=Status.FINALIZADO if finalizado else Status.ABERTO,
+                    resultado=Resultado.APTO if finalizado else None,
+                    data_emissao=emissao if finalizado else None,
+                    created_by=self.user,
+                )
+                asos.append(aso)
+                for exame_id, periodicidade in catalogo['exames_por_cargo'][funcionario.cargo_id]:
+                    exames.append(ExameRealizado(
+                        aso=aso,
+                        exame_id=exame_id,
+                        status=StatusExame.REALIZADO if finalizado else StatusExame.PENDENTE,
+                        resultado=ResultadoExame.NORMAL if finalizado else None,
+                        data_realizacao=emissao if finalizado else None,
+                        data_validade=(
+                            emissao + timedelta(days=30 * periodicidade)
+                            if finalizado and periodicidade else None
+                        ),
+                        created_by=self.user,
+                    ))
+        ASO.objects.bulk_create(asos)
+        ExameRealizado.objects.bulk_create(exames)
+
+        entregas = []
+        for funcionario in funcionarios:
+            requisitos = catalogo['tipos_epi_por_cargo'][funcionario.cargo_id]
+            for _ in range(rng.randint(*ENTREGAS_EPI_POR_FUNCIONARIO)):
+                tipo_id, troca_dias = rng.choice(requisitos)
+                entrega = self.hoje - timedelta(days=rng.randint(0, 400))
+                entregas.append(EntregaEPI(
+                    funcionario=funcionario,
+                    epi_id=rng.choice(catalogo['epis_por_tipo'][tipo_id]),
+                    data_entrega=entrega,
+                    data_validade=entrega + timedelta(days=troca_dias),
+                    created_by=self.user,
+                ))
+        EntregaEPI.objects.bulk_create(entregas)
+
+        return {
+            'funcionarios': len(funcionarios),
+            'dependentes': len(dependentes),
+            'equipes': len(equipes),
+            'asos': len(asos),
+            'exames_realizados': len(exames),
+            'entregas_epi': len(entregas),
+        }
+
+    def _equipes_do_lote(self, funcionarios: list, projetos: list) -> tuple:
+        """Equipes de MEMBROS_POR_EQUIPE funcionários; o primeiro de cada grupo é o líder."""
+        equipes, alocacoes = [], []
+        iterador = iter(funcionarios)
+        while grupo := list(islice(iterador, MEMBROS_POR_EQUIPE)):
+            self._equipes += 1
+            equipe = Equipe(
+                nome=f'Equipe SIN-{self.semente}-{self._equipes:05d}',
+                tipo_equipe=self.rng.choice(TipoEquipe.values),
+                projeto=self.rng.choice(projetos),
+                lider=grupo[0],
+                coordenador=grupo[-1],
+                created_by=self.user,
+            )
+            equipes.append(equipe)
+            alocacoes.extend(
+                EquipeFuncionario(
+                    equipe=equipe,
+                    funcionario=membro,
+                    data_entrada=membro.data_admissao,
+                    created_by=self.user,
+                )
+                for membro in grupo
+            )
+        Equipe.objects.bulk_create(equipes)
+        EquipeFuncionario.objects.bulk_create(alocacoes)
+        return equipes, alocacoes
+
+    def _data_admissao(self, pessoa: PessoaFisica):
+        """Admissão nos últimos ANOS_ADMISSAO anos, depois dos 18 anos da pessoa."""
+        maioridade = (self.hoje - pessoa.data_nascimento).days - 18 * 365
+        return self.hoje - timedelta(days=self.rng.randint(15, max(15, min(ANOS_ADMISSAO * 365, maioridade))))
+
+    def _pessoa_fisica(self, *, idade: tuple) -> PessoaFisica:
+        rng = self.rng
+        nascimento = self.hoje - timedelta(days=rng.randint(idade[0] * 365, idade[1] * 365 + 364))
+        return PessoaFisica(
+            nome_completo=f'{rng.choice(_NOMES)} {rng.choice(_SOBRENOMES)} {rng.choice(_SOBRENOMES)}',
+            cpf=next(self._cpfs),
+            data_nascimento=nascimento,
+            sexo=rng.choice([Sexo.MASCULINO, Sexo.FEMININO]),
+            estado_civil=rng.choice(EstadoCivil.values),
+            naturalidade=UF.MS if rng.random() < 0.7 else rng.choice(UF.values),
+            created_by=self.user,
+        )
+
+
+def _documentos(completar, digitos_base: int, inicio: int, sufixo: str = ''):
+    """Documentos válidos e distintos a partir de `inicio` (bases com todos os dígitos iguais são puladas)."""
+    numero = inicio
+    while True:
+        documento = completar(f'{numero:0{digitos_base}d}{sufixo}')
+        numero += 1
+        if len(set(documento)) > 1:
+            yield documento
@@ -7,6 +7,8 @@ from .views import (
     DependenteViewSet,
     EquipeViewSet,
     EquipeFuncionarioViewSet,
+    EstatisticasFuncionariosView,
+    EstatisticasDependentesView,
 )
 
 router = DefaultRouter()
@@ -17,5 +19,8 @@ router.register(r'equipes', EquipeViewSet, basename='equipe')
 router.register(r'equipe-funcionarios', EquipeFuncionarioViewSet, basename='equipe-funcionario')
 
 urlpatterns = [
+    # Painéis assíncronos: antes do router, nas mesmas URLs das antigas actions
+    path('funcionarios/estatisticas/', EstatisticasFuncionariosView.as_view(), name='funcionario-estatisticas'),
+    path('dependentes/estatisticas/', EstatisticasDependentesView.as_view(), name='dependente-estatisticas'),
     path('', include(router.urls)),
 ]
@@ -3,6 +3,7 @@ from .cargos import CargoViewSet
 from .funcionarios import FuncionarioViewSet
 from .dependentes import DependenteViewSet
 from .equipes import EquipeViewSet, EquipeFuncionarioViewSet
+from .paineis import EstatisticasFuncionariosView, EstatisticasDependentesView
 
 __all__ = [
     'CargoViewSet',
@@ -10,4 +11,6 @@ __all__ = [
     'DependenteViewSet',
     'EquipeViewSet',
     'EquipeFuncionarioViewSet',
+    'EstatisticasFuncionariosView',
+    'EstatisticasDependentesView',
 ]
@@ -6,7 +6,6 @@ from apps.comum.views.base import BaseRBACViewSet
 from ..models import Dependente
 from ..serializers import DependenteSerializer, DependenteUpdateSerializer
 from ..services import DependenteService
-from .. import selectors
 
 class DependenteViewSet(BaseRBACViewSet):
     
@@ -17,7 +16,6 @@ class DependenteViewSet(BaseRBACViewSet):
         'excluir_ir': 'rh_dependentes_escrever',
         'incluir_plano_saude': 'rh_dependentes_escrever',
         'excluir_plano_saude': 'rh_dependentes_escrever',
-        'estatisticas': 'rh_dependentes_ler',
         'funcionarios_com_dependentes': 'rh_dependentes_ler',
     }
 
@@ -56,9 +54,3 @@ class DependenteViewSet(BaseRBACViewSet):
             dependente, dependencia_irrf=False, updated_by=request.user
         )
         return Response(self.get_serializer(dependente).data)
-
-    @action(detail=False, methods=['get'])
-    def estatisticas(self, request):
-        stats = selectors.estatisticas_dependentes(user=request.user)
-        return Response(stats)
-
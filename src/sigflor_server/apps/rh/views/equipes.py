@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.core.exceptions import ValidationError
 
+from apps.comum.views.base import CamposEsparsosMixin, KeysetPaginatedMixin
 from ..models import Equipe, EquipeFuncionario
 from ..serializers import (
     EquipeSerializer,
@@ -19,7 +20,7 @@ from ..services import EquipeService
 from .. import selectors
 
 
-class EquipeViewSet(viewsets.ModelViewSet):
+class EquipeViewSet(CamposEsparsosMixin, KeysetPaginatedMixin, viewsets.ModelViewSet):
 
     permissao_leitura = 'rh_equipes_ler'
     permissao_escrita = 'rh_equipes_escrever'
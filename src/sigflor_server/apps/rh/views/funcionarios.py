@@ -1,21 +1,30 @@
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from rest_framework.parsers import JSONParser, FormParser
+from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
 
 
+from apps.comum.views.base import CamposEsparsosMixin, KeysetPaginatedMixin, detalhe_condicional
 from .utils import NestedMultipartParser
 from ..models import Funcionario
 from ..serializers import (
     FuncionarioSerializer,
     FuncionarioCreateSerializer,
-    FuncionarioListSerializer
+    FuncionarioListSerializer,
+    FuncionarioImportacaoSerializer,
+    FuncionarioPendenciasSerializer
+)
+from ..services import (
+    ComplianceAdmissaoService,
+    ExportacaoFuncionarioService,
+    FuncionarioService,
+    ImportacaoAdmissaoService
 )
-from ..services import FuncionarioService
 from .. import selectors
 
 
-class FuncionarioViewSet(viewsets.ModelViewSet):
+class FuncionarioViewSet(CamposEsparsosMixin, KeysetPaginatedMixin, viewsets.ModelViewSet):
 
     parser_classes = (JSONParser, NestedMultipartParser, FormParser)
 
@@ -27,27 +36,24 @@ class FuncionarioViewSet(viewsets.ModelViewSet):
         return FuncionarioSerializer
 
     def get_queryset(self):
-        busca = self.request.query_params.get('busca')
-        status_filter = self.request.query_params.get('status')
-        tipo_contrato = self.request.query_params.get('tipo_contrato')
-        empresa_id = self.request.query_params.get('empresa_id')
-        cargo_id = self.request.query_params.get('cargo_id')
-        projeto_id = self.request.query_params.get('projeto_id')
-        apenas_ativos = self.request.query_params.get('apenas_ativos', '').lower() == 'true'
-        tem_dependente = self.request.query_params.get('tem_dependente').lower() == 'true'
-        
         return selectors.funcionario_list(
             user=self.request.user,
-            busca=busca,
-            status=status_filter,
-            tipo_contrato=tipo_contrato,
-            empresa_id=empresa_id,
-            cargo_id=cargo_id,
-            projeto_id=projeto_id,
-            apenas_ativos=apenas_ativos,
-            tem_dependente=tem_dependente
+            **self._filtros_listagem()
         )
 
+    def _filtros_listagem(self) -> dict:
+        params = self.request.query_params
+        return {
+            'busca': params.get('busca'),
+            'status': params.get('status'),
+            'tipo_contrato': params.get('tipo_contrato'),
+            'empresa_id': params.get('empresa_id'),
+            'cargo_id': params.get('cargo_id'),
+            'projeto_id': params.get('projeto_id'),
+            'apenas_ativos': params.get('apenas_ativos', '').lower() == 'true',
+            'tem_dependente': params.get('tem_dependente', '').lower() == 'true',
+        }
+
     def create(self, request, *args, **kwargs):
 
         serializer = self.get_serializer(data=request.data)
@@ -78,6 +84,38 @@ class FuncionarioViewSet(viewsets.ModelViewSet):
         serializer = FuncionarioSerializer(funcionario)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    # Parser padrão: o NestedMultipartParser entrega os arquivos em listas
+    @action(detail=False, methods=['post'], url_path='importar', parser_classes=[MultiPartParser])
+    def importar(self, request):
+        """
+        Admissão em lote a partir de planilha CSV/XLSX.
+        Retorna o relatório com as linhas importadas e os erros por linha.
+        """
+        serializer = FuncionarioImportacaoSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        relatorio = ImportacaoAdmissaoService.importar(
+            user=request.user,
+            **serializer.validated_data
+        )
+
+        status_code = status.HTTP_201_CREATED if relatorio['importados'] else status.HTTP_400_BAD_REQUEST
+        return Response(relatorio, status=status_code)
+
+    @action(detail=False, methods=['get'], url_path='exportar')
+    def exportar(self, request):
+        """
+        Exporta a listagem (mesmos filtros do list) em CSV ou XLSX.
+        Parâmetro: formato=csv|xlsx (padrão csv). A resposta é enviada em fluxo.
+        """
+        conteudo, content_type, nome_arquivo = ExportacaoFuncionarioService.exportar(
+            self.get_queryset(),
+            formato=request.query_params.get('formato')
+        )
+        response = StreamingHttpResponse(conteudo, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{nome_arquivo}"'
+        return response
+
     @action(detail=True, methods=['post'], url_path='dependentes')
     def adicionar_dependente(self, request, pk=None):
         funcionario = self.get_object()
@@ -92,6 +130,7 @@ class FuncionarioViewSet(viewsets.ModelViewSet):
         
         return Response(status=status.HTTP_201_CREATED)
 
+    @detalhe_condicional(lambda request, pk: selectors.funcionario_versao(user=request.user, pk=pk))
     def retrieve(self, request, pk=None):
         try:
             funcionario = selectors.funcionario_detail(user=request.user, pk=pk)
@@ -255,33 +294,45 @@ class FuncionarioViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-    @action(detail=False, methods=['get'])
-    def estatisticas(self, request):
-        stats = selectors.estatisticas_rh(user=request.user)
-        return Response(stats)
-
     @action(detail=False, methods=['get'])
     def aniversariantes(self, request):
         mes = request.query_params.get('mes')
         if mes:
             mes = int(mes)
         aniversariantes = selectors.aniversariantes_mes(user=request.user, mes=mes)
-        serializer = FuncionarioListSerializer(aniversariantes, many=True)
-        return Response(serializer.data)
+        return self.listar_paginado(aniversariantes, FuncionarioListSerializer)
 
     @action(detail=False, methods=['get'])
     def ativos(self, request):
         """Lista apenas funcionarios ativos."""
         funcionarios = selectors.funcionarios_ativos(user=request.user)
-        serializer = FuncionarioListSerializer(funcionarios, many=True)
-        return Response(serializer.data)
+        return self.listar_paginado(funcionarios, FuncionarioListSerializer)
 
     @action(detail=False, methods=['get'])
     def afastados(self, request):
         funcionarios = selectors.funcionarios_afastados(user=request.user)
-        serializer = FuncionarioListSerializer(funcionarios, many=True)
-        return Response(serializer.data)
+        return self.listar_paginado(funcionarios, FuncionarioListSerializer)
     
+    @action(detail=False, methods=['get'], url_path='pendencias-admissao')
+    def pendencias_admissao(self, request):
+        """
+        Painel de pendências de admissão (cadastro, ASO, documentos e EPIs)
+        dos funcionários aguardando admissão. A avaliação é feita em lote
+        para a página corrente.
+        """
+        funcionarios = selectors.funcionarios_pendencias_admissao(
+            user=request.user,
+            projeto_id=request.query_params.get('projeto_id'),
+            empresa_id=request.query_params.get('empresa_id'),
+            cargo_id=request.query_params.get('cargo_id'),
+        )
+        page = self.paginate_queryset(funcionarios)
+        avaliacoes = ComplianceAdmissaoService.avaliar(page)
+        serializer = FuncionarioPendenciasSerializer(
+            page, many=True, context={'avaliacoes': avaliacoes}
+        )
+        return self.get_paginated_response(serializer.data)
+
     @action(detail=True, methods=['get'])
     def historico_alocacoes(self, request, pk=None):
         funcionario = self.get_object()
@@ -0,0 +1,16 @@
+from apps.comum.views.paineis import PainelAssincronoView
+from .. import selectors
+
+
+class EstatisticasFuncionariosView(PainelAssincronoView):
+    permissao = 'rh_funcionarios_ler'
+
+    async def consultar(self, request, user) -> dict:
+        return await selectors.estatisticas_rh_async(user=user)
+
+
+class EstatisticasDependentesView(PainelAssincronoView):
+    permissao = 'rh_dependentes_ler'
+
+    async def consultar(self, request, user) -> dict:
+        return await selectors.estatisticas_dependentes_async(user=user)
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.sst.services.agendamento_aso import (
+    DIAS_ANTECEDENCIA_PADRAO, TAMANHO_LOTE_PADRAO, AgendamentoASOService
+)
+
+
+class Command(BaseCommand):
+    help = 'Gera os ASOs periódicos dos funcionários com exames vencidos ou a vencer.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dias',
+            type=int,
+            default=DIAS_ANTECEDENCIA_PADRAO,
+            help='Antecedência, em dias, em relação ao vencimento dos exames.'
+        )
+        parser.add_argument(
+            '--data-referencia',
+            help='Data base no formato AAAA-MM-DD (padrão: hoje).'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=TAMANHO_LOTE_PADRAO,
+            help='Quantidade de funcionários por lote de gravação.'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas informa quantos funcionários seriam atendidos.'
+        )
+
+    def handle(self, *args, **options):
+        data_referencia = None
+        if options['data_referencia']:
+            data_referencia = parse_date(options['data_referencia'])
+            if data_referencia is None:
+                raise CommandError('Data de referência inválida. Use o formato AAAA-MM-DD.')
+
+        resultado = AgendamentoASOService.gerar_periodicos(
+            dias_antecedencia=options['dias'],
+            data_referencia=data_referencia,
+            tamanho_lote=options['chunk_size'],
+            simular=options['dry_run'],
+        )
+
+        if options['dry_run']:
+            self.stdout.write(
+                f"{resultado['elegiveis']} funcionário(s) com exames vencendo até "
+                f"{resultado['data_limite']:%d/%m/%Y}."
+            )
+            return
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{resultado['asos_criados']} ASO(s) periódico(s) gerado(s) com "
+            f"{resultado['exames_criados']} exame(s) pendente(s)."
+        ))
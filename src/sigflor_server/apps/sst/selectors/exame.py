@@ -19,7 +19,7 @@ def exame_detail(*, user: Usuario, pk: str) -> Exame:
 
 
 def exame_get_by_id_irrestrito(*, user: Usuario, pk: str) -> Optional[Exame]:
-    return Exame.objects.filter(pk=pk).first()
+    return Exame.all_objects.filter(pk=pk).first()
 
 
 def exame_list_selection(*, user: Usuario) -> QuerySet[Exame]:
@@ -5,7 +5,11 @@ from .exame import (
     CargoExameSerializer 
 )
 from .aso import ASOSerializer, ASOCreateSerializer, ASOConclusaoSerializer
-from .exame_realizado import ExameRealizadoSerializer, ExameRealizadoUpdateSerializer
+from .exame_realizado import (
+    ExameRealizadoSerializer,
+    ExameRealizadoUpdateSerializer,
+    ExameRealizadoImportacaoSerializer
+)
 from .epi import TipoEPISerializer, EPISerializer, CargoEPISerializer, CargoEpiNestedSerializer
 from .entrega_epi import EntregaEPIReadSerializer, EntregaEPICreateSerializer
 
@@ -19,6 +23,7 @@ __all__ = [
     'ASOConclusaoSerializer',
     'ExameRealizadoSerializer',
     'ExameRealizadoUpdateSerializer',
+    'ExameRealizadoImportacaoSerializer',
     'TipoEPISerializer',
     'EPISerializer',
     'CargoEPISerializer',
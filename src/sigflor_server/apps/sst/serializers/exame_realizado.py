@@ -40,3 +40,14 @@ class ExameRealizadoUpdateSerializer(serializers.ModelSerializer):
             'arquivo',
             'observacoes',
         ]
+
+
+class ExameRealizadoImportacaoSerializer(serializers.Serializer):
+    """Entrada da importação de resultados enviados pela clínica (planilha CSV ou XLSX)."""
+    arquivo = serializers.FileField()
+
+    def validate_arquivo(self, value):
+        nome = (value.name or '').lower()
+        if not nome.endswith(('.csv', '.xlsx')):
+            raise serializers.ValidationError('Envie um arquivo CSV ou XLSX.')
+        return value
@@ -2,10 +2,16 @@ from .exame import ExameService
 from .aso import ASOService
 from .epi import EPIService
 from .entrega_epi import EntregaEPIService
+from .previsao_epi import PrevisaoEPIService
+from .agendamento_aso import AgendamentoASOService
+from .importacao_exames import ImportacaoResultadoExameService
 
 __all__ = [
     'ExameService',
     'ASOService',
     'EPIService',
     'EntregaEPIService',
+    'PrevisaoEPIService',
+    'AgendamentoASOService',
+    'ImportacaoResultadoExameService',
 ]
\ No newline at end of file
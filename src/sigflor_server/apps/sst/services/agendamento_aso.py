@@ -0,0 +1,154 @@
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Exists, Max, OuterRef
+
+from apps.autenticacao.models import Usuario
+from apps.sst.models import ASO, CargoExame, ExameRealizado
+from apps.sst.models.enums import Status, StatusExame, Tipo
+
+DIAS_ANTECEDENCIA_PADRAO = 30
+TAMANHO_LOTE_PADRAO = 500
+
+
+class AgendamentoASOService:
+    """
+    Geração em lote dos ASOs periódicos a partir da validade dos exames.
+
+    Um funcionário entra na rodada quando algum exame periódico exigido pelo
+    seu cargo atual (CargoExame com `periodicidade_meses`) tem a última
+    realização válida até `data_referencia + dias_antecedencia`. Para ele é
+    criado um ASO PERIODICO com os exames periódicos do cargo pendentes,
+    como em ASOService.gerar_solicitacao.
+
+    A seleção é feita com agregações no banco e a gravação com bulk_create
+    em lotes, cada lote em sua própria transação. Funcionários com ASO
+    periódico em aberto são ignorados, o que torna a rodada idempotente.
+    """
+
+    @staticmethod
+    def gerar_periodicos(
+        *,
+        dias_antecedencia: int = DIAS_ANTECEDENCIA_PADRAO,
+        data_referencia: date = None,
+        tamanho_lote: int = TAMANHO_LOTE_PADRAO,
+        user: Usuario = None,
+        simular: bool = False,
+    ) -> dict:
+        """
+        Retorna {'elegiveis', 'asos_criados', 'exames_criados', 'data_limite'}.
+        Com `simular=True` apenas contabiliza os funcionários elegíveis.
+        """
+        data_referencia = data_referencia or date.today()
+        data_limite = data_referencia + timedelta(days=max(0, int(dias_antecedencia)))
+        tamanho_lote = max(1, int(tamanho_lote))
+
+        elegiveis = AgendamentoASOService._funcionarios_elegiveis(data_limite)
+        resultado = {
+            'data_limite': data_limite,
+            'elegiveis': len(elegiveis),
+            'asos_criados': 0,
+            'exames_criados': 0,
+        }
+        if simular or not elegiveis:
+            return resultado
+
+        exames_por_cargo = defaultdict(list)
+        for cargo_id, exame_id in CargoExame.objects.filter(
+            cargo_id__in=set(elegiveis.values()),
+            periodicidade_meses__isnull=False,
+            deleted_at__isnull=True
+        ).values_list('cargo_id', 'exame_id'):
+            exames_por_cargo[cargo_id].append(exame_id)
+
+        funcionario_ids = sorted(elegiveis)
+        for inicio in range(0, len(funcionario_ids), tamanho_lote):
+            lote = {pk: elegiveis[pk] for pk in funcionario_ids[inicio:inicio + tamanho_lote]}
+            asos, exames = AgendamentoASOService._gravar_lote(lote, exames_por_cargo, user)
+            resultado['asos_criados'] += asos
+            resultado['exames_criados'] += exames
+
+        return resultado
+
+    @staticmethod
+    def _funcionarios_elegiveis(data_limite: date) -> dict:
+        """Retorna {funcionario_id: cargo_id} dos funcionários com exame periódico a vencer."""
+        from apps.rh.models import StatusFuncionario
+
+        exigido_pelo_cargo = CargoExame.objects.filter(
+            cargo_id=OuterRef('aso__funcionario__cargo_id'),
+            exame_id=OuterRef('exame_id'),
+            periodicidade_meses__isnull=False,
+            deleted_at__isnull=True
+        )
+        aso_periodico_aberto = ASO.objects.filter(
+            funcionario_id=OuterRef('aso__funcionario_id'),
+            tipo=Tipo.PERIODICO,
+            status__in=[Status.ABERTO, Status.EM_ANDAMENTO],
+            deleted_at__isnull=True
+        )
+
+        vencimentos = (
+            ExameRealizado.objects
+            .filter(
+                status=StatusExame.REALIZADO,
+                data_validade__isnull=False,
+                deleted_at__isnull=True,
+                aso__deleted_at__isnull=True,
+                aso__funcionario__deleted_at__isnull=True,
+                aso__funcionario__status__in=[StatusFuncionario.ATIVO, StatusFuncionario.FERIAS],
+            )
+            .filter(Exists(exigido_pelo_cargo))
+            .exclude(Exists(aso_periodico_aberto))
+            .values('aso__funcionario_id', 'aso__funcionario__cargo_id', 'exame_id')
+            .annotate(ultima_validade=Max('data_validade'))
+            .filter(ultima_validade__lte=data_limite)
+            .order_by()
+        )
+
+        return {
+            linha['aso__funcionario_id']: linha['aso__funcionario__cargo_id']
+            for linha in vencimentos
+        }
+
+    @staticmethod
+    @transaction.atomic
+    def _gravar_lote(lote: dict, exames_por_cargo: dict, user: Usuario) -> tuple[int, int]:
+        from apps.rh.models import Funcionario
+
+        # Serializa com execuções concorrentes e com ASOService.gerar_solicitacao
+        list(Funcionario.objects.select_for_update().filter(pk__in=lote).values_list('pk', flat=True))
+        com_aberto = set(
+            ASO.objects.filter(
+                funcionario_id__in=lote,
+                tipo=Tipo.PERIODICO,
+                status__in=[Status.ABERTO, Status.EM_ANDAMENTO],
+                deleted_at__isnull=True
+            ).values_list('funcionario_id', flat=True)
+        )
+
+        asos = [
+            ASO(
+                funcionario_id=funcionario_id,
+                tipo=Tipo.PERIODICO,
+                status=Status.ABERTO,
+                created_by=user
+            )
+            for funcionario_id, cargo_id in lote.items()
+            if funcionario_id not in com_aberto and exames_por_cargo.get(cargo_id)
+        ]
+        ASO.objects.bulk_create(asos)
+
+        exames = ExameRealizado.objects.bulk_create([
+            ExameRealizado(
+                aso=aso,
+                exame_id=exame_id,
+                status=StatusExame.PENDENTE,
+                created_by=user
+            )
+            for aso in asos
+            for exame_id in exames_por_cargo[lote[aso.funcionario_id]]
+        ])
+
+        return len(asos), len(exames)
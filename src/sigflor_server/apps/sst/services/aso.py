@@ -12,6 +12,16 @@ from apps.sst.models.enums import Status, StatusExame, Tipo
 class ASOService:
 
     @staticmethod
+    def gerar_admissional_tarefa(*, funcionario_id: str, user_id: str | None = None) -> None:
+        """Tarefa em segundo plano enfileirada por FuncionarioService.create."""
+        funcionario = Funcionario.objects.select_related('cargo').get(pk=funcionario_id)
+        user = Usuario.objects.filter(pk=user_id).first() if user_id else None
+        ASOService.gerar_solicitacao(
+            funcionario=funcionario,
+            tipo=Tipo.ADMISSIONAL,
+            user=user
+        )
+
     @staticmethod
     @transaction.atomic
     def gerar_solicitacao(
@@ -26,8 +36,16 @@ class ASOService:
         Regras Admissional:
         - Só pode ser gerado se funcionário estiver AGUARDANDO_ADMISSAO (ou similar).
         - Só pode existir UM ASO Admissional por funcionário (neste contexto).
+
+        Regras Periódico:
+        - Inclui apenas os exames do cargo com periodicidade definida.
+          (Em lote, ver AgendamentoASOService.gerar_periodicos.)
         """
-        
+
+        # Trava o funcionário antes das verificações de ASO em aberto, como
+        # faz a geração em lote, para que as duas não criem ASOs duplicados
+        list(Funcionario.objects.select_for_update().filter(pk=funcionario.pk).values_list('pk', flat=True))
+
         # Regra Específica: Admissional
         if tipo == Tipo.ADMISSIONAL:
             # 1. Verifica se já existe um ASO Admissional (qualquer status)
@@ -42,7 +60,7 @@ class ASOService:
                 raise ValidationError(
                     "Já existe um ASO Admissional gerado para este funcionário."
                 )
-        else:
+        elif tipo != Tipo.PERIODICO:
             raise ValidationError(
                 "Tipo de ASO ainda não implementado."
             )
@@ -76,14 +94,18 @@ class ASOService:
              raise ValidationError("Funcionário não possui cargo.")
             
         cargo_exames = cargo.exames_obrigatorios.filter(deleted_at__isnull=True)
-        
-        for ce in cargo_exames:
-            ExameRealizado.objects.create(
+        if tipo == Tipo.PERIODICO:
+            cargo_exames = cargo_exames.filter(periodicidade_meses__isnull=False)
+
+        ExameRealizado.objects.bulk_create([
+            ExameRealizado(
                 aso=aso,
-                exame=ce.exame,
+                exame_id=ce.exame_id,
                 status=StatusExame.PENDENTE,
                 created_by=user
             )
+            for ce in cargo_exames
+        ])
             
         return aso
 
@@ -5,6 +5,7 @@ from django.core.exceptions import ValidationError
 
 from apps.autenticacao.models import Usuario
 from apps.sst.models import EntregaEPI, CargoEPI
+from .previsao_epi import PrevisaoEPIService
 
 class EntregaEPIService:
 
@@ -66,6 +67,7 @@ class EntregaEPIService:
             updated_by=user
         )
         entrega.save()
+        PrevisaoEPIService.invalidar()
 
         return entrega
 
@@ -90,5 +92,6 @@ class EntregaEPIService:
         entrega.data_devolucao = data_devolucao
         entrega.updated_by = user
         entrega.save()
+        PrevisaoEPIService.invalidar()
         
         return entrega
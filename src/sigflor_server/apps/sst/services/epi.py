@@ -1,8 +1,8 @@
 from django.db import transaction
 from django.core.exceptions import ValidationError
-from datetime import date
 
-from apps.sst.models import TipoEPI, EPI, CargoEPI, EntregaEPI
+from apps.sst.models import TipoEPI, EPI, CargoEPI
+from .previsao_epi import PrevisaoEPIService
 
 class EPIService:
 
@@ -60,7 +60,7 @@ class EPIService:
         """
         Cria ou atualiza um vínculo de EPI para um cargo.
         """
-        vinculo, created = CargoEPI.objects.update_or_create(
+        vinculo, created = CargoEPI.all_objects.update_or_create(
             cargo=cargo,
             tipo_epi=tipo_epi,
             defaults={
@@ -75,6 +75,7 @@ class EPIService:
             vinculo.created_by = user
             vinculo.save()
 
+        PrevisaoEPIService.invalidar()
         return vinculo
 
     @staticmethod
@@ -84,6 +85,7 @@ class EPIService:
         Remove (soft delete) um vínculo de EPI do cargo.
         """
         vinculo.delete(user=user)
+        PrevisaoEPIService.invalidar()
 
     @staticmethod
     @transaction.atomic
@@ -150,46 +152,5 @@ class EPIService:
         Valida se o funcionário possui todos os EPIs obrigatórios entregues e válidos.
         Considera entregas recentes que ainda não venceram.
         """
-
-        cargo = funcionario.cargo
-
-        # 1. Obter requisitos do cargo (Tipos de EPI)
-        requisitos = CargoEPI.objects.filter(
-            cargo=cargo,
-            deleted_at__isnull=True
-        )
-
-        # 2. Obter entregas válidas do funcionário
-        # Uma entrega é válida se:
-        # - Pertence ao funcionário
-        # - Não foi devolvida (devolvido=False)
-        # - Data de validade >= Hoje
-        entregas_validas_tipos = set(
-            EntregaEPI.objects.filter(
-                funcionario=funcionario,
-                deleted_at__isnull=True,
-                devolvido=False,
-                data_validade__gte=date.today()
-            ).values_list('epi__tipo_id', flat=True)
-        )
-
-        epis_ok = []
-        epis_faltantes = []
-
-        for req in requisitos:
-            item = {
-                'tipo_id': req.tipo_epi.id,
-                'nome': req.tipo_epi.nome,
-                'periodicidade_dias': req.periodicidade_troca_dias
-            }
-
-            if req.tipo_epi_id in entregas_validas_tipos:
-                epis_ok.append(item)
-            else:
-                epis_faltantes.append(item)
-
-        return {
-            'valido': len(epis_faltantes) == 0,
-            'epis_ok': epis_ok,
-            'epis_faltantes': epis_faltantes
-        }
+        from apps.rh.services.compliance import ComplianceAdmissaoService
+        return ComplianceAdmissaoService.avaliar_epis([funcionario])[funcionario.pk]
@@ -0,0 +1,234 @@
+from itertools import islice
+
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from apps.autenticacao.models import Usuario
+from apps.comum import planilhas
+from apps.sst.models import ASO, CargoExame, Exame, ExameRealizado
+from apps.sst.models.enums import ResultadoExame, Status, StatusExame
+
+TAMANHO_LOTE_PADRAO = 500
+
+SITUACAO_REGISTRADO = 'REGISTRADO'
+SITUACAO_ERRO = 'ERRO'
+
+_CAMPOS_ATUALIZADOS = [
+    'status', 'resultado', 'data_realizacao', 'data_validade',
+    'observacoes', 'updated_by', 'updated_at',
+]
+
+
+class ImportacaoResultadoExameService:
+    """
+    Importação em lote dos resultados enviados pelas clínicas (CSV ou XLSX).
+
+    Colunas: `cpf`, `exame` (nome), `data_realizacao`, `resultado`
+    (NORMAL/ALTERADO) e, opcionalmente, `observacoes`.
+
+    Cada linha é casada com o exame de um ASO em aberto (ABERTO ou
+    EM_ANDAMENTO) do funcionário, preferindo o exame ainda PENDENTE e o ASO
+    mais recente. A planilha é lida em fluxo e processada em lotes: por lote
+    há uma consulta de casamento, uma de periodicidade (CargoExame apenas dos
+    cargos ainda não vistos), um bulk_update dos exames e um único UPDATE
+    levando os ASOs ABERTO para EM_ANDAMENTO. A validade é calculada em
+    memória, como em ASOService.registrar_resultado_exame.
+    """
+
+    @staticmethod
+    def importar(
+        *,
+        arquivo,
+        user: Usuario,
+        tamanho_lote: int = TAMANHO_LOTE_PADRAO
+    ) -> dict:
+        """
+        Returns:
+            {'total_linhas', 'registrados', 'com_erro', 'asos_em_andamento',
+             'linhas': [{'linha', 'cpf', 'exame', 'situacao', ...}]}
+        """
+        tamanho_lote = max(1, int(tamanho_lote))
+        linhas = planilhas.iterar_planilha(arquivo)
+
+        contexto = {
+            'user': user,
+            'exames': {
+                planilhas.normalizar_nome(nome): pk
+                for pk, nome in Exame.objects.filter(deleted_at__isnull=True).values_list('id', 'nome')
+            },
+            'periodicidades': {},
+            'cargos_carregados': set(),
+            'chaves_vistas': set(),
+        }
+
+        relatorio = {
+            'total_linhas': 0,
+            'registrados': 0,
+            'com_erro': 0,
+            'asos_em_andamento': 0,
+            'linhas': [],
+        }
+        while True:
+            lote = list(islice(linhas, tamanho_lote))
+            if not lote:
+                break
+            ImportacaoResultadoExameService._importar_lote(lote, contexto, relatorio)
+
+        if not relatorio['total_linhas']:
+            raise ValidationError('A planilha não possui linhas de dados.')
+        return relatorio
+
+    @staticmethod
+    def _importar_lote(lote: list[dict], contexto: dict, relatorio: dict) -> None:
+        entradas = []
+        for linha in lote:
+            item = {
+                'linha': linha['linha'],
+                'cpf': planilhas.cpf(linha.get('cpf')),
+                'exame': planilhas.texto(linha.get('exame')),
+            }
+            try:
+                entradas.append((item, ImportacaoResultadoExameService._ler_linha(linha, contexto)))
+            except ValidationError as e:
+                item.update(situacao=SITUACAO_ERRO, erros=planilhas.erros(e))
+            relatorio['linhas'].append(item)
+
+        relatorio['total_linhas'] += len(lote)
+        if entradas:
+            with transaction.atomic():
+                ImportacaoResultadoExameService._aplicar(entradas, contexto, relatorio)
+
+        relatorio['com_erro'] += sum(
+            1 for item in relatorio['linhas'][-len(lote):] if item['situacao'] == SITUACAO_ERRO
+        )
+
+    @staticmethod
+    def _ler_linha(linha: dict, contexto: dict) -> dict:
+        erros = {}
+
+        if len(planilhas.cpf(linha.get('cpf'))) != 11:
+            erros['cpf'] = ['CPF deve conter 11 dígitos.']
+
+        nome_exame = planilhas.texto(linha.get('exame'))
+        exame_id = contexto['exames'].get(planilhas.normalizar_nome(nome_exame))
+        if exame_id is None:
+            erros['exame'] = [f"Exame '{nome_exame}' não encontrado."]
+
+        data_realizacao = None
+        try:
+            data_realizacao = planilhas.data(linha.get('data_realizacao'))
+        except ValidationError as e:
+            erros['data_realizacao'] = e.messages
+        else:
+            if data_realizacao is None:
+                erros['data_realizacao'] = ['Informe a data de realização.']
+            elif data_realizacao > timezone.localdate():
+                erros['data_realizacao'] = ['A data de realização não pode ser futura.']
+
+        resultado = planilhas.normalizar_nome(linha.get('resultado')).upper()
+        if resultado not in ResultadoExame.values:
+            erros['resultado'] = [
+                f"Resultado inválido. Use {' ou '.join(ResultadoExame.values)}."
+            ]
+
+        if erros:
+            raise ValidationError(erros)
+
+        return {
+            'exame_id': exame_id,
+            'data_realizacao': data_realizacao,
+            'resultado': resultado,
+            'observacoes': planilhas.texto(linha.get('observacoes')),
+        }
+
+    @staticmethod
+    def _aplicar(entradas: list, contexto: dict, relatorio: dict) -> None:
+        user = contexto['user']
+        agora = timezone.now()
+
+        candidatos = {}
+        for exame in (
+            ExameRealizado.objects
+            .select_for_update(of=('self',))
+            .filter(
+                aso__funcionario__pessoa_fisica__cpf__in={item['cpf'] for item, _ in entradas},
+                exame_id__in={dados['exame_id'] for _, dados in entradas},
+                aso__status__in=[Status.ABERTO, Status.EM_ANDAMENTO],
+                aso__deleted_at__isnull=True,
+                deleted_at__isnull=True,
+            )
+            .exclude(status=StatusExame.CANCELADO)
+            .select_related('aso__funcionario__pessoa_fisica')
+            # PENDENTE vem antes de REALIZADO; ASO mais recente primeiro
+            .order_by('status', '-aso__created_at')
+        ):
+            chave = (exame.aso.funcionario.pessoa_fisica.cpf, exame.exame_id)
+            candidatos.setdefault(chave, []).append(exame)
+
+        ImportacaoResultadoExameService._carregar_periodicidades(
+            {exame.aso.funcionario.cargo_id for lista in candidatos.values() for exame in lista},
+            contexto
+        )
+
+        alterados = []
+        asos_ids = set()
+        for item, dados in entradas:
+            chave = (item['cpf'], dados['exame_id'])
+            if chave in contexto['chaves_vistas']:
+                item.update(situacao=SITUACAO_ERRO, erros={'non_field_errors': ['Exame repetido na planilha.']})
+                continue
+            if chave not in candidatos:
+                item.update(
+                    situacao=SITUACAO_ERRO,
+                    erros={'non_field_errors': ['Nenhum ASO em aberto do funcionário com este exame.']},
+                )
+                continue
+
+            contexto['chaves_vistas'].add(chave)
+            exame = candidatos[chave][0]
+
+            periodicidade = contexto['periodicidades'].get(
+                (exame.aso.funcionario.cargo_id, exame.exame_id)
+            )
+            exame.status = StatusExame.REALIZADO
+            exame.resultado = dados['resultado']
+            exame.data_realizacao = dados['data_realizacao']
+            if periodicidade:
+                exame.data_validade = dados['data_realizacao'] + relativedelta(months=periodicidade)
+            exame.observacoes = dados['observacoes']
+            exame.updated_by = user
+            exame.updated_at = agora
+
+            alterados.append(exame)
+            asos_ids.add(exame.aso_id)
+            item.update(
+                situacao=SITUACAO_REGISTRADO,
+                exame_realizado_id=str(exame.pk),
+                aso_id=str(exame.aso_id),
+                data_validade=exame.data_validade,
+            )
+
+        if not alterados:
+            return
+
+        ExameRealizado.objects.bulk_update(alterados, _CAMPOS_ATUALIZADOS)
+        relatorio['registrados'] += len(alterados)
+        relatorio['asos_em_andamento'] += ASO.objects.filter(
+            pk__in=asos_ids,
+            status=Status.ABERTO
+        ).update(status=Status.EM_ANDAMENTO, updated_by=user, updated_at=agora)
+
+    @staticmethod
+    def _carregar_periodicidades(cargo_ids: set, contexto: dict) -> None:
+        novos = cargo_ids - contexto['cargos_carregados'] - {None}
+        if not novos:
+            return
+        for cargo_id, exame_id, meses in CargoExame.objects.filter(
+            cargo_id__in=novos,
+            periodicidade_meses__isnull=False,
+            deleted_at__isnull=True
+        ).values_list('cargo_id', 'exame_id', 'periodicidade_meses'):
+            contexto['periodicidades'][(cargo_id, exame_id)] = meses
+        contexto['cargos_carregados'] |= novos
@@ -0,0 +1,236 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import (
+    DateField, Exists, F, OuterRef, Q, Subquery, Sum, UUIDField, Value
+)
+from django.db.models.functions import Greatest, TruncWeek
+
+from apps.autenticacao.models import Usuario
+from apps.comum.scope import FilialScope
+from apps.sst.models import CargoEPI, EntregaEPI
+
+CHAVE_VERSAO = 'sst:previsao_epi:versao'
+CHAVE_PREVISAO = 'sst:previsao_epi:{versao}:{parametros}'
+
+# Admissões/demissões não invalidam a previsão; o TTL limita a defasagem do efetivo.
+PREVISAO_TIMEOUT = 60 * 60
+
+SEMANAS_PADRAO = 12
+SEMANAS_MAXIMO = 52
+
+
+def _inicio_semana(dia: date) -> date:
+    return dia - timedelta(days=dia.weekday())
+
+
+class PrevisaoEPIService:
+    """
+    Previsão semanal de reposição de EPIs por projeto (e filial) e tipo de EPI.
+
+    A demanda combina, sempre com agregações no banco:
+      1. Reposição: entregas ativas (não devolvidas) de funcionários em
+         atividade cuja validade vence até o fim do horizonte, somadas por
+         semana de vencimento (vencidas entram na primeira semana).
+      2. Primeira entrega: funcionários (inclusive aguardando admissão) cujo
+         cargo exige o tipo de EPI e que não têm entrega ativa dele, com a
+         `quantidade_padrao` do cargo na semana da admissão (ou na primeira).
+    Cada grupo se repete a cada `periodicidade_troca_dias` do CargoEPI dentro
+    do horizonte; essa expansão percorre apenas as linhas já agregadas.
+
+    O projeto do funcionário é o da sua alocação ativa mais recente em equipe.
+
+    O resultado fica em cache até que uma entrega/devolução ou alteração de
+    EPIs de cargo incremente a versão (ver `invalidar`), ou por PREVISAO_TIMEOUT.
+    """
+
+    @staticmethod
+    def prever(
+        *,
+        user: Usuario,
+        data_inicio: date = None,
+        semanas: int = SEMANAS_PADRAO,
+        filial_id=None,
+        projeto_id=None,
+    ) -> dict:
+        data_inicio = data_inicio or date.today()
+        semanas = max(1, min(int(semanas), SEMANAS_MAXIMO))
+
+        escopo = FilialScope.for_user(user)
+        parametros = ':'.join(str(p) for p in (
+            data_inicio.isoformat(), semanas, filial_id or '', projeto_id or '',
+            'all' if escopo.irrestrito else ','.join(sorted(str(i) for i in escopo.filial_ids)),
+        ))
+        chave = CHAVE_PREVISAO.format(versao=cache.get(CHAVE_VERSAO, 0), parametros=parametros)
+
+        resultado = cache.get(chave)
+        if resultado is None:
+            resultado = PrevisaoEPIService._calcular(
+                escopo=escopo,
+                data_inicio=data_inicio,
+                semanas=semanas,
+                filial_id=filial_id,
+                projeto_id=projeto_id,
+            )
+            cache.set(chave, resultado, timeout=PREVISAO_TIMEOUT)
+        return resultado
+
+    @staticmethod
+    def invalidar() -> None:
+        """Descarta as previsões em cache (após o commit da transação corrente)."""
+        def incrementar():
+            cache.add(CHAVE_VERSAO, 0, timeout=None)
+            try:
+                cache.incr(CHAVE_VERSAO)
+            except ValueError:
+                cache.set(CHAVE_VERSAO, 1, timeout=None)
+        transaction.on_commit(incrementar)
+
+    @staticmethod
+    def _calcular(*, escopo, data_inicio, semanas, filial_id, projeto_id) -> dict:
+        from apps.comum.models import Projeto
+        from apps.rh.models import EquipeFuncionario, Funcionario, StatusFuncionario
+
+        primeira_semana = _inicio_semana(data_inicio)
+        data_fim = primeira_semana + timedelta(weeks=semanas) - timedelta(days=1)
+        inicio = Value(data_inicio, output_field=DateField())
+
+        projeto_atual = Subquery(
+            EquipeFuncionario.objects.filter(
+                funcionario=OuterRef('funcionario_ref'),
+                data_saida__isnull=True,
+                deleted_at__isnull=True
+            ).order_by('-data_entrada').values('equipe__projeto_id')[:1],
+            output_field=UUIDField(),
+        )
+
+        def restringir(qs):
+            qs = qs.annotate(projeto_ref=projeto_atual)
+            projetos = Projeto.objects.filter(deleted_at__isnull=True)
+            if filial_id:
+                projetos = projetos.filter(filial_id=filial_id)
+            if projeto_id:
+                projetos = projetos.filter(pk=projeto_id)
+            projetos = escopo.apply(projetos, path='filial')
+
+            condicao = Q(projeto_ref__in=projetos.values('pk'))
+            if not (filial_id or projeto_id):
+                # Sem filtro explícito, inclui quem ainda não está alocado em projeto
+                condicao |= Q(projeto_ref__isnull=True)
+            return qs.filter(condicao)
+
+        status_em_atividade = [
+            StatusFuncionario.ATIVO,
+            StatusFuncionario.FERIAS,
+            StatusFuncionario.AFASTADO,
+        ]
+
+        # 1. Reposição das entregas ativas
+        reposicoes = restringir(
+            EntregaEPI.objects.filter(
+                deleted_at__isnull=True,
+                devolvido=False,
+                data_validade__lte=data_fim,
+                funcionario__deleted_at__isnull=True,
+                funcionario__status__in=status_em_atividade,
+            ).annotate(funcionario_ref=F('funcionario_id'))
+        ).values(
+            'projeto_ref',
+            cargo_ref=F('funcionario__cargo_id'),
+            tipo_ref=F('epi__tipo_id'),
+            semana=TruncWeek(Greatest('data_validade', inicio), output_field=DateField()),
+        ).annotate(quantidade=Sum('quantidade')).order_by()
+
+        # 2. Primeira entrega: requisito do cargo sem entrega ativa
+        entrega_ativa = EntregaEPI.objects.filter(
+            funcionario=OuterRef('pk'),
+            epi__tipo_id=OuterRef('cargo__epis_obrigatorios__tipo_epi_id'),
+            deleted_at__isnull=True,
+            devolvido=False,
+        )
+        primeiras = restringir(
+            Funcionario.objects.filter(
+                deleted_at__isnull=True,
+                status__in=[*status_em_atividade, StatusFuncionario.AGUARDANDO_ADMISSAO],
+                data_admissao__lte=data_fim,
+                cargo__epis_obrigatorios__deleted_at__isnull=True,
+            ).annotate(
+                funcionario_ref=F('pk'),
+                coberto=Exists(entrega_ativa),
+            ).filter(coberto=False)
+        ).values(
+            'projeto_ref',
+            cargo_ref=F('cargo_id'),
+            tipo_ref=F('cargo__epis_obrigatorios__tipo_epi_id'),
+            semana=TruncWeek(Greatest('data_admissao', inicio), output_field=DateField()),
+        ).annotate(quantidade=Sum('cargo__epis_obrigatorios__quantidade_padrao')).order_by()
+
+        periodicidades = {
+            (cargo_id, tipo_id): dias
+            for cargo_id, tipo_id, dias in CargoEPI.objects.filter(
+                deleted_at__isnull=True
+            ).values_list('cargo_id', 'tipo_epi_id', 'periodicidade_troca_dias')
+        }
+
+        # 3. Expansão da periodicidade sobre os grupos agregados
+        demanda = defaultdict(lambda: defaultdict(int))
+        for linha in [*reposicoes, *primeiras]:
+            dia = PrevisaoEPIService._como_data(linha['semana'])
+            dias = periodicidades.get((linha['cargo_ref'], linha['tipo_ref']))
+            serie = demanda[(linha['projeto_ref'], linha['tipo_ref'])]
+            while dia <= data_fim:
+                serie[_inicio_semana(dia)] += linha['quantidade'] or 0
+                if not dias:
+                    break
+                dia += timedelta(days=dias)
+
+        return PrevisaoEPIService._montar_resultado(demanda, primeira_semana, data_fim, semanas)
+
+    @staticmethod
+    def _montar_resultado(demanda, primeira_semana, data_fim, semanas) -> dict:
+        from apps.comum.models import Projeto
+        from apps.sst.models import TipoEPI
+
+        projeto_ids = {projeto for projeto, _ in demanda if projeto}
+        projetos = {
+            p['id']: p for p in Projeto.all_objects.filter(pk__in=projeto_ids).values(
+                'id', 'numero', 'filial_id', filial_nome=F('filial__nome')
+            )
+        }
+        tipos = {
+            t['id']: t for t in TipoEPI.all_objects.filter(
+                pk__in={tipo for _, tipo in demanda}
+            ).values('id', 'nome', 'unidade')
+        }
+
+        calendario = [primeira_semana + timedelta(weeks=i) for i in range(semanas)]
+        itens = []
+        for (projeto_id, tipo_id), serie in demanda.items():
+            projeto = projetos.get(projeto_id, {})
+            tipo = tipos.get(tipo_id, {})
+            valores = [{'semana': semana, 'quantidade': serie.get(semana, 0)} for semana in calendario]
+            itens.append({
+                'projeto_id': projeto_id,
+                'projeto_numero': projeto.get('numero'),
+                'filial_id': projeto.get('filial_id'),
+                'filial_nome': projeto.get('filial_nome'),
+                'tipo_epi_id': tipo_id,
+                'tipo_epi_nome': tipo.get('nome'),
+                'unidade': tipo.get('unidade'),
+                'total': sum(v['quantidade'] for v in valores),
+                'semanas': valores,
+            })
+
+        itens.sort(key=lambda i: (i['filial_nome'] or '', i['projeto_numero'] or '', i['tipo_epi_nome'] or ''))
+        return {
+            'data_inicio': primeira_semana,
+            'data_fim': data_fim,
+            'itens': itens,
+        }
+
+    @staticmethod
+    def _como_data(valor) -> date:
+        # TruncWeek pode devolver datetime dependendo do backend
+        return valor.date() if isinstance(valor, datetime) else valor
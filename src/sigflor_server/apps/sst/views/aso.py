@@ -2,20 +2,22 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 
-from apps.comum.views.base import BaseRBACViewSet
+from apps.comum.views.base import BaseRBACViewSet, KeysetPaginatedMixin
 from apps.sst.models import ASO, ExameRealizado
 from apps.sst.serializers import (
     ASOSerializer, 
     ASOCreateSerializer, 
     ASOConclusaoSerializer,
     ExameRealizadoSerializer,
-    ExameRealizadoUpdateSerializer
+    ExameRealizadoUpdateSerializer,
+    ExameRealizadoImportacaoSerializer
 )
 from apps.sst.services.aso import ASOService
+from apps.sst.services.importacao_exames import ImportacaoResultadoExameService
 from apps.sst import selectors
 
 
-class ASOViewSet(BaseRBACViewSet):
+class ASOViewSet(KeysetPaginatedMixin, BaseRBACViewSet):
     
     permissao_leitura = 'sst_aso_ler'
     permissao_escrita = 'sst_aso_escrever'
@@ -85,6 +87,10 @@ class ExameRealizadoViewSet(BaseRBACViewSet):
     
     permissao_leitura = 'sst_aso_ler'
     permissao_escrita = 'sst_aso_escrever'
+
+    permissoes_acoes = {
+        'importar': 'sst_aso_escrever',
+    }
     
     queryset = ExameRealizado.objects.filter(deleted_at__isnull=True)
     serializer_class = ExameRealizadoSerializer
@@ -111,3 +117,20 @@ class ExameRealizadoViewSet(BaseRBACViewSet):
         
         # Retorna o serializer completo de leitura
         return Response(ExameRealizadoSerializer(exame_realizado).data)
+
+    @action(detail=False, methods=['post'], url_path='importar')
+    def importar(self, request):
+        """
+        Importa a planilha de resultados da clínica (CSV/XLSX).
+        Retorna o relatório de conciliação linha a linha.
+        """
+        serializer = ExameRealizadoImportacaoSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        relatorio = ImportacaoResultadoExameService.importar(
+            user=request.user,
+            **serializer.validated_data
+        )
+
+        status_code = status.HTTP_200_OK if relatorio['registrados'] else status.HTTP_400_BAD_REQUEST
+        return Response(relatorio, status=status_code)
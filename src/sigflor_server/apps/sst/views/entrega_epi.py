@@ -1,6 +1,7 @@
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.utils.dateparse import parse_date
 
 from apps.comum.views.base import BaseRBACViewSet
 from apps.sst.models import EntregaEPI
@@ -8,12 +9,15 @@ from apps.sst.serializers import (
     EntregaEPIReadSerializer,
     EntregaEPICreateSerializer
 )
-from apps.sst.services import EntregaEPIService
+from apps.sst.services import EntregaEPIService, PrevisaoEPIService
 
 class EntregaEPIViewSet(BaseRBACViewSet):
     
     permissao_leitura = 'sst_epi_ler'
     permissao_escrita = 'sst_epi_escrever'
+    permissoes_acoes = {
+        'previsao': 'sst_epi_ler',
+    }
     
     queryset = EntregaEPI.objects.filter(deleted_at__isnull=True)
     
@@ -59,3 +63,38 @@ class EntregaEPIViewSet(BaseRBACViewSet):
         )
         
         return Response(EntregaEPIReadSerializer(entrega).data)
+
+    @action(detail=False, methods=['get'])
+    def previsao(self, request):
+        """
+        Previsão semanal de reposição de EPIs por projeto/filial e tipo.
+        Parâmetros: data_inicio (AAAA-MM-DD), semanas, filial_id, projeto_id.
+        """
+        data_inicio = request.query_params.get('data_inicio')
+        if data_inicio:
+            try:
+                data_inicio = parse_date(data_inicio)
+            except ValueError:  # bem formada, mas inexistente (ex: 2026-02-30)
+                data_inicio = None
+            if data_inicio is None:
+                return Response(
+                    {'data_inicio': ['Data inválida. Use AAAA-MM-DD.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        try:
+            semanas = int(request.query_params.get('semanas', 12))
+        except ValueError:
+            return Response(
+                {'semanas': ['Informe um número inteiro de semanas.']},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        resultado = PrevisaoEPIService.prever(
+            user=request.user,
+            data_inicio=data_inicio,
+            semanas=semanas,
+            filial_id=request.query_params.get('filial_id'),
+            projeto_id=request.query_params.get('projeto_id'),
+        )
+        return Response(resultado)
@@ -36,6 +36,8 @@ INSTALLED_APPS = [
 AUTH_USER_MODEL = 'autenticacao.Usuario'
 
 MIDDLEWARE = [
+    # Primeiro: a duração medida inclui os demais middlewares
+    'apps.comum.middleware.MetricasRequisicaoMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -104,11 +106,32 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# RbacBackend herda de ModelBackend (autenticação + permissões diretas) e
+# adiciona as permissões dos papéis com cache versionado.
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
     'apps.autenticacao.backends.RbacBackend',
 ]
 
+# Alias de cache usado pelo cache de permissões RBAC.
+# Em produção, aponte para um cache compartilhado entre os processos.
+RBAC_PERMISSOES_CACHE = 'default'
+
+# Quantos números de sequência (matrícula, número de projeto) cada processo
+# reserva de uma vez. Números reservados e não usados viram lacunas.
+SEQUENCIAS_TAMANHO_BLOCO = 10
+
+# Tempo (s) de cache no cliente da resposta de /api/comum/enums/. O ETag muda
+# quando algum enum muda; após um deploy os clientes o revalidam neste prazo.
+ENUMS_CACHE_MAX_AGE = 60 * 60 * 24
+
+# Threads do worker da fila de tarefas (manage.py processar_tarefas) quando
+# --concorrencia não é informado.
+TAREFAS_CONCORRENCIA = int(os.getenv('TAREFAS_CONCORRENCIA', 2))
+
+# Métricas por endpoint (consultas, tempo de banco e de serialização, tamanho
+# da resposta) em /api/comum/metricas/, formato Prometheus, por processo.
+METRICAS_HABILITADAS = os.getenv('METRICAS_HABILITADAS', 'True') == 'True'
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -0,0 +1,106 @@
+"""Criação de registros mínimos e válidos para os testes."""
+
+from datetime import date
+from decimal import Decimal
+from itertools import count
+
+from apps.comum.models import Cliente, Empresa, Filial, PessoaFisica, PessoaJuridica, Projeto
+from apps.comum.models.enums import UF, EstadoCivil, Sexo
+from apps.comum.validators import completar_cnpj, completar_cpf
+from apps.rh.models import Cargo, Equipe, EquipeFuncionario, Funcionario, NivelCargo
+from apps.rh.models.enums import TipoContrato, TipoEquipe
+
+_sequencia = count(1)
+
+
+def cpf() -> str:
+    return completar_cpf(f'{100_000_000 + next(_sequencia):09d}')
+
+
+def cnpj() -> str:
+    return completar_cnpj(f'{10_000_000 + next(_sequencia):08d}0001')
+
+
+def usuario(*, superusuario: bool = True, **campos):
+    from apps.autenticacao.models import Usuario
+
+    numero = next(_sequencia)
+    campos.setdefault('username', f'usuario{numero}')
+    campos.setdefault('email', f'usuario{numero}@teste.com')
+    if superusuario:
+        return Usuario.objects.create_superuser(password='senha', **campos)
+    return Usuario.objects.create_user(password='senha', **campos)
+
+
+def pessoa_fisica(**campos) -> PessoaFisica:
+    campos.setdefault('nome_completo', f'Pessoa Teste {next(_sequencia)}')
+    campos.setdefault('cpf', cpf())
+    campos.setdefault('sexo', Sexo.MASCULINO)
+    campos.setdefault('estado_civil', EstadoCivil.SOLTEIRO)
+    campos.setdefault('data_nascimento', date(1990, 1, 1))
+    campos.setdefault('naturalidade', UF.MS)
+    return PessoaFisica.objects.create(**campos)
+
+
+def pessoa_juridica(**campos) -> PessoaJuridica:
+    campos.setdefault('razao_social', f'Empresa Teste {next(_sequencia)}')
+    campos.setdefault('cnpj', cnpj())
+    return PessoaJuridica.objects.create(**campos)
+
+
+def empresa(**campos) -> Empresa:
+    campos.setdefault('pessoa_juridica', pessoa_juridica())
+    return Empresa.objects.create(**campos)
+
+
+def cliente(**campos) -> Cliente:
+    campos.setdefault('pessoa_juridica', pessoa_juridica())
+    campos.setdefault('empresa_gestora', empresa())
+    return Cliente.objects.create(**campos)
+
+
+def filial(**campos) -> Filial:
+    numero = next(_sequencia)
+    campos.setdefault('nome', f'Filial {numero}')
+    campos.setdefault('codigo_interno', f'FIL-{numero}')
+    campos.setdefault('empresa', empresa())
+    return Filial.objects.create(**campos)
+
+
+def projeto(**campos) -> Projeto:
+    campos.setdefault('descricao', 'Projeto de teste')
+    campos.setdefault('cliente', cliente())
+    campos.setdefault('filial', filial())
+    campos.setdefault('data_inicio', date(2024, 1, 1))
+    return Projeto.objects.create(**campos)
+
+
+def cargo(**campos) -> Cargo:
+    campos.setdefault('nome', f'Cargo {next(_sequencia)}')
+    campos.setdefault('nivel', NivelCargo.OPERACIONAL)
+    campos.setdefault('salario_base', Decimal('2000.00'))
+    return Cargo.objects.create(**campos)
+
+
+def funcionario(**campos) -> Funcionario:
+    campos.setdefault('pessoa_fisica', pessoa_fisica())
+    campos.setdefault('empresa', empresa())
+    campos.setdefault('cargo', cargo())
+    campos.setdefault('data_admissao', date(2024, 1, 1))
+    campos.setdefault('tipo_contrato', TipoContrato.CLT)
+    campos.setdefault('cidade_atual', 'Campo Grande')
+    return Funcionario.objects.create(**campos)
+
+
+def equipe(*, membros: int = 1, **campos) -> Equipe:
+    """Equipe com o líder e `membros - 1` funcionários alocados."""
+    campos.setdefault('nome', f'Equipe {next(_sequencia)}')
+    campos.setdefault('tipo_equipe', TipoEquipe.MANUAL)
+    campos.setdefault('projeto', projeto())
+    campos.setdefault('lider', funcionario())
+    campos.setdefault('coordenador', campos['lider'])
+    equipe = Equipe.objects.create(**campos)
+    alocados = [equipe.lider] + [funcionario() for _ in range(membros - 1)]
+    for membro in alocados:
+        EquipeFuncionario.objects.create(equipe=equipe, funcionario=membro, data_entrada=date(2024, 1, 1))
+    return equipe
@@ -0,0 +1,26 @@
+"""
+Configuração da suíte de testes: `python manage.py test tests --settings=tests.settings`.
+
+Os apps locais ainda não têm migrações versionadas; as tabelas do banco de
+teste são criadas direto dos models.
+"""
+
+import os
+import tempfile
+
+os.environ.setdefault('DJANGO_SECRET_KEY', 'testes')
+
+from core.settings import *  # noqa: E402,F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+MIGRATION_MODULES = {app: None for app in ('autenticacao', 'comum', 'rh', 'sst')}
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix='sigflor-testes-')
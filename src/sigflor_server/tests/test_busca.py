@@ -0,0 +1,18 @@
+from django.test import TestCase
+
+from apps.comum.services import PessoaFisicaService
+from . import fabricas
+
+
+class TextoBuscaTests(TestCase):
+
+    def test_edicao_da_pessoa_fisica_atualiza_texto_de_busca(self):
+        funcionario = fabricas.funcionario(pessoa_fisica=fabricas.pessoa_fisica(nome_completo='Ana Souza'))
+        novo_cpf = fabricas.cpf()
+
+        PessoaFisicaService.update(funcionario.pessoa_fisica, nome_completo='Ana Pereira', cpf=novo_cpf)
+
+        funcionario.refresh_from_db()
+        self.assertIn(' ana pereira ', funcionario.busca_texto)
+        self.assertIn(novo_cpf, funcionario.busca_texto)
+        self.assertNotIn('souza', funcionario.busca_texto)
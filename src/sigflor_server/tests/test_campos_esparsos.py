@@ -0,0 +1,31 @@
+from rest_framework.test import APITestCase
+
+from . import fabricas
+
+
+class CamposEsparsosFuncionarioTests(APITestCase):
+
+    def setUp(self):
+        self.client.force_authenticate(fabricas.usuario())
+        for numero in range(3):
+            empresa = fabricas.empresa(
+                pessoa_juridica=fabricas.pessoa_juridica(nome_fantasia=f'Reflorestadora {numero}')
+            )
+            fabricas.funcionario(empresa=empresa)
+
+    def _listar(self):
+        response = self.client.get('/api/rh/funcionarios/', {'fields': 'id,empresa_nome'})
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data['results']
+
+    def test_nome_da_empresa_vem_da_pessoa_juridica_sem_consulta_por_linha(self):
+        self._listar()
+        fabricas.funcionario()
+        with self.assertNumQueries(1):
+            linhas = self._listar()
+
+        self.assertEqual(len(linhas), 4)
+        self.assertEqual(
+            sorted(linha['empresa_nome'] for linha in linhas if linha['empresa_nome']),
+            ['Reflorestadora 0', 'Reflorestadora 1', 'Reflorestadora 2'],
+        )
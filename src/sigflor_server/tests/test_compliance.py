@@ -0,0 +1,62 @@
+from datetime import date, timedelta
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from apps.comum.models.enums import TipoDocumento
+from apps.comum.services import DocumentoService
+from apps.rh.models import CargoDocumento
+from apps.rh.services import CargoService, ComplianceAdmissaoService
+from apps.sst.models import EPI, CargoEPI, EntregaEPI, TipoEPI
+from apps.sst.services import EPIService
+from . import fabricas
+
+
+class ComplianceAdmissaoTests(TestCase):
+
+    def setUp(self):
+        self.cargo = fabricas.cargo()
+        self.completo = fabricas.funcionario(cargo=self.cargo)
+        self.pendente = fabricas.funcionario(cargo=self.cargo)
+
+        CargoDocumento.objects.create(cargo=self.cargo, documento_tipo=TipoDocumento.CTPS, obrigatorio=True)
+        CargoDocumento.objects.create(cargo=self.cargo, documento_tipo=TipoDocumento.CNH, obrigatorio=False)
+        DocumentoService.vincular_documento_pessoa_fisica(
+            pessoa_fisica=self.completo.pessoa_fisica,
+            tipo=TipoDocumento.CTPS,
+            descricao='CTPS digital',
+            arquivo=SimpleUploadedFile('ctps.pdf', b'%PDF-1.4 ctps', content_type='application/pdf'),
+        )
+
+        botina = TipoEPI.objects.create(nome='Botina')
+        luva = TipoEPI.objects.create(nome='Luva')
+        CargoEPI.objects.create(cargo=self.cargo, tipo_epi=botina, periodicidade_troca_dias=180)
+        CargoEPI.objects.create(cargo=self.cargo, tipo_epi=luva, periodicidade_troca_dias=30)
+        for tipo, validade in ((botina, 30), (luva, -1)):
+            EntregaEPI.objects.create(
+                funcionario=self.completo,
+                epi=EPI.objects.create(tipo=tipo, ca=f'CA-{tipo.nome}'),
+                data_validade=date.today() + timedelta(days=validade),
+            )
+
+    def test_validadores_individuais_usam_as_regras_do_lote(self):
+        avaliacoes = ComplianceAdmissaoService.avaliar([self.completo, self.pendente])
+
+        for funcionario in (self.completo, self.pendente):
+            self.assertEqual(
+                CargoService.validar_documentos_funcionario(funcionario),
+                avaliacoes[funcionario.pk]['documentos']
+            )
+            self.assertEqual(
+                EPIService.validar_epis_funcionario(funcionario),
+                avaliacoes[funcionario.pk]['epis']
+            )
+
+        documentos = avaliacoes[self.completo.pk]['documentos']
+        self.assertTrue(documentos['valido'])
+        self.assertEqual([d['tipo'] for d in documentos['documentos_opcionais_faltantes']], [TipoDocumento.CNH])
+        self.assertFalse(avaliacoes[self.pendente.pk]['documentos']['valido'])
+
+        # Entrega vencida não conta
+        epis = avaliacoes[self.completo.pk]['epis']
+        self.assertEqual([e['nome'] for e in epis['epis_faltantes']], ['Luva'])
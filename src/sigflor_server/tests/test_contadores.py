@@ -0,0 +1,105 @@
+from datetime import date
+
+from django.db.models import Sum
+from django.test import TestCase
+
+from apps.rh.models import ContadorFuncionario, Dependente, EquipeFuncionario, Funcionario
+from apps.rh.models.enums import Parentesco
+from apps.rh.selectors import estatisticas_rh
+from apps.rh.services import EquipeService
+from apps.rh.services.estatisticas import ContadorFuncionarioService
+from . import fabricas
+
+
+class ContadorDependentesTests(TestCase):
+
+    def setUp(self):
+        self.funcionario = fabricas.funcionario()
+        fabricas.funcionario()
+        ContadorFuncionarioService.reconstruir()
+
+    def _com_dependentes(self):
+        return ContadorFuncionario.objects.aggregate(total=Sum('com_dependentes'))['total']
+
+    def _novo_dependente(self):
+        return Dependente.objects.create(
+            funcionario=self.funcionario,
+            pessoa_fisica=fabricas.pessoa_fisica(),
+            parentesco=Parentesco.FILHO,
+        )
+
+    def assertContadoresConferem(self):
+        self.assertEqual(self._com_dependentes(), Funcionario.objects.filter(tem_dependente=True).count())
+
+    def test_inclusao_inativacao_e_exclusao_de_dependentes(self):
+        primeiro = self._novo_dependente()
+        segundo = self._novo_dependente()
+        self.assertEqual(self._com_dependentes(), 1)
+        self.assertContadoresConferem()
+
+        primeiro.ativo = False
+        primeiro.save()
+        self.assertEqual(self._com_dependentes(), 1)
+
+        segundo.delete()
+        self.assertEqual(self._com_dependentes(), 0)
+        self.assertContadoresConferem()
+
+        primeiro.ativo = True
+        primeiro.save()
+        self.assertEqual(self._com_dependentes(), 1)
+        self.assertContadoresConferem()
+
+
+class ContadorFilialTests(TestCase):
+    """A filial dos contadores é a da alocação ativa do funcionário em equipe."""
+
+    def setUp(self):
+        self.equipes = [fabricas.equipe(membros=2) for _ in range(3)]
+        self.sem_equipe = fabricas.funcionario()
+        ContadorFuncionarioService.reconstruir()
+
+        self.usuario = fabricas.usuario(superusuario=False)
+        self.usuario.allowed_filiais.add(self.equipes[0].projeto.filial)
+
+    def _total(self, user):
+        return estatisticas_rh(user=user)['total']
+
+    def _contadores(self):
+        return sorted(
+            (str(c.filial_id), str(c.cargo_id), c.quantidade)
+            for c in ContadorFuncionario.objects.filter(quantidade__gt=0)
+        )
+
+    def assertIgualAReconstrucao(self):
+        incrementais = self._contadores()
+        ContadorFuncionarioService.reconstruir()
+        self.assertEqual(incrementais, self._contadores())
+
+    def test_usuario_restrito_ve_apenas_sua_filial_e_os_sem_equipe(self):
+        self.assertEqual(self._total(fabricas.usuario()), 7)
+        self.assertEqual(self._total(self.usuario), 3)
+
+    def test_entrada_e_saida_de_equipe_movem_os_contadores(self):
+        membro = self.equipes[1].lider
+        EquipeService.adicionar_membro(equipe=self.equipes[0], funcionario=membro, data_entrada=date(2025, 1, 1))
+        self.assertEqual(self._total(self.usuario), 4)
+        self.assertIgualAReconstrucao()
+
+        alocacao = EquipeFuncionario.objects.get(funcionario=self.equipes[2].lider, data_saida__isnull=True)
+        EquipeService.remover_membro(equipe_funcionario=alocacao, data_saida=date(2025, 1, 1))
+        self.assertEqual(self._total(self.usuario), 5)
+        self.assertIgualAReconstrucao()
+
+        alocacao.delete()
+        alocacao = EquipeFuncionario.objects.get(funcionario=membro, data_saida__isnull=True)
+        alocacao.delete()
+        self.assertEqual(self._total(self.usuario), 5)
+        self.assertIgualAReconstrucao()
+
+    def test_troca_de_projeto_da_equipe_move_os_membros(self):
+        equipe = self.equipes[1]
+        equipe.projeto = self.equipes[0].projeto
+        equipe.save()
+        self.assertEqual(self._total(self.usuario), 5)
+        self.assertIgualAReconstrucao()
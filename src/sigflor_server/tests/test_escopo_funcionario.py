@@ -0,0 +1,107 @@
+from datetime import date
+
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APITestCase
+
+from apps.rh.models import Dependente, Funcionario, StatusFuncionario
+from apps.rh.models.enums import Parentesco
+from apps.rh.selectors import (
+    dependente_detail,
+    dependente_list,
+    estatisticas_dependentes,
+    funcionario_detail,
+    funcionarios_por_cargo,
+    funcionarios_por_projeto,
+)
+from . import fabricas
+
+
+class EscopoFuncionarioTests(APITestCase):
+    """A filial do funcionário vem da sua alocação ativa em equipe."""
+
+    def setUp(self):
+        def aniversariante():
+            return fabricas.funcionario(
+                pessoa_fisica=fabricas.pessoa_fisica(data_nascimento=date(1990, 5, 20)),
+                status=StatusFuncionario.ATIVO,
+            )
+
+        self.equipe = fabricas.equipe(lider=aniversariante())
+        self.alocado = self.equipe.lider
+        self.sem_equipe = aniversariante()
+        self.de_outra_filial = fabricas.equipe(lider=aniversariante()).lider
+
+        self.usuario = fabricas.usuario(superusuario=False)
+        self.usuario.allowed_filiais.add(self.equipe.projeto.filial)
+        self.client.force_authenticate(self.usuario)
+
+    def test_detalhe(self):
+        for funcionario in (self.alocado, self.sem_equipe):
+            self.assertEqual(funcionario_detail(user=self.usuario, pk=funcionario.pk), funcionario)
+        with self.assertRaises(PermissionDenied):
+            funcionario_detail(user=self.usuario, pk=self.de_outra_filial.pk)
+
+    def test_aniversariantes(self):
+        response = self.client.get('/api/rh/funcionarios/aniversariantes/', {'mes': 5})
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            {linha['id'] for linha in response.data['results']},
+            {str(self.alocado.pk), str(self.sem_equipe.pk)},
+        )
+
+    def _ids(self, response):
+        # As fábricas criam outros funcionários sem equipe; só interessam os do setUp
+        self.assertEqual(response.status_code, 200, response.data)
+        conhecidos = {str(f.pk) for f in (self.alocado, self.sem_equipe, self.de_outra_filial)}
+        return {linha['id'] for linha in response.data['results']} & conhecidos
+
+    def test_ativos_e_afastados(self):
+        self.assertEqual(
+            self._ids(self.client.get('/api/rh/funcionarios/ativos/')),
+            {str(self.alocado.pk), str(self.sem_equipe.pk)},
+        )
+
+        Funcionario.objects.filter(pk__in=[self.sem_equipe.pk, self.de_outra_filial.pk]).update(status=StatusFuncionario.AFASTADO)
+        self.assertEqual(
+            self._ids(self.client.get('/api/rh/funcionarios/afastados/')),
+            {str(self.sem_equipe.pk)},
+        )
+
+    def test_por_projeto_e_cargo(self):
+        self.assertEqual(
+            list(funcionarios_por_projeto(user=self.usuario, projeto_id=self.equipe.projeto_id)),
+            [self.alocado],
+        )
+        outra_equipe = self.de_outra_filial.alocacoes_equipe.get().equipe
+        self.assertFalse(funcionarios_por_projeto(user=self.usuario, projeto_id=outra_equipe.projeto_id).exists())
+
+        self.assertEqual(list(funcionarios_por_cargo(user=self.usuario, cargo_id=self.alocado.cargo_id)), [self.alocado])
+        self.assertFalse(funcionarios_por_cargo(user=self.usuario, cargo_id=self.de_outra_filial.cargo_id).exists())
+
+    def test_dependentes(self):
+        dependentes = {
+            funcionario: Dependente.objects.create(
+                funcionario=funcionario,
+                pessoa_fisica=fabricas.pessoa_fisica(),
+                parentesco=Parentesco.FILHO,
+                dependencia_irrf=True,
+            )
+            for funcionario in (self.alocado, self.sem_equipe, self.de_outra_filial)
+        }
+
+        self.assertEqual(
+            set(dependente_list(user=self.usuario)),
+            {dependentes[self.alocado], dependentes[self.sem_equipe]},
+        )
+        self.assertEqual(
+            dependente_detail(user=self.usuario, pk=dependentes[self.alocado].pk),
+            dependentes[self.alocado],
+        )
+        with self.assertRaises(PermissionDenied):
+            dependente_detail(user=self.usuario, pk=dependentes[self.de_outra_filial].pk)
+
+        estatisticas = estatisticas_dependentes(user=self.usuario)
+        self.assertEqual(estatisticas['total_dependentes'], 2)
+        self.assertEqual(estatisticas['irrf'], 2)
+        self.assertEqual(estatisticas['funcionarios_com_dependentes'], 2)
@@ -0,0 +1,35 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework.test import APITestCase
+
+from apps.rh.models import Funcionario
+from . import fabricas
+
+
+class ImportacaoAdmissaoEndpointTests(APITestCase):
+
+    def setUp(self):
+        self.client.force_authenticate(fabricas.usuario())
+        self.empresa = fabricas.empresa()
+        self.cargo = fabricas.cargo(nome='Auxiliar Florestal')
+
+    def test_importa_planilha_csv_enviada_por_multipart(self):
+        cpf = fabricas.cpf()
+        planilha = (
+            'nome_completo;cpf;sexo;estado_civil;naturalidade;data_nascimento;'
+            'cargo;tipo_contrato;data_admissao;cidade_atual\n'
+            f'Maria Oliveira;{cpf};F;solteiro;MS;1995-03-10;'
+            'Auxiliar Florestal;CLT;2025-02-01;Campo Grande\n'
+        ).encode('utf-8')
+
+        response = self.client.post(
+            '/api/rh/funcionarios/importar/',
+            {
+                'arquivo': SimpleUploadedFile('admissoes.csv', planilha, content_type='text/csv'),
+                'empresa_id': str(self.empresa.pk),
+            },
+            format='multipart',
+        )
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(response.data['importados'], 1)
+        self.assertTrue(Funcionario.objects.filter(pessoa_fisica__cpf=cpf, empresa=self.empresa).exists())
@@ -0,0 +1,44 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.comum.models import Sequencia
+from apps.rh.models import Funcionario
+from . import fabricas
+
+
+class MatriculaTests(TestCase):
+
+    def setUp(self):
+        self.ano = timezone.now().year
+
+    def test_formato_aaaannnnd(self):
+        matriculas = Funcionario.gerar_matriculas(3)
+
+        self.assertEqual({len(m) for m in matriculas}, {9})
+        self.assertEqual([m[:-1] for m in matriculas], [f'{self.ano}{n:04d}' for n in (1, 2, 3)])
+
+    def test_ano_informado(self):
+        [matricula] = Funcionario.gerar_matriculas(1, ano=2019)
+        self.assertEqual(matricula[:-1], '20190001')
+
+    def test_sequencia_retoma_do_maior_sequencial(self):
+        fabricas.funcionario(matricula=f'{self.ano}09990')
+        fabricas.funcionario(matricula=f'{self.ano}00120')
+
+        [matricula] = Funcionario.gerar_matriculas(1)
+        self.assertEqual(matricula[:-1], f'{self.ano}1000')
+
+    def test_matricula_fora_do_formato_conta_como_a_maior(self):
+        fabricas.funcionario(matricula=f'{self.ano}99990')
+        fabricas.funcionario(matricula=f'{self.ano}100000')
+
+        self.assertEqual(Funcionario._ultima_sequencia_matricula(self.ano), 10_000)
+
+    def test_sequencial_esgotado_apos_9999(self):
+        Sequencia.objects.create(chave=f'funcionario.matricula.{self.ano}', valor=9998)
+
+        [ultima] = Funcionario.gerar_matriculas(1)
+        self.assertEqual(ultima[:-1], f'{self.ano}9999')
+        with self.assertRaises(ValidationError):
+            Funcionario.gerar_matriculas(1)
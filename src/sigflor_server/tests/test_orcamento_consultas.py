@@ -0,0 +1,90 @@
+"""
+Orçamento de consultas dos endpoints mais acessados.
+
+Os orçamentos são medidos com várias linhas por página: um N+1 novo estoura
+o limite em vez de passar despercebido.
+"""
+
+from rest_framework.test import APITestCase, APITransactionTestCase
+
+from apps.comum.metricas import orcamento_consultas
+from apps.rh.models import Dependente
+from apps.rh.models.enums import Parentesco
+from . import fabricas
+
+
+def criar_equipes():
+    """Quatro equipes de três funcionários; cada líder com um dependente."""
+    for _ in range(4):
+        equipe = fabricas.equipe(membros=3)
+        Dependente.objects.create(
+            funcionario=equipe.lider,
+            pessoa_fisica=fabricas.pessoa_fisica(),
+            parentesco=Parentesco.FILHO,
+        )
+
+
+class OrcamentoMixin:
+
+    def _get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+
+class OrcamentoListagensTests(OrcamentoMixin, APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.usuario = fabricas.usuario()
+        criar_equipes()
+
+    def setUp(self):
+        self.client.force_authenticate(self.usuario)
+
+    def test_listagens(self):
+        with orcamento_consultas({
+            'FuncionarioViewSet.list': 1,
+            'EquipeViewSet.list': 1,
+            'ProjetoViewSet.list': 1,
+        }):
+            funcionarios = self._get('/api/rh/funcionarios/')
+            equipes = self._get('/api/rh/equipes/')
+            projetos = self._get('/api/comum/projetos/')
+
+        self.assertEqual(len(funcionarios['results']), 12)
+        self.assertEqual([e['membros_count'] for e in equipes['results']], [3] * 4)
+        self.assertEqual(len(projetos['results']), 4)
+
+    def test_listagens_com_campos_esparsos(self):
+        with orcamento_consultas({
+            'FuncionarioViewSet.list': 1,
+            'EquipeViewSet.list': 1,
+        }):
+            self._get('/api/rh/funcionarios/', fields='id,nome,cargo_nome,empresa_nome')
+            equipes = self._get('/api/rh/equipes/', fields='id,lider_nome,membros_count')
+
+        self.assertEqual([e['membros_count'] for e in equipes['results']], [3] * 4)
+
+    def test_pendencias_admissao(self):
+        with orcamento_consultas({'FuncionarioViewSet.pendencias_admissao': 7}):
+            self._get('/api/rh/funcionarios/pendencias-admissao/')
+
+
+
+class OrcamentoPaineisTests(OrcamentoMixin, APITransactionTestCase):
+    """Os painéis são views assíncronas que consultam em paralelo, em outras conexões."""
+
+    def setUp(self):
+        self.client.force_authenticate(fabricas.usuario())
+        criar_equipes()
+
+    def test_estatisticas(self):
+        with orcamento_consultas({
+            'EstatisticasFuncionariosView.get': 3,
+            'EstatisticasDependentesView.get': 4,
+            'EstatisticasFiliaisView.get': 2,
+        }):
+            self._get('/api/rh/funcionarios/estatisticas/')
+            self._get('/api/rh/dependentes/estatisticas/')
+            self._get('/api/comum/filiais/estatisticas/')
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.comum.models import Projeto
+from apps.comum.pagination import KeysetPagination
+from . import fabricas
+
+
+class KeysetPaginationTests(TestCase):
+
+    def _paginas(self, queryset, page_size):
+        """Percorre as páginas seguindo o link `next` e devolve os ids em ordem."""
+        ids, params = [], {'page_size': page_size}
+        while True:
+            paginador = KeysetPagination()
+            request = Request(APIRequestFactory().get('/projetos/', params))
+            ids += [projeto.pk for projeto in paginador.paginate_queryset(queryset, request)]
+            proxima = paginador.get_next_link()
+            if proxima is None:
+                return ids
+            params = {chave: valor[0] for chave, valor in parse_qs(urlparse(proxima).query).items()}
+
+    def test_registros_no_mesmo_milissegundo(self):
+        base = datetime(2026, 1, 5, 12, 0, 0, 123000, tzinfo=timezone.utc)
+        for i in range(5):
+            projeto = fabricas.projeto()
+            Projeto.objects.filter(pk=projeto.pk).update(created_at=base + timedelta(microseconds=i))
+
+        queryset = Projeto.objects.order_by('-created_at')
+        esperado = list(queryset.order_by('-created_at', 'id').values_list('pk', flat=True))
+
+        self.assertEqual(self._paginas(queryset, page_size=2), esperado)
@@ -0,0 +1,37 @@
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import fabricas
+
+PAINEIS = (
+    '/api/rh/funcionarios/estatisticas/',
+    '/api/rh/dependentes/estatisticas/',
+    '/api/comum/filiais/estatisticas/',
+)
+
+
+class PaineisAssincronosTests(APITestCase):
+
+    def test_exigem_autenticacao(self):
+        for url in PAINEIS:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 401)
+                self.assertIn('WWW-Authenticate', response)
+
+    def test_exigem_permissao_rbac(self):
+        token = RefreshToken.for_user(fabricas.usuario(superusuario=False)).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        for url in PAINEIS:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 403)
+
+    def test_token_invalido_tem_o_formato_dos_viewsets(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer token-invalido')
+        esperado = self.client.get('/api/rh/funcionarios/')
+
+        for url in PAINEIS:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, esperado.status_code)
+                self.assertEqual(response.json(), esperado.json())
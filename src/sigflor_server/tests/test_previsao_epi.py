@@ -0,0 +1,40 @@
+from datetime import date
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.sst.models import CargoEPI, TipoEPI
+from apps.sst.services.previsao_epi import PrevisaoEPIService
+from . import fabricas
+
+
+class PrevisaoEPITests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_demanda_agrupada_pelo_projeto_da_equipe(self):
+        equipe = fabricas.equipe()
+        tipo = TipoEPI.objects.create(nome='Botina de Segurança')
+        CargoEPI.objects.create(
+            cargo=equipe.lider.cargo, tipo_epi=tipo, periodicidade_troca_dias=180, quantidade_padrao=2
+        )
+
+        previsao = PrevisaoEPIService.prever(user=fabricas.usuario(), data_inicio=date(2025, 3, 3), semanas=4)
+
+        [item] = previsao['itens']
+        self.assertEqual(item['projeto_id'], equipe.projeto.pk)
+        self.assertEqual(item['projeto_numero'], equipe.projeto.numero)
+        self.assertEqual(item['filial_id'], equipe.projeto.filial_id)
+        self.assertEqual(item['filial_nome'], equipe.projeto.filial.nome)
+        self.assertEqual(item['total'], 2)
+
+    def test_data_inicio_inexistente(self):
+        client = APIClient()
+        client.force_authenticate(fabricas.usuario())
+
+        response = client.get('/api/sst/entregas-epi/previsao/', {'data_inicio': '2026-02-30'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('data_inicio', response.json())
@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.comum.models.enums import TipoDocumento
+from apps.comum.services import DocumentoService, VencimentoDocumentoService
+from . import fabricas
+
+
+class ResumoVencimentosTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.equipe = fabricas.equipe()
+        DocumentoService.vincular_documento_pessoa_fisica(
+            pessoa_fisica=self.equipe.lider.pessoa_fisica,
+            tipo=TipoDocumento.CNH,
+            descricao='CNH',
+            data_validade=date.today() + timedelta(days=5),
+            arquivo=SimpleUploadedFile('cnh.pdf', b'%PDF-1.4 cnh', content_type='application/pdf'),
+        )
+
+    def test_usuario_da_filial_ve_os_documentos_dela(self):
+        filial = self.equipe.projeto.filial
+        usuario = fabricas.usuario(superusuario=False)
+        usuario.allowed_filiais.add(filial)
+
+        [grupo] = VencimentoDocumentoService.resumo(user=usuario)['grupos']
+        self.assertEqual(grupo['filial_id'], filial.pk)
+        self.assertEqual(grupo['filial_nome'], filial.nome)
+        self.assertEqual(grupo['total'], 1)
+
+    def test_usuario_de_outra_filial_nao_ve_os_documentos(self):
+        usuario = fabricas.usuario(superusuario=False)
+        usuario.allowed_filiais.add(fabricas.filial())
+
+        self.assertEqual(VencimentoDocumentoService.resumo(user=usuario)['grupos'], [])
+
+    def test_data_referencia_inexistente(self):
+        client = APIClient()
+        client.force_authenticate(fabricas.usuario())
+
+        response = client.get('/api/comum/documentos-vencimento/resumo/', {'data_referencia': '2026-02-30'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('data_referencia', response.json())
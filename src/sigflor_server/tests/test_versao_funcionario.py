@@ -0,0 +1,28 @@
+from django.test import TestCase
+
+from apps.rh.selectors import funcionario_versao
+from . import fabricas
+
+
+class VersaoFuncionarioTests(TestCase):
+
+    def setUp(self):
+        self.usuario = fabricas.usuario()
+        self.funcionario = fabricas.funcionario()
+
+    def _versao(self):
+        return funcionario_versao(user=self.usuario, pk=self.funcionario.pk)
+
+    def test_alteracao_do_cargo_muda_a_versao(self):
+        antes = self._versao()
+        cargo = self.funcionario.cargo
+        cargo.nome = 'Operador de Motosserra'
+        cargo.save()
+        self.assertGreater(self._versao(), antes)
+
+    def test_alteracao_da_empresa_muda_a_versao(self):
+        antes = self._versao()
+        pessoa_juridica = self.funcionario.empresa.pessoa_juridica
+        pessoa_juridica.nome_fantasia = 'Reflorestadora Nova'
+        pessoa_juridica.save()
+        self.assertGreater(self._versao(), antes)